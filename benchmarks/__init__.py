@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks do caminho crítico do driver (execute da raiz do repositório)."""
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Ponto de entrada: ``python3 -m benchmarks``."""
+
+import sys
+
+from .suite import main
+
+sys.exit(main())
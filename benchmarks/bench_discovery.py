@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark da detecção do dispositivo USB.
+
+Compara ``hardware.discover_devices`` (sysfs, em processo) com a detecção
+original via ``lsusb`` (fork/exec). Sem argumentos usa o sysfs real; com
+``--fake`` usa uma árvore falsa com um DeepCool.
+
+Uso:
+    python3 -m benchmarks.bench_discovery [--fake]
+"""
+
+import sys
+import shutil
+import subprocess
+import time
+from typing import Callable, Optional
+
+from src.hardware import discover_devices, USB_DEVICES_ROOT
+
+from .fakesys import make_root, make_usb_tree
+
+
+def legacy_detect_product_id() -> Optional[int]:
+    """Detecção original (v1.4.0) via lsusb, mantida como referência."""
+    result = subprocess.run(['lsusb'], capture_output=True, text=True, timeout=5, check=True)
+    for line in result.stdout.split('\n'):
+        if '3633' in line.lower():
+            try:
+                return int(line.split('ID ')[1].split(' ')[0].split(':')[1], 16)
+            except (IndexError, ValueError):
+                continue
+    return None
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    """Retorna a mediana em milissegundos de ``repeat`` execuções."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os resultados."""
+    usb_root = USB_DEVICES_ROOT
+    if "--fake" in sys.argv:
+        usb_root = make_usb_tree(make_root())
+
+    print(f"Dispositivos: {discover_devices(usb_root=usb_root)}")
+    print(f"sysfs   {timed(lambda: discover_devices(usb_root=usb_root), 200):8.3f} ms")
+    if shutil.which("lsusb"):
+        print(f"lsusb   {timed(legacy_detect_product_id, 20):8.3f} ms")
+    else:
+        print("lsusb   não instalado (a detecção via sysfs não depende dele)")
+
+
+if __name__ == "__main__":
+    main()
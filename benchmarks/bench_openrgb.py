@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark da aplicação de cores LED.
+
+Mede ``colors.set_color``/``set_rainbow`` pelo cliente SDK contra um
+servidor OpenRGB falso e, se o ``openrgb`` estiver instalado, o caminho
+original via CLI (um processo por operação).
+
+Uso:
+    python3 -m benchmarks.bench_openrgb
+"""
+
+import shutil
+import time
+from typing import Callable, List
+
+from src import colors
+from src.openrgb_sdk import OpenRGBClient
+
+from .fake_openrgb import FakeOpenRGBServer
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    """Retorna a mediana em milissegundos de ``repeat`` execuções."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os resultados."""
+    server = FakeOpenRGBServer()
+    port: int = server.start()
+    colors._sdk = OpenRGBClient(port=port)
+    try:
+        start = time.perf_counter()
+        colors.set_color("#00FF00", 0, 0, 30)
+        print(f"SDK primeira cor (conexão + metadados)  {(time.perf_counter() - start) * 1000:8.3f} ms")
+        print(f"SDK set_color (zona)                    "
+              f"{timed(lambda: colors.set_color('#00FF00', 0, 0, 30), 200):8.3f} ms")
+        print(f"SDK set_color (Static)                  "
+              f"{timed(lambda: colors.set_color('#0000FF', 0), 200):8.3f} ms")
+        print(f"SDK set_rainbow                         "
+              f"{timed(lambda: colors.set_rainbow(0, 0, 30), 200):8.3f} ms")
+        print(f"Pacotes recebidos pelo servidor falso: {len(server.packets)}")
+    finally:
+        colors._sdk.close()
+        server.stop()
+
+    if shutil.which("openrgb"):
+        colors._sdk = OpenRGBClient(port=1)  # Força o caminho do CLI
+        print(f"CLI set_color                           "
+              f"{timed(lambda: colors.set_color('#00FF00', 0, 0, 30), 5):8.3f} ms")
+    else:
+        print("CLI     openrgb não instalado (o cliente SDK não depende dele)")
+
+
+if __name__ == "__main__":
+    main()
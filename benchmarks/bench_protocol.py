@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark do codificador de pacotes HID.
+
+Compara ``protocol.build_packet`` (tabela de quadros imutáveis) com o
+codificador original baseado em listas e confere que ambos geram os
+mesmos bytes.
+
+Uso:
+    python3 -m benchmarks.bench_protocol
+"""
+
+import timeit
+import tracemalloc
+
+from src.protocol import (
+    build_packet, decode_packet, get_bar_value,
+    MODE_CELSIUS, MODE_FAHRENHEIT, MODE_PERCENT, MODE_INIT,
+)
+
+
+def legacy_build_packet(value: int = 0, mode: str = "util", alarm: bool = False) -> list:
+    """Codificador original (v1.4.0), mantido como referência."""
+    data = [16] + [0] * 63
+    mode_map = {
+        "temp_c": MODE_CELSIUS,
+        "temp_f": MODE_FAHRENHEIT,
+        "util": MODE_PERCENT,
+        "start": MODE_INIT,
+    }
+    data[1] = mode_map.get(mode, MODE_CELSIUS)
+    if mode == "start":
+        return data
+    clamped_value = max(0, min(999, value))
+    data[2] = get_bar_value(clamped_value)
+    numbers = [int(c) for c in str(clamped_value)]
+    if len(numbers) == 1:
+        data[5] = numbers[0]
+    elif len(numbers) == 2:
+        data[4] = numbers[0]
+        data[5] = numbers[1]
+    elif len(numbers) == 3:
+        data[3] = numbers[0]
+        data[4] = numbers[1]
+        data[5] = numbers[2]
+    if alarm:
+        data[6] = 1
+    return data
+
+
+def check_equivalence() -> int:
+    """
+    Confere todos os quadros contra o codificador original.
+
+    Returns:
+        Número de quadros verificados
+    """
+    count = 0
+    for mode in ("temp_c", "temp_f", "util", "start"):
+        for alarm in (False, True):
+            for value in range(-5, 1005):
+                new = build_packet(value, mode, alarm)
+                assert list(new) == legacy_build_packet(value, mode, alarm), (value, mode, alarm)
+                decoded = decode_packet(new)
+                if mode != "start":
+                    assert decoded.value == max(0, min(999, value))
+                count += 1
+    return count
+
+
+def allocated_bytes(func, calls: int = 10000) -> float:
+    """Bytes alocados por chamada (tracemalloc)."""
+    func()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    keep = [func() for _ in range(calls)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Descontar a lista que guarda os resultados
+    return (after - before - keep.__sizeof__()) / calls
+
+
+def main() -> None:
+    """Executa o microbenchmark e imprime os resultados."""
+    print(f"Quadros equivalentes: {check_equivalence()}")
+
+    number = 200000
+    cases = {
+        "legacy_build_packet": lambda: legacy_build_packet(45, "temp_c", False),
+        "build_packet": lambda: build_packet(45, "temp_c", False),
+        "decode_packet": lambda: decode_packet(build_packet(45, "temp_c", False)),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(
+            f"{name:22s} {best / number * 1e9:8.1f} ns/chamada  "
+            f"{allocated_bytes(func):8.1f} B/chamada"
+        )
+
+
+if __name__ == "__main__":
+    main()
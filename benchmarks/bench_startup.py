@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de inicialização e memória: bandeja (PyQt5) × daemon.
+
+Cada execução roda em um processo novo, com HOME temporário, sysfs falso
+e o dispositivo virtual. Mede o tempo até o primeiro quadro HID, o tempo
+de importação, o RSS após estabilizar, o pico de RSS e os módulos
+carregados.
+
+Uso:
+    python3 -m benchmarks.bench_startup [--runs 5] [--mode daemon]
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import subprocess
+import threading
+from typing import Dict, List
+
+MODES = ("tray", "daemon")
+SETTLE_SECONDS: float = 1.0
+
+
+def read_rss_kb() -> Dict[str, int]:
+    """Lê VmRSS e VmHWM (kB) do próprio processo."""
+    values: Dict[str, int] = {}
+    with open("/proc/self/status", "r") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                key, value = line.split(":", 1)
+                values[key] = int(value.split()[0])
+    return values
+
+
+def child(mode: str) -> None:
+    """Processo medido: inicia o modo pedido e reporta em JSON."""
+    start = time.perf_counter()
+    from src import hardware
+    from src.emulator import default_device
+    from .fakesys import make_root, make_hwmon_tree, make_proc_stat
+
+    root = make_root()
+    sensor = "k10temp"
+    hardware._readers[sensor] = hardware.SensorReader(sensor, make_hwmon_tree(root, sensor))
+    hardware._cpu_sampler = hardware.CpuUsageSampler(make_proc_stat(root))
+
+    device = default_device()
+    first_frame = threading.Event()
+    handle_report = device.handle_report
+
+    def _handle(data: bytes) -> int:
+        written = handle_report(data)
+        first_frame.set()
+        return written
+
+    device.handle_report = _handle
+
+    if mode == "daemon":
+        from src.daemon import DeepCoolDaemon
+        imported = time.perf_counter()
+        app = DeepCoolDaemon([device.info], sensor, transport="virtual")
+        app.start()
+        stop = app.stop
+        first_frame.wait(10)
+    else:
+        from PyQt5.QtWidgets import QApplication
+        from src.tray import DeepCoolTray
+        imported = time.perf_counter()
+        qt_app = QApplication([])
+        tray = DeepCoolTray(qt_app, [device.info], sensor, transport="virtual")
+        tray.start()
+        stop = tray._stop_drivers
+        while not first_frame.wait(0.01):
+            qt_app.processEvents()
+
+    ready = time.perf_counter()
+    print("ready", flush=True)
+    time.sleep(SETTLE_SECONDS)
+    rss = read_rss_kb()
+    stop()
+    print(json.dumps({
+        "import_ms": (imported - start) * 1000,
+        "first_frame_ms": (ready - start) * 1000,
+        "rss_mb": rss.get("VmRSS", 0) / 1024,
+        "peak_rss_mb": rss.get("VmHWM", 0) / 1024,
+        "modules": len(sys.modules),
+        "qt_loaded": "PyQt5" in sys.modules,
+    }), flush=True)
+
+
+def run_once(mode: str) -> Dict[str, float]:
+    """Executa um processo filho e junta as medições."""
+    env = dict(os.environ, HOME=tempfile.mkdtemp(prefix="deepcool-home-"),
+               QT_QPA_PLATFORM="offscreen")
+    spawned = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child", mode],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, env=env,
+    )
+    assert proc.stdout is not None
+    line = proc.stdout.readline()
+    if line.strip() != "ready":
+        proc.kill()
+        raise RuntimeError(f"Modo {mode} não chegou ao primeiro quadro")
+    result = {"startup_ms": (time.perf_counter() - spawned) * 1000}
+    result.update(json.loads(proc.stdout.readline()))
+    proc.wait(10)
+    return result
+
+
+def median(values: List[float]) -> float:
+    """Mediana simples."""
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os resultados."""
+    parser = argparse.ArgumentParser(description="Inicialização: bandeja × daemon")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mode", action="append", choices=MODES)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    print(f"{'modo':8s} {'1º quadro':>10s} {'imports':>9s} {'RSS':>9s} "
+          f"{'pico':>9s} {'módulos':>8s}  Qt")
+    for mode in args.mode or MODES:
+        try:
+            runs = [run_once(mode) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{mode:8s} erro: {e}")
+            continue
+        print(
+            f"{mode:8s} {median([r['startup_ms'] for r in runs]):7.0f} ms "
+            f"{median([r['import_ms'] for r in runs]):6.0f} ms "
+            f"{median([r['rss_mb'] for r in runs]):6.1f} MB "
+            f"{median([r['peak_rss_mb'] for r in runs]):6.1f} MB "
+            f"{runs[0]['modules']:8d}  {'sim' if runs[0]['qt_loaded'] else 'não'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
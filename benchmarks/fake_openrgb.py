@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor SDK do OpenRGB falso, para testes e benchmarks sem hardware.
+
+Simula uma placa-mãe com um header ARGB redimensionável e os modos
+Direct, Static, Rainbow e Spectrum Cycle. Os pacotes recebidos ficam em
+``packets`` (id do pacote, índice do dispositivo, dados).
+"""
+
+import socket
+import struct
+import threading
+from typing import List, Optional, Tuple
+
+from src.openrgb_sdk import (
+    DEVICE_LIST_UPDATED, DEVICE_TYPE_MOTHERBOARD, HEADER, MAGIC, MODE_COLORS_MODE_SPECIFIC, MODE_COLORS_NONE,
+    MODE_COLORS_PER_LED, PROTOCOL_VERSION, REQUEST_CONTROLLER_COUNT, REQUEST_CONTROLLER_DATA,
+    REQUEST_PROTOCOL_VERSION, RESIZE_ZONE, UPDATE_MODE, Mode, encode_mode, pack_colors,
+    pack_string,
+)
+
+ZONE_TYPE_LINEAR: int = 1
+
+
+class FakeOpenRGBServer:
+    """Servidor em thread própria, escutando em 127.0.0.1 (porta livre)."""
+
+    def __init__(self, leds: int = 12):
+        """
+        Inicializa o servidor (sem escutar).
+
+        Args:
+            leds: Tamanho inicial da zona ARGB
+        """
+        self.modes: List[Mode] = [
+            Mode(0, "Direct", value=0xFFFF, color_mode=MODE_COLORS_PER_LED),
+            Mode(1, "Static", value=1, colors_min=1, colors_max=1,
+                 color_mode=MODE_COLORS_MODE_SPECIFIC, colors=[(255, 0, 0)]),
+            Mode(2, "Rainbow", value=2, color_mode=MODE_COLORS_NONE),
+            Mode(3, "Spectrum Cycle", value=3, color_mode=MODE_COLORS_NONE),
+        ]
+        self.active_mode: int = 0
+        self.leds: int = leds
+        self.packets: List[Tuple[int, int, bytes]] = []
+        self.port: int = 0
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._clients: List[socket.socket] = []
+
+    def start(self) -> int:
+        """
+        Começa a aceitar conexões.
+
+        Returns:
+            Porta TCP escolhida
+        """
+        self._sock = socket.create_server(("127.0.0.1", 0))
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        return self.port
+
+    def stop(self) -> None:
+        """Para de aceitar conexões."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def notify_device_list_updated(self) -> None:
+        """Envia DEVICE_LIST_UPDATED a todos os clientes (como após um rescan)."""
+        for conn in list(self._clients):
+            try:
+                conn.sendall(HEADER.pack(MAGIC, 0, DEVICE_LIST_UPDATED, 0))
+            except OSError:
+                pass
+
+    def controller_data(self, version: int) -> bytes:
+        """Dados do controlador no formato de REQUEST_CONTROLLER_DATA."""
+        parts: List[bytes] = [
+            struct.pack("<i", DEVICE_TYPE_MOTHERBOARD),
+            pack_string("Fake B550 Motherboard"),
+        ]
+        if version >= 1:
+            parts.append(pack_string("Fake"))
+        parts += [pack_string(text) for text in ("ARGB header", "1.0", "", "I2C: /dev/i2c-0")]
+        parts.append(struct.pack("<Hi", len(self.modes), self.active_mode))
+        parts += [encode_mode(mode, version) for mode in self.modes]
+        parts.append(struct.pack("<H", 1))
+        parts.append(pack_string("JRAINBOW1"))
+        parts.append(struct.pack("<iIIIH", ZONE_TYPE_LINEAR, 0, 120, self.leds, 0))
+        parts.append(struct.pack("<H", self.leds))
+        parts += [pack_string(f"LED {i + 1}") + struct.pack("<I", i) for i in range(self.leds)]
+        parts.append(pack_colors([(0, 0, 0)] * self.leds))
+        body: bytes = b"".join(parts)
+        return struct.pack("<I", 4 + len(body)) + body
+
+    def _serve(self) -> None:
+        """Aceita conexões até ``stop``."""
+        while self._sock is not None:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket) -> None:
+        """Atende um cliente."""
+        version: int = 0
+        reader = conn.makefile("rb")
+        self._clients.append(conn)
+        with conn, reader:
+            while True:
+                header: bytes = reader.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    return
+                magic, device, packet_id, size = HEADER.unpack(header)
+                if magic != MAGIC:
+                    return
+                data: bytes = reader.read(size)
+                self.packets.append((packet_id, device, data))
+
+                reply: Optional[bytes] = None
+                if packet_id == REQUEST_PROTOCOL_VERSION:
+                    version = min(struct.unpack("<I", data)[0], PROTOCOL_VERSION)
+                    reply = struct.pack("<I", version)
+                elif packet_id == REQUEST_CONTROLLER_COUNT:
+                    reply = struct.pack("<I", 1)
+                elif packet_id == REQUEST_CONTROLLER_DATA:
+                    reply = self.controller_data(version)
+                elif packet_id == RESIZE_ZONE:
+                    self.leds = struct.unpack("<ii", data)[1]
+                elif packet_id == UPDATE_MODE:
+                    self.active_mode = struct.unpack_from("<i", data, 4)[0]
+                if reply is not None:
+                    conn.sendall(HEADER.pack(MAGIC, device, packet_id, len(reply)) + reply)
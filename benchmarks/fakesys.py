@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Árvores falsas de sysfs/procfs para benchmarks sem hardware."""
+
+import os
+import tempfile
+from typing import Tuple
+
+
+def make_usb_tree(root: str, product_id: int = 0x0004, vendor_id: int = 0x3633,
+                  hidraw: str = "hidraw3", others: int = 12) -> str:
+    """
+    Cria um /sys/bus/usb/devices falso com um DeepCool e outros dispositivos.
+
+    Args:
+        root: Diretório base
+        product_id: Product ID do DeepCool
+        vendor_id: Vendor ID do DeepCool
+        hidraw: Nome do nó hidraw do DeepCool
+        others: Quantidade de dispositivos de outros fabricantes
+
+    Returns:
+        Caminho do diretório de dispositivos USB
+    """
+    usb_root = os.path.join(root, "usb", "devices")
+    os.makedirs(usb_root, exist_ok=True)
+
+    def _device(name: str, vid: int, pid: int, node: str = "") -> None:
+        dev = os.path.join(usb_root, name)
+        intf = os.path.join(dev, f"{name}:1.0")
+        os.makedirs(intf, exist_ok=True)
+        for attr, value in (("idVendor", f"{vid:04x}"), ("idProduct", f"{pid:04x}")):
+            with open(os.path.join(dev, attr), "w") as f:
+                f.write(value + "\n")
+        with open(os.path.join(intf, "bInterfaceNumber"), "w") as f:
+            f.write("00\n")
+        if node:
+            os.makedirs(os.path.join(intf, f"0003:{vid:04X}:{pid:04X}.0001", "hidraw", node))
+
+    for i in range(others):
+        _device(f"1-{i + 1}", 0x046D, 0xC000 + i)
+    _device(f"3-{others + 1}", vendor_id, product_id, hidraw)
+    return usb_root
+
+
+def make_hwmon_tree(root: str, sensor: str = "k10temp", millidegrees: int = 45125,
+                    others: int = 6) -> str:
+    """
+    Cria um /sys/class/hwmon falso.
+
+    Args:
+        root: Diretório base
+        sensor: Nome do chip da CPU
+        millidegrees: Valor inicial do temp1_input
+        others: Quantidade de chips extras (NVMe, NIC...)
+
+    Returns:
+        Caminho da raiz hwmon
+    """
+    hwmon_root = os.path.join(root, "hwmon")
+    for i in range(others + 1):
+        chip = os.path.join(hwmon_root, f"hwmon{i}")
+        os.makedirs(chip, exist_ok=True)
+        name = sensor if i == others else f"nvme{i}"
+        with open(os.path.join(chip, "name"), "w") as f:
+            f.write(name + "\n")
+        for n in (1, 2, 3):
+            with open(os.path.join(chip, f"temp{n}_input"), "w") as f:
+                f.write(f"{millidegrees + n}\n")
+    return hwmon_root
+
+
+def make_proc_stat(root: str, cores: int = 16) -> str:
+    """
+    Cria um /proc/stat falso.
+
+    Args:
+        root: Diretório base
+        cores: Quantidade de núcleos
+
+    Returns:
+        Caminho do arquivo
+    """
+    path = os.path.join(root, "stat")
+    lines = ["cpu  %d 0 %d %d 0 0 0 0 0 0" % (100 * cores, 50 * cores, 1000 * cores)]
+    lines += ["cpu%d 100 0 50 1000 0 0 0 0 0 0" % i for i in range(cores)]
+    lines += ["intr " + " ".join(["0"] * 512), "ctxt 1000", "btime 0"]
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+def make_dev_dir(root: str, nodes: Tuple[str, ...] = ()) -> str:
+    """
+    Cria um /dev falso para o backend inotify do monitor de hotplug.
+
+    Args:
+        root: Diretório base
+        nodes: Nós (ex: "hidraw3") criados de início
+
+    Returns:
+        Caminho do diretório de dispositivos
+    """
+    dev_dir = os.path.join(root, "dev")
+    os.makedirs(dev_dir, exist_ok=True)
+    for node in nodes:
+        open(os.path.join(dev_dir, node), "w").close()
+    return dev_dir
+
+
+def make_root() -> str:
+    """Cria um diretório temporário para as árvores falsas."""
+    return tempfile.mkdtemp(prefix="deepcool-bench-")
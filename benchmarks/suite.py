@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+Suíte de benchmarks do caminho crítico do driver.
+
+Mede ``build_packet``, ``get_temperature``, ``get_cpu_usage``,
+``format_temperature``, ``render_metrics`` e um ciclo completo do
+``DeepCoolDriver`` contra um sysfs/procfs falso e o dispositivo virtual.
+Para cada caso reporta percentis de latência por chamada e memória
+alocada por chamada (tracemalloc), e pode salvar/comparar baselines em JSON.
+
+Uso:
+    python3 -m benchmarks                       # executa e imprime
+    python3 -m benchmarks --save                # grava a baseline
+    python3 -m benchmarks --compare             # compara com a baseline
+    python3 -m benchmarks --compare --threshold 0.5 --only driver_tick
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+from array import array
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+from .fakesys import make_root, make_hwmon_tree, make_proc_stat
+
+BASELINE_FILE: str = os.path.join(os.path.dirname(__file__), "baselines", "baseline.json")
+DEFAULT_THRESHOLD: float = 0.25
+# Memória retida por chamada tolerada acima da baseline (ruído de medição)
+RETAINED_TOLERANCE: float = 1.0
+
+
+@dataclass
+class BenchCase:
+    """
+    Caso de benchmark.
+
+    Attributes:
+        name: Nome estável (chave na baseline)
+        func: Função medida
+        batch: Chamadas por amostra (funções de ns são medidas em lote)
+    """
+    name: str
+    func: Callable[[], object]
+    batch: int = 1
+
+
+@dataclass
+class BenchResult:
+    """Resultado de um caso (tempos em nanossegundos por chamada)."""
+    name: str
+    calls: int
+    mean_ns: float
+    p50_ns: float
+    p90_ns: float
+    p99_ns: float
+    max_ns: float
+    alloc_peak_bytes: float
+    alloc_retained_bytes: float
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """
+    Percentil por vizinho mais próximo.
+
+    Args:
+        sorted_samples: Amostras ordenadas
+        pct: Percentil (0-100)
+
+    Returns:
+        Valor do percentil
+    """
+    index: int = min(len(sorted_samples) - 1, round(pct / 100 * (len(sorted_samples) - 1)))
+    return sorted_samples[index]
+
+
+def measure_time(case: BenchCase, samples: int) -> List[float]:
+    """
+    Mede ``samples`` amostras de ``case.batch`` chamadas cada.
+
+    Returns:
+        Nanossegundos por chamada de cada amostra (ordenados)
+    """
+    func, batch = case.func, case.batch
+    for _ in range(max(10, samples // 10)):
+        func()
+    timings: List[float] = []
+    clock = time.perf_counter_ns
+    for _ in range(samples):
+        start = clock()
+        for _ in range(batch):
+            func()
+        timings.append((clock() - start) / batch)
+    timings.sort()
+    return timings
+
+
+def measure_alloc(case: BenchCase, calls: int = 200) -> tuple:
+    """
+    Mede a memória alocada por chamada com tracemalloc.
+
+    Returns:
+        Tupla (pico transitório mediano, memória retida média) em bytes
+    """
+    func = case.func
+    tracemalloc.start()
+    try:
+        # Aquecer já rastreando: estado substituído a cada chamada (ex:
+        # contadores anteriores) então é liberado e não conta como retido
+        for _ in range(calls):
+            func()
+        # Lista pré-alocada para não contar o próprio crescimento
+        peaks = array("q", bytes(8 * calls))
+        start_current, _ = tracemalloc.get_traced_memory()
+        for i in range(calls):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks[i] = peak - before
+        del before, peak, _  # Inteiros vivos não são memória do caso
+        end_current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    ordered: List[int] = sorted(peaks)
+    return ordered[len(ordered) // 2], (end_current - start_current) / calls
+
+
+def run_case(case: BenchCase, samples: int) -> BenchResult:
+    """Executa um caso e agrega as medições."""
+    timings: List[float] = measure_time(case, samples)
+    peak, retained = measure_alloc(case)
+    return BenchResult(
+        name=case.name,
+        calls=samples * case.batch,
+        mean_ns=sum(timings) / len(timings),
+        p50_ns=percentile(timings, 50),
+        p90_ns=percentile(timings, 90),
+        p99_ns=percentile(timings, 99),
+        max_ns=timings[-1],
+        alloc_peak_bytes=peak,
+        alloc_retained_bytes=retained,
+    )
+
+
+def build_cases() -> List[BenchCase]:
+    """
+    Monta os casos sobre árvores falsas (sem tocar no hardware real).
+
+    Returns:
+        Casos na ordem de execução
+    """
+    from src import hardware
+    from src.protocol import build_packet
+    from src.utils import format_temperature
+    from src.sampler import Sampler
+    from src.driver import DeepCoolDriver, DriverSignals
+    from src.emulator import VirtualDeepCoolDevice, VirtualTransport
+    from src.metrics import render_metrics
+
+    root: str = make_root()
+    sensor: str = "k10temp"
+    hardware._readers[sensor] = hardware.SensorReader(sensor, make_hwmon_tree(root, sensor))
+    hardware._cpu_sampler = hardware.CpuUsageSampler(make_proc_stat(root))
+
+    # Sem histórico: o deque cheio distorceria a memória retida
+    device = VirtualDeepCoolDevice(product_id=0x0004, history=0)
+    sampler = Sampler(sensor)
+    driver = DeepCoolDriver(
+        DriverSignals(), device.product_id, sensor,
+        device_info=device.info, sampler=sampler,
+        transport=VirtualTransport(device),
+    )
+    driver._ensure_hotplug = lambda: None  # Sem monitor de hotplug real
+    if driver.step() is not None:
+        raise RuntimeError("Não foi possível conectar ao dispositivo virtual")
+
+    def driver_tick() -> None:
+        # Forçar uma amostra nova: mede sensores + quadro + escrita
+        sampler._last = None
+        driver.step()
+        driver.advance_page()
+
+    return [
+        BenchCase("build_packet", lambda: build_packet(45, "temp_c", False), batch=200),
+        BenchCase("format_temperature", lambda: format_temperature(45.2, "F"), batch=200),
+        BenchCase("get_temperature", lambda: hardware.get_temperature(sensor)),
+        BenchCase("get_cpu_usage", hardware.get_cpu_usage),
+        BenchCase("driver_tick", driver_tick),
+        # Uma coleta do endpoint de métricas (sem HTTP): não lê sensores
+        BenchCase("render_metrics", lambda: render_metrics(
+            [device.info], ["AK500S Digital"], [True], [driver], sampler,
+        )),
+    ]
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    """Lê uma baseline salva (vazia se não existir)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: str, results: List[BenchResult]) -> None:
+    """Grava os resultados como baseline."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def compare(results: List[BenchResult], baseline: dict, threshold: float) -> List[str]:
+    """
+    Compara resultados com a baseline.
+
+    Uma regressão é um p50 acima de ``(1 + threshold)`` vezes a baseline
+    ou memória retida por chamada acima da baseline (vazamento).
+
+    Returns:
+        Descrição das regressões encontradas
+    """
+    regressions: List[str] = []
+    saved: Dict[str, dict] = baseline.get("results", {})
+    for result in results:
+        base: Optional[dict] = saved.get(result.name)
+        if base is None:
+            continue
+        ratio: float = result.p50_ns / base["p50_ns"] if base["p50_ns"] else 1.0
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{result.name}: p50 {result.p50_ns:.0f} ns vs {base['p50_ns']:.0f} ns "
+                f"(+{(ratio - 1) * 100:.0f}%)"
+            )
+        if result.alloc_retained_bytes > base["alloc_retained_bytes"] + RETAINED_TOLERANCE:
+            regressions.append(
+                f"{result.name}: retém {result.alloc_retained_bytes:.1f} B/chamada "
+                f"vs {base['alloc_retained_bytes']:.1f} B"
+            )
+    return regressions
+
+
+def format_ns(value: float) -> str:
+    """Formata nanossegundos com a unidade mais legível."""
+    if value >= 1e6:
+        return f"{value / 1e6:7.2f} ms"
+    if value >= 1e3:
+        return f"{value / 1e3:7.2f} µs"
+    return f"{value:7.1f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Executa a suíte; retorna 1 se houver regressões."""
+    parser = argparse.ArgumentParser(description="Benchmarks do DeepCool Digital")
+    parser.add_argument("--samples", type=int, default=2000, help="Amostras por caso")
+    parser.add_argument("--only", action="append", help="Executar apenas este caso")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Arquivo da baseline")
+    parser.add_argument("--save", action="store_true", help="Gravar a baseline")
+    parser.add_argument("--compare", action="store_true", help="Comparar com a baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Aumento relativo do p50 considerado regressão")
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+    args = parser.parse_args(argv)
+
+    cases: List[BenchCase] = [
+        c for c in build_cases() if not args.only or c.name in args.only
+    ]
+    results: List[BenchResult] = [run_case(c, args.samples) for c in cases]
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print(f"{'caso':20s} {'p50':>10s} {'p90':>10s} {'p99':>10s} {'max':>10s} "
+              f"{'pico B':>8s} {'retido B':>9s}")
+        for r in results:
+            print(f"{r.name:20s} {format_ns(r.p50_ns)} {format_ns(r.p90_ns)} "
+                  f"{format_ns(r.p99_ns)} {format_ns(r.max_ns)} "
+                  f"{r.alloc_peak_bytes:8.0f} {r.alloc_retained_bytes:9.1f}")
+
+    status: int = 0
+    if args.compare:
+        baseline = load_baseline(args.baseline)
+        if not baseline:
+            print(f"Baseline não encontrada: {args.baseline}", file=sys.stderr)
+        else:
+            machine = baseline.get("machine", {})
+            if machine.get("platform") != platform.platform():
+                print(f"Aviso: baseline gerada em {machine.get('platform')}", file=sys.stderr)
+            regressions = compare(results, baseline, args.threshold)
+            for line in regressions:
+                print(f"REGRESSÃO {line}", file=sys.stderr)
+            if regressions:
+                status = 1
+            else:
+                print(f"Sem regressões (limite +{args.threshold * 100:.0f}%)")
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Baseline gravada em {args.baseline}")
+    return status
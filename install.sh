@@ -188,11 +188,18 @@ ok "Hardware: $DEVICE_INFO"
 echo -e "\n${B}═══ ETAPA 4: Configurando Permissões USB ═══${N}\n"
 ##############################################################################
 
+# uaccess só vale para a sessão ativa (desktop); o grupo deepcool dá
+# acesso ao serviço do modo daemon rodando sem ninguém logado
+if ! getent group deepcool > /dev/null; then
+    info "Criando grupo deepcool..."
+    sudo groupadd -r deepcool
+fi
+
 info "Criando regras udev..."
 sudo tee /etc/udev/rules.d/99-deepcool.rules > /dev/null << EOF
 # DeepCool Digital - Permissões HID
-SUBSYSTEM=="hidraw", ATTRS{idVendor}=="3633", TAG+="uaccess"
-SUBSYSTEM=="usb", ATTRS{idVendor}=="3633", TAG+="uaccess"
+SUBSYSTEM=="hidraw", ATTRS{idVendor}=="3633", TAG+="uaccess", GROUP="deepcool", MODE="0660"
+SUBSYSTEM=="usb", ATTRS{idVendor}=="3633", TAG+="uaccess", GROUP="deepcool", MODE="0660"
 EOF
 
 sudo udevadm control --reload-rules
@@ -4,25 +4,82 @@
 DeepCool Digital - System Tray App
 Para Regata OS / openSUSE (KDE Plasma)
 
+Com ``--daemon`` roda sem interface gráfica (o PyQt5 não é importado).
+
 https://github.com/marquimRcc/deepcool-ak620-digital-linux-regataos-opensuse
 """
 
+from src.startup import StartupProfiler  # Primeiro: marca o fim do interpretador
+
 import sys
 import fcntl
 import logging
+import logging.handlers
+import argparse
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import List, Optional, TextIO, Tuple
 
-from PyQt5.QtWidgets import QApplication, QMessageBox
-
-from src.config import APP_DISPLAY_NAME, LOCK_FILE, LOG_FILE
+from src.config import (
+    APP_DISPLAY_NAME, LOCK_FILE, LOG_FILE, LOG_BACKUP_COUNT, LOG_MAX_BYTES,
+    ENGINE_ASYNCIO, ENGINE_THREAD,
+)
 from src.i18n import tr
-from src.hardware import detect_product_id, detect_model, detect_sensor
-from src.tray import DeepCoolTray
+from src.hardware import DeviceInfo, detect_devices, detect_model, detect_sensor
+from src.transport import TRANSPORT_AUTO, TRANSPORT_VIRTUAL, available_transports
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Lê as opções de linha de comando (argumentos do Qt são preservados).
+
+    Args:
+        argv: Argumentos sem o nome do programa
+
+    Returns:
+        Opções reconhecidas
+    """
+    parser = argparse.ArgumentParser(description=APP_DISPLAY_NAME)
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help="Roda sem bandeja nem PyQt5 (servidores, serviço systemd)",
+    )
+    parser.add_argument(
+        '--engine',
+        choices=(ENGINE_THREAD, ENGINE_ASYNCIO),
+        default=ENGINE_THREAD,
+        help="Motor do driver: uma thread por driver ou loop asyncio único",
+    )
+    parser.add_argument(
+        '--transport',
+        choices=available_transports(),
+        default=TRANSPORT_AUTO,
+        help="Backend HID: escrita direta em /dev/hidrawN, hidapi, automático "
+             "ou dispositivo virtual (sem hardware)",
+    )
+    parser.add_argument(
+        '--write-timeout',
+        type=float,
+        default=None,
+        metavar='SEGUNDOS',
+        help="Tempo máximo de escrita no dispositivo (apenas hidraw)",
+    )
+    parser.add_argument(
+        '--metrics',
+        metavar='ENDEREÇO',
+        help="Serve métricas OpenMetrics em PORTA, HOST:PORTA ou socket Unix (/caminho)",
+    )
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help="Imprime o tempo de cada fase da inicialização até o primeiro quadro HID",
+    )
+    args, _ = parser.parse_known_args(argv)
+    return args
 
 
 def setup_logging() -> None:
-    """Configura o sistema de logging."""
+    """Configura o sistema de logging (arquivo rotacionado por tamanho)."""
     log_dir: Path = Path(LOG_FILE).parent
     log_dir.mkdir(parents=True, exist_ok=True)
     
@@ -30,7 +87,9 @@ def setup_logging() -> None:
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(LOG_FILE),
+            logging.handlers.RotatingFileHandler(
+                LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+            ),
             logging.StreamHandler()
         ]
     )
@@ -72,8 +131,122 @@ def release_lock(lock_file: Optional[TextIO]) -> None:
             logger.warning(f"Erro ao liberar lock: {e}")
 
 
+def detect_hardware(args: argparse.Namespace) -> Tuple[List[DeviceInfo], str]:
+    """
+    Detecta os dispositivos DeepCool e o sensor de temperatura.
+
+    Args:
+        args: Opções de linha de comando
+
+    Returns:
+        Tupla (dispositivos, sensor)
+
+    Raises:
+        RuntimeError: Se nenhum dispositivo for encontrado
+    """
+    logger = logging.getLogger(__name__)
+    logger.info("Detectando hardware...")
+    if args.transport == TRANSPORT_VIRTUAL:
+        from src.emulator import default_device
+        devices: List[DeviceInfo] = [default_device().info]
+    else:
+        devices = detect_devices()
+    sensor: str = detect_sensor()
+
+    for info in devices:
+        logger.info(
+            f"Hardware detectado: {detect_model(info.product_id)} "
+            f"(0x{info.product_id:04x})"
+        )
+    logger.info(f"Sensor de temperatura: {sensor}")
+    return devices, sensor
+
+
+def run_daemon(args: argparse.Namespace, profiler: StartupProfiler) -> int:
+    """
+    Executa o modo daemon (sem Qt).
+
+    Args:
+        args: Opções de linha de comando
+        profiler: Perfil de inicialização
+
+    Returns:
+        Código de saída
+    """
+    from src.daemon import DeepCoolDaemon
+    profiler.mark("imports do daemon")
+
+    devices, sensor = detect_hardware(args)
+    profiler.mark("detecção de hardware")
+    daemon = DeepCoolDaemon(
+        devices, sensor, engine=args.engine,
+        transport=args.transport, write_timeout=args.write_timeout,
+        profiler=profiler, metrics=args.metrics,
+    )
+    profiler.watch_first_frame(daemon.drivers[0].first_frame)
+    logging.getLogger(__name__).info("Aplicação iniciada com sucesso (daemon)")
+    return daemon.run()
+
+
+def run_tray(args: argparse.Namespace, profiler: StartupProfiler) -> int:
+    """
+    Executa a interface system tray.
+
+    Args:
+        args: Opções de linha de comando
+        profiler: Perfil de inicialização
+
+    Returns:
+        Código de saída do loop do Qt
+    """
+    from PyQt5.QtWidgets import QApplication
+    from src.tray import DeepCoolTray
+    profiler.mark("imports do Qt")
+
+    # Qt App
+    app: QApplication = QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+    app.setApplicationName(APP_DISPLAY_NAME)
+    profiler.mark("QApplication")
+
+    devices, sensor = detect_hardware(args)
+    profiler.mark("detecção de hardware")
+
+    # Tray
+    tray: DeepCoolTray = DeepCoolTray(
+        app, devices, sensor, engine=args.engine,
+        transport=args.transport, write_timeout=args.write_timeout,
+        profiler=profiler, metrics=args.metrics,
+    )
+    profiler.watch_first_frame(tray.drivers[0].first_frame)
+    tray.start()
+
+    logging.getLogger(__name__).info("Aplicação iniciada com sucesso")
+    return app.exec_()
+
+
+def show_error(title: str, message: str, gui: bool) -> None:
+    """
+    Mostra um erro fatal em diálogo (apenas no modo bandeja).
+
+    Args:
+        title: Título da janela
+        message: Mensagem de erro
+        gui: False no modo daemon (só o log é usado)
+    """
+    if not gui:
+        return
+    try:
+        from PyQt5.QtWidgets import QMessageBox
+        QMessageBox.critical(None, title, message)
+    except Exception:
+        pass  # Sem PyQt5/QApplication: a mensagem já está no log
+
+
 def main() -> None:
     """Função principal da aplicação."""
+    args: argparse.Namespace = parse_args(sys.argv[1:])
+    profiler: StartupProfiler = StartupProfiler(args.profile_startup)
     setup_logging()
     logger = logging.getLogger(__name__)
     
@@ -85,27 +258,12 @@ def main() -> None:
     try:
         # Prevenir múltiplas instâncias
         lock_file = acquire_lock()
+        profiler.mark("lock")
         
-        # Qt App
-        app: QApplication = QApplication(sys.argv)
-        app.setQuitOnLastWindowClosed(False)
-        app.setApplicationName(APP_DISPLAY_NAME)
-        
-        # Detectar hardware
-        logger.info("Detectando hardware...")
-        product_id: int = detect_product_id()
-        model: str = detect_model(product_id)
-        sensor: str = detect_sensor()
-        
-        logger.info(f"Hardware detectado: {model} (0x{product_id:04x})")
-        logger.info(f"Sensor de temperatura: {sensor}")
-        
-        # Tray
-        tray: DeepCoolTray = DeepCoolTray(app, product_id, model, sensor)
-        tray.start()
-        
-        logger.info("Aplicação iniciada com sucesso")
-        exit_code = app.exec_()
+        if args.daemon:
+            exit_code = run_daemon(args, profiler)
+        else:
+            exit_code = run_tray(args, profiler)
         
     except RuntimeError as e:
         # Erros esperados (já logados, instância duplicada, etc.)
@@ -119,13 +277,13 @@ def main() -> None:
             "Verifique se todas as dependências estão instaladas."
         )
         logger.critical(error_msg)
-        QMessageBox.critical(None, "Erro de Dependências", error_msg)
+        show_error("Erro de Dependências", error_msg, not args.daemon)
         exit_code = 2
         
     except Exception as e:
         error_msg = f"Erro inesperado ao iniciar aplicação: {e}"
         logger.critical(error_msg, exc_info=True)
-        QMessageBox.critical(None, "Erro Fatal", error_msg)
+        show_error("Erro Fatal", error_msg, not args.daemon)
         exit_code = 3
         
     finally:
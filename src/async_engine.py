@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Motor asyncio do driver - alternativa à thread por driver.
+
+Todos os drivers e esperas de reconexão rodam como tarefas cooperativas
+em um único loop asyncio, executado em uma thread dedicada ao lado do
+loop do Qt (as cores LED ficam com o ``LedWorker``). Os ``QtDriverSignals`` emitidos a partir
+dessa thread chegam à GUI pela conexão enfileirada do Qt, como no motor
+baseado em threads; no daemon, os callbacks rodam na própria thread do loop.
+"""
+
+import asyncio
+import threading
+import logging
+from typing import List, Optional
+
+from .config import RECONNECT_POLL, ENGINE_ASYNCIO, ENGINE_THREAD  # noqa: F401
+from .driver import DeepCoolDriver, WAIT_HOTPLUG
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDriverEngine:
+    """Executa vários ``DeepCoolDriver`` como tarefas em um loop asyncio."""
+
+    def __init__(self, drivers: List[DeepCoolDriver]):
+        """
+        Inicializa o motor (o loop só é criado em ``start()``).
+
+        Args:
+            drivers: Drivers a executar (não devem ser iniciados como thread)
+        """
+        self.drivers: List[DeepCoolDriver] = list(drivers)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._ready: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Cria a thread do loop e inicia as tarefas dos drivers."""
+        self._thread = threading.Thread(
+            target=self._thread_main, name="deepcool-asyncio", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        logger.info(f"Motor asyncio iniciado com {len(self.drivers)} driver(s)")
+
+    def _thread_main(self) -> None:
+        """Corpo da thread do loop."""
+        try:
+            asyncio.run(self._main())
+        except Exception as e:
+            logger.error(f"Erro inesperado no motor asyncio: {e}", exc_info=True)
+        finally:
+            self._ready.set()
+        logger.info("Motor asyncio encerrado")
+
+    async def _main(self) -> None:
+        """Cria as tarefas dos drivers e espera o pedido de parada."""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(self._drive(driver)) for driver in self.drivers
+        ]
+        self._ready.set()
+
+        await self._stop_event.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for driver in self.drivers:
+            driver._disconnect()
+            driver._close_hotplug()
+            # O loop vai fechar: plug/unplug não podem mais acordá-lo
+            driver._listen_virtual(False)
+
+    async def _drive(self, driver: DeepCoolDriver) -> None:
+        """
+        Loop cooperativo de um driver (equivalente a ``DeepCoolDriver.run``).
+
+        Args:
+            driver: Driver a executar
+        """
+        loop = asyncio.get_running_loop()
+        wake: asyncio.Event = asyncio.Event()
+
+        def _wake() -> None:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass  # Loop já encerrado (wake() tardio de outra thread)
+
+        driver.add_wake_callback(_wake)
+        driver._listen_virtual(True)
+        try:
+            await self._drive_loop(driver, wake)
+        finally:
+            driver.remove_wake_callback(_wake)
+
+    async def _drive_loop(self, driver: DeepCoolDriver, wake: asyncio.Event) -> None:
+        """
+        Corpo de ``_drive``: passos do driver e esperas.
+
+        Args:
+            driver: Driver a executar
+            wake: Evento acordado por ``driver.wake()``
+        """
+        while driver.running:
+            delay: Optional[float] = driver.step()
+            if delay == WAIT_HOTPLUG:
+                await self._wait_hotplug(driver, wake)
+                continue
+            if delay is not None:
+                await self._wait(wake, delay)
+                continue
+
+            woke: bool = await self._wait(wake, driver.scheduler.timeout())
+            if not driver.scheduler.complete_wait(woke):
+                driver.advance_page()
+
+    @staticmethod
+    async def _wait_hotplug(driver: DeepCoolDriver, wake: asyncio.Event) -> None:
+        """
+        Espera um evento hidraw com o descritor do monitor no próprio loop.
+
+        Args:
+            driver: Driver aguardando o dispositivo
+            wake: Evento de despertar do driver
+        """
+        monitor = driver.hotplug
+        if monitor is None:
+            await AsyncDriverEngine._wait(wake, RECONNECT_POLL)
+            return
+
+        loop = asyncio.get_running_loop()
+        plugged: asyncio.Future = loop.create_future()
+        failed: List[bool] = []
+
+        def _on_readable() -> None:
+            try:
+                relevant: bool = monitor.drain()
+            except OSError as e:
+                logger.warning(f"Falha no monitor de hotplug, usando polling: {e}")
+                failed.append(True)
+                relevant = True
+            if relevant and not plugged.done():
+                plugged.set_result(True)
+
+        loop.add_reader(monitor.fileno(), _on_readable)
+        woken = asyncio.ensure_future(wake.wait())
+        try:
+            await asyncio.wait({plugged, woken}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            loop.remove_reader(monitor.fileno())
+            woken.cancel()
+            plugged.cancel()
+        wake.clear()
+        if failed:
+            driver._close_hotplug()
+            await AsyncDriverEngine._wait(wake, RECONNECT_POLL)
+
+    @staticmethod
+    async def _wait(wake: asyncio.Event, timeout: float) -> bool:
+        """
+        Espera o evento ou o tempo limite.
+
+        Args:
+            wake: Evento de despertar do driver
+            timeout: Tempo máximo em segundos
+
+        Returns:
+            True se acordado pelo evento
+        """
+        try:
+            await asyncio.wait_for(wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        wake.clear()
+        return True
+
+    def stop(self, timeout: float = 2) -> None:
+        """
+        Para todos os drivers e encerra o loop.
+
+        Args:
+            timeout: Tempo máximo de espera pela thread do loop
+        """
+        logger.info("Parando motor asyncio...")
+        for driver in self.drivers:
+            driver.running = False
+        if self._loop is not None and self._stop_event is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                pass  # Loop já encerrado
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -3,16 +3,36 @@
 Controle de cores da borda LED ARGB via OpenRGB.
 
 As fitas LED ARGB do display do cooler DeepCool são conectadas ao
-header ARGB 3-pin da placa-mãe e controladas pelo OpenRGB CLI.
+header ARGB 3-pin da placa-mãe e controladas pelo OpenRGB.
+
+Com o servidor SDK do OpenRGB em execução (``openrgb --server``), as
+cores são enviadas por uma conexão TCP persistente (``openrgb_sdk.py``);
+sem servidor, cada operação executa o OpenRGB CLI.
 
 Requer: OpenRGB instalado no sistema (openrgb)
 """
 
+import os
+import signal
 import subprocess
 import shutil
 import re
+import time
 import logging
-from typing import List, Dict, Optional, Tuple
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Dict, Optional, Tuple
+
+from .config import OPENRGB_DISCOVERY_TTL
+from .metrics import OPENRGB_SECONDS
+from .openrgb_sdk import (
+    DEVICE_TYPE_MOTHERBOARD, MODE_COLORS_MODE_SPECIFIC, Controller, OpenRGBClient,
+    OpenRGBError,
+)
+
+if TYPE_CHECKING:
+    from .settings import SettingsManager
 
 logger = logging.getLogger(__name__)
 
@@ -36,19 +56,238 @@ COLOR_RAINBOW: str = "__rainbow__"
 COLOR_OFF: str = "__off__"
 COLOR_DEFAULT: str = "#FF0000"
 
+# Modos animados usados para o arco-íris, em ordem de preferência
+RAINBOW_MODES: Tuple[str, ...] = (
+    "Spectrum Cycle", "Rainbow", "Rainbow Wave", "Color Cycle", "Breathing",
+)
+
+
+def pick_rainbow_mode(modes: List[str]) -> Optional[str]:
+    """
+    Escolhe o modo arco-íris entre os suportados por um dispositivo.
+
+    Args:
+        modes: Nomes dos modos do dispositivo
+
+    Returns:
+        Nome do modo (como o dispositivo o escreve) ou None se nenhum
+        de ``RAINBOW_MODES`` for suportado
+    """
+    by_name: Dict[str, str] = {mode.lower(): mode for mode in modes}
+    for preferred in RAINBOW_MODES:
+        if preferred.lower() in by_name:
+            return by_name[preferred.lower()]
+    return None
+
+
+# Intervalo de verificação do cancelamento durante o OpenRGB CLI (segundos)
+CANCEL_POLL: float = 0.05
+
+
+# ──────────────────────────────────────────────────────────────
+# Cancelamento
+# ──────────────────────────────────────────────────────────────
+class CancelToken:
+    """Cancelamento e prazo das chamadas ao OpenRGB de uma operação."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Inicializa o token.
+
+        Args:
+            timeout: Prazo da operação em segundos (None = sem prazo)
+        """
+        self._event: threading.Event = threading.Event()
+        self.deadline: Optional[float] = (
+            None if timeout is None else time.monotonic() + timeout
+        )
+
+    def cancel(self) -> None:
+        """Cancela a operação (o processo do CLI em andamento é encerrado)."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True se ``cancel`` foi chamado."""
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """True se cancelado ou se o prazo passou."""
+        return self.cancelled or (
+            self.deadline is not None and time.monotonic() >= self.deadline
+        )
+
+
+_scope: threading.local = threading.local()
+
+
+@contextmanager
+def cancel_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """
+    Associa um token às chamadas ao OpenRGB feitas nesta thread.
+
+    Args:
+        token: Token verificado pelas chamadas dentro do bloco
+
+    Yields:
+        O próprio token
+    """
+    previous: Optional[CancelToken] = getattr(_scope, "token", None)
+    _scope.token = token
+    try:
+        yield token
+    finally:
+        _scope.token = previous
+
+
+def _expired() -> bool:
+    """True se a operação atual desta thread foi cancelada ou expirou."""
+    token: Optional[CancelToken] = getattr(_scope, "token", None)
+    return token is not None and token.expired
+
 
 # ──────────────────────────────────────────────────────────────
 # Detecção do OpenRGB
 # ──────────────────────────────────────────────────────────────
 def is_openrgb_available() -> bool:
-    """Verifica se o OpenRGB está instalado no sistema."""
-    return shutil.which("openrgb") is not None
+    """Verifica se o OpenRGB está instalado ou com o servidor SDK ativo."""
+    return shutil.which("openrgb") is not None or _sdk_client() is not None
+
+
+# Conexão SDK compartilhada (criada no primeiro uso)
+_sdk: Optional[OpenRGBClient] = None
+_sdk_lock: threading.Lock = threading.Lock()
+
+
+def _sdk_client() -> Optional[OpenRGBClient]:
+    """
+    Retorna o cliente SDK conectado, reconectando se preciso.
+
+    Returns:
+        Cliente ou None se não há servidor (as operações usam o CLI)
+    """
+    global _sdk
+    with _sdk_lock:
+        if _sdk is None:
+            _sdk = OpenRGBClient()
+        if not _sdk.connected:
+            try:
+                _sdk.connect()
+            except OSError as e:
+                logger.debug(f"SDK do OpenRGB indisponível: {e}")
+                return None
+        return _sdk
+
+
+def _with_sdk(operation: Callable[[OpenRGBClient], bool]) -> Optional[bool]:
+    """
+    Executa uma operação pelo SDK, se houver servidor.
+
+    Args:
+        operation: Função que recebe o cliente conectado
+
+    Returns:
+        Resultado da operação (False se a operação atual foi cancelada),
+        ou None se o SDK não está disponível ou falhou (o chamador usa o CLI)
+    """
+    if _expired():
+        return False
+    client: Optional[OpenRGBClient] = _sdk_client()
+    if client is None:
+        return None
+    start = time.perf_counter()
+    try:
+        return operation(client)
+    except OSError as e:
+        # Erros de comunicação já fecham a conexão; erros de dados não
+        logger.warning(f"Falha no SDK do OpenRGB, usando o CLI: {e}")
+        if not isinstance(e, OpenRGBError):
+            client.close()
+        return None
+    finally:
+        OPENRGB_SECONDS.observe(time.perf_counter() - start)
+
+
+def _sdk_prepare(client: OpenRGBClient, device_id: int, zone_id: Optional[int],
+                 led_count: Optional[int]) -> Controller:
+    """
+    Ajusta o tamanho da zona (como ``-sz`` no CLI) e retorna o controlador.
+
+    Raises:
+        OpenRGBError: Se o dispositivo ou a zona não existirem
+    """
+    controller: Controller = client.controller(device_id)
+    if zone_id is None:
+        return controller
+    if not 0 <= zone_id < len(controller.zones):
+        raise OpenRGBError(f"Zona {zone_id} não existe no dispositivo {device_id}")
+    zone = controller.zones[zone_id]
+    if led_count is not None and zone.resizable and zone.leds_count != led_count:
+        client.resize_zone(device_id, zone_id, led_count)
+        controller = client.controller(device_id)
+    return controller
+
+
+def _sdk_set_color(client: OpenRGBClient, rgb: Tuple[int, int, int], device_id: int,
+                   zone_id: Optional[int], led_count: Optional[int]) -> bool:
+    """Cor estática pelo SDK (modo Direct com zona/LEDs, senão Static)."""
+    controller: Controller = _sdk_prepare(client, device_id, zone_id, led_count)
+    direct_first: bool = zone_id is not None or led_count is not None
+    for name in (("Direct", "Static") if direct_first else ("Static", "Direct")):
+        mode = controller.find_mode(name)
+        if mode is None:
+            continue
+        if mode.color_mode == MODE_COLORS_MODE_SPECIFIC:
+            count: int = max(len(mode.colors), mode.colors_min, 1)
+            client.update_mode(device_id, replace(mode, colors=[rgb] * count))
+            return True
+        client.update_mode(device_id, mode)
+        if zone_id is not None:
+            client.update_zone_leds(
+                device_id, zone_id, [rgb] * controller.zones[zone_id].leds_count
+            )
+        else:
+            client.update_leds(device_id, [rgb] * controller.led_count)
+        return True
+    logger.warning(f"Dispositivo {device_id} sem modo Direct ou Static")
+    return False
+
+
+def _sdk_set_rainbow(client: OpenRGBClient, device_id: int, zone_id: Optional[int],
+                     led_count: Optional[int], mode_name: Optional[str]) -> bool:
+    """Modo arco-íris pelo SDK (``mode_name`` ou o melhor da lista do controlador)."""
+    controller: Controller = _sdk_prepare(client, device_id, zone_id, led_count)
+    if mode_name is None:
+        mode_name = pick_rainbow_mode([m.name for m in controller.modes])
+    mode = None if mode_name is None else controller.find_mode(mode_name)
+    if mode is None:
+        logger.warning("Nenhum modo arco-íris encontrado no dispositivo")
+        return False
+    client.update_mode(device_id, mode)
+    logger.info(f"Modo {mode.name} aplicado ao dispositivo {device_id} (SDK)")
+    return True
+
+
+def _kill(process: subprocess.Popen) -> None:
+    """Encerra o processo do OpenRGB e seus filhos, sem esperar pelos pipes."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        process.kill()
+    process.wait()
+    for pipe in (process.stdout, process.stderr):
+        if pipe is not None:
+            pipe.close()
 
 
 def _run_openrgb(*args: str, timeout: int = 10) -> Optional[str]:
     """
     Executa um comando OpenRGB e retorna stdout.
 
+    Dentro de ``cancel_scope``, o processo é encerrado assim que o token
+    for cancelado ou expirar.
+
     Args:
         *args: Argumentos para o comando openrgb
         timeout: Timeout em segundos
@@ -57,17 +296,39 @@ def _run_openrgb(*args: str, timeout: int = 10) -> Optional[str]:
         stdout do comando ou None em caso de erro
     """
     cmd = ["openrgb"] + list(args)
+    token: Optional[CancelToken] = getattr(_scope, "token", None)
+    if token is not None and token.expired:
+        return None
+    start = time.perf_counter()
     try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout
+        # Sessão própria: encerrar o grupo inclui wrappers (ex: flatpak)
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            start_new_session=True,
         )
-        if result.returncode != 0:
+        deadline: float = start + timeout
+        while True:
+            try:
+                stdout, stderr = process.communicate(
+                    timeout=CANCEL_POLL if token is not None else timeout
+                )
+                break
+            except subprocess.TimeoutExpired:
+                if token is not None and token.expired:
+                    _kill(process)
+                    reason: str = "cancelado" if token.cancelled else "prazo esgotado"
+                    logger.info(f"OpenRGB interrompido ({reason})")
+                    return None
+                if time.perf_counter() >= deadline:
+                    _kill(process)
+                    raise
+        if process.returncode != 0:
             logger.warning(
-                f"OpenRGB retornou código {result.returncode}: "
-                f"{result.stderr.strip()}"
+                f"OpenRGB retornou código {process.returncode}: "
+                f"{stderr.strip()}"
             )
             return None
-        return result.stdout
+        return stdout
     except subprocess.TimeoutExpired:
         logger.error(f"OpenRGB timeout após {timeout}s")
         return None
@@ -77,6 +338,8 @@ def _run_openrgb(*args: str, timeout: int = 10) -> Optional[str]:
     except Exception as e:
         logger.error(f"Erro ao executar OpenRGB: {e}")
         return None
+    finally:
+        OPENRGB_SECONDS.observe(time.perf_counter() - start)
 
 
 # ──────────────────────────────────────────────────────────────
@@ -87,31 +350,68 @@ def list_devices() -> List[Dict]:
     Lista dispositivos RGB detectados pelo OpenRGB.
 
     Returns:
-        Lista de dicts: [{"id": 0, "name": "..."}, ...]
+        Lista de dicts: [{"id": 0, "name": "...", "location": "...",
+        "modes": [...]}, ...].
+        Pelo SDK também "type" e, se houver um header ARGB (zona
+        redimensionável), "zone" e "leds".
     """
+    client: Optional[OpenRGBClient] = _sdk_client()
+    if client is not None:
+        try:
+            devices: List[Dict] = []
+            for c in client.controllers():
+                entry: Dict[str, Any] = {
+                    "id": c.index, "name": c.name, "type": c.type, "location": c.location,
+                    "modes": [mode.name for mode in c.modes],
+                }
+                for zone in c.zones:
+                    if zone.resizable:
+                        entry.update(zone=zone.index, leds=zone.leds_count or None)
+                        break
+                devices.append(entry)
+            return devices
+        except OSError as e:
+            logger.warning(f"Falha ao listar pelo SDK do OpenRGB, usando o CLI: {e}")
+            client.close()
+
     output = _run_openrgb("--noautoconnect", "--list-devices", timeout=15)
     if not output:
         return []
 
-    devices: List[Dict] = []
+    devices = []
     for line in output.splitlines():
         match = re.match(r"^(\d+):\s+(.+)$", line.strip())
         if match:
             devices.append({
                 "id": int(match.group(1)),
                 "name": match.group(2).strip(),
+                "location": "",
+                "modes": [],
             })
+            continue
+        match = re.match(r"^\s+(Location|Modes):\s*(.*)$", line)
+        if match and devices:
+            if match.group(1) == "Location":
+                devices[-1]["location"] = match.group(2).strip()
+            else:
+                # Ex: [Direct] Off Static 'Spectrum Cycle' (colchetes = modo ativo)
+                devices[-1]["modes"] = [
+                    quoted or plain
+                    for quoted, plain in re.findall(r"'([^']*)'|([^\s'\[\]]+)", match.group(2))
+                ]
     return devices
 
 
-def find_motherboard_argb_device() -> Optional[int]:
+def _pick_argb_device(devices: List[Dict]) -> Optional[Dict]:
     """
-    Tenta encontrar o dispositivo ARGB da placa-mãe automaticamente.
+    Escolhe o dispositivo ARGB da placa-mãe em uma lista.
+
+    Args:
+        devices: Resultado de ``list_devices``
 
     Returns:
-        ID do dispositivo OpenRGB ou None.
+        Entrada escolhida ou None se a lista estiver vazia
     """
-    devices = list_devices()
     if not devices:
         return None
 
@@ -124,6 +424,15 @@ def find_motherboard_argb_device() -> Optional[int]:
         "z690", "z790", "h670", "b660",
     ]
 
+    # Pelo SDK o tipo do controlador é conhecido
+    for device in devices:
+        if device.get("type") == DEVICE_TYPE_MOTHERBOARD:
+            logger.info(
+                f"Dispositivo ARGB encontrado: "
+                f"[{device['id']}] {device['name']}"
+            )
+            return device
+
     for device in devices:
         name_lower = str(device["name"]).lower()
         for keyword in mobo_keywords:
@@ -132,14 +441,155 @@ def find_motherboard_argb_device() -> Optional[int]:
                     f"Dispositivo ARGB encontrado: "
                     f"[{device['id']}] {device['name']}"
                 )
-                return int(device["id"])
+                return device
 
     # Fallback: primeiro dispositivo
     logger.info(
         f"Usando primeiro dispositivo RGB: "
         f"[{devices[0]['id']}] {devices[0]['name']}"
     )
-    return int(devices[0]["id"])
+    return devices[0]
+
+
+def find_motherboard_argb_device() -> Optional[int]:
+    """
+    Tenta encontrar o dispositivo ARGB da placa-mãe automaticamente.
+
+    Returns:
+        ID do dispositivo OpenRGB ou None.
+    """
+    device: Optional[Dict] = _pick_argb_device(list_devices())
+    return None if device is None else int(device["id"])
+
+
+@dataclass
+class ArgbDevice:
+    """Dispositivo ARGB resolvido (salvo em ``settings['openrgb_device']``)."""
+    id: int
+    name: str
+    location: str = ""
+    zone_id: Optional[int] = None
+    led_count: Optional[int] = None
+    rainbow_mode: Optional[str] = None  # Ver pick_rainbow_mode
+    checked: float = 0.0  # time.time() da última detecção
+
+    def matches(self, entry: Dict) -> bool:
+        """True se a entrada de ``list_devices`` é este dispositivo (nome e local)."""
+        return entry["name"] == self.name and entry.get("location", "") == self.location
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Formato salvo nas configurações."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Any) -> Optional["ArgbDevice"]:
+        """
+        Lê o formato salvo nas configurações.
+
+        Args:
+            data: Valor de ``settings['openrgb_device']``
+
+        Returns:
+            Dispositivo ou None se o valor for inválido
+        """
+        if not isinstance(data, dict):
+            return None
+        try:
+            device = cls(**data)
+        except TypeError:
+            return None
+        valid: bool = (
+            isinstance(device.id, int) and device.id >= 0
+            and isinstance(device.name, str) and isinstance(device.location, str)
+            and (device.zone_id is None or (isinstance(device.zone_id, int) and device.zone_id >= 0))
+            and (device.led_count is None
+                 or (isinstance(device.led_count, int) and 1 <= device.led_count <= 300))
+            and (device.rainbow_mode is None or isinstance(device.rainbow_mode, str))
+            and isinstance(device.checked, (int, float))
+        )
+        return device if valid else None
+
+
+class ArgbDeviceCache:
+    """
+    Detecção do dispositivo ARGB feita uma vez e salva nas configurações.
+
+    ``resolve`` devolve o dispositivo salvo enquanto ele tiver menos de
+    ``ttl`` segundos; depois disso (ou com ``force=True``, após uma falha)
+    a lista do OpenRGB é relida e o dispositivo é reencontrado pelo nome
+    e local, mesmo que o índice tenha mudado.
+    """
+
+    def __init__(self, settings_manager: Optional["SettingsManager"] = None,
+                 ttl: float = OPENRGB_DISCOVERY_TTL):
+        """
+        Inicializa o cache com o dispositivo salvo, se houver.
+
+        Args:
+            settings_manager: Onde o dispositivo é salvo (None = só em memória)
+            ttl: Validade da detecção (segundos)
+        """
+        self.settings_manager: Optional["SettingsManager"] = settings_manager
+        self.ttl: float = ttl
+        self._lock: threading.Lock = threading.Lock()
+        self.device: Optional[ArgbDevice] = None
+        if settings_manager is not None:
+            self.device = ArgbDevice.from_dict(settings_manager.get('openrgb_device'))
+
+    def resolve(self, device_id: Optional[int] = None,
+                force: bool = False) -> Optional[ArgbDevice]:
+        """
+        Retorna o dispositivo ARGB, detectando só se preciso.
+
+        Args:
+            device_id: ID configurado (``openrgb_device_id``); None = detectar
+            force: Refaz a detecção mesmo dentro da validade
+
+        Returns:
+            Dispositivo ou None se nenhum foi encontrado
+        """
+        with self._lock:
+            device: Optional[ArgbDevice] = self.device
+            if (device is not None and not force
+                    and (device_id is None or device.id == device_id)
+                    and time.time() - device.checked < self.ttl):
+                return device
+
+            devices: List[Dict] = list_devices()
+            entry: Optional[Dict] = None
+            if device_id is not None:
+                entry = next((d for d in devices if d["id"] == device_id), None)
+            else:
+                if device is not None:
+                    entry = next((d for d in devices if device.matches(d)), None)
+                    if entry is None and devices:
+                        logger.info(f"Dispositivo ARGB salvo não encontrado: {device.name}")
+                if entry is None:
+                    entry = _pick_argb_device(devices)
+            if entry is None:
+                return None
+
+            self.device = ArgbDevice(
+                int(entry["id"]), entry["name"], entry.get("location", ""),
+                entry.get("zone"), entry.get("leds"),
+                pick_rainbow_mode(entry.get("modes", [])), time.time(),
+            )
+            self._persist()
+            return self.device
+
+    def invalidate(self) -> None:
+        """Descarta o dispositivo (a próxima chamada detecta de novo)."""
+        with self._lock:
+            self.device = None
+            self._persist()
+
+    def _persist(self) -> None:
+        """Salva o dispositivo atual nas configurações."""
+        if self.settings_manager is None:
+            return
+        self.settings_manager.update(
+            {'openrgb_device': None if self.device is None else self.device.to_dict()}
+        )
 
 
 # ──────────────────────────────────────────────────────────────
@@ -171,6 +621,18 @@ def set_color(hex_color: str, device_id: Optional[int] = None, zone_id: Optional
         logger.warning("Nenhum dispositivo RGB encontrado")
         return False
 
+    rgb: Tuple[int, int, int] = (int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16))
+    target: int = device_id
+    applied: Optional[bool] = _with_sdk(
+        lambda client: _sdk_set_color(client, rgb, target, zone_id, led_count)
+    )
+    if applied is not None:
+        if applied:
+            logger.info(f"Cor #{color} aplicada ao dispositivo {device_id} (SDK)")
+        return applied
+    if shutil.which("openrgb") is None:
+        return False
+
     args = ["--noautoconnect", "-d", str(device_id)]
     if zone_id is not None:
         args += ["-z", str(zone_id)]
@@ -191,35 +653,60 @@ def set_color(hex_color: str, device_id: Optional[int] = None, zone_id: Optional
     return False
 
 
-def set_rainbow(device_id: Optional[int] = None, zone_id: Optional[int] = None, led_count: Optional[int] = None) -> bool:
+def set_rainbow(device_id: Optional[int] = None, zone_id: Optional[int] = None,
+                led_count: Optional[int] = None, mode: Optional[str] = None) -> bool:
     """
     Define o modo arco-íris nas LEDs ARGB.
 
+    Args:
+        mode: Modo já escolhido (ex: ``ArgbDevice.rainbow_mode``). Se None,
+            os modos do dispositivo são lidos uma vez e o melhor de
+            ``RAINBOW_MODES`` é usado.
+
     Returns:
         True se o modo foi aplicado com sucesso.
     """
     if not is_openrgb_available():
         return False
 
+    entry: Optional[Dict] = None
     if device_id is None:
-        device_id = find_motherboard_argb_device()
-    if device_id is None:
+        entry = _pick_argb_device(list_devices())
+        if entry is None:
+            return False
+        device_id = int(entry["id"])
+
+    target: int = device_id
+    applied: Optional[bool] = _with_sdk(
+        lambda client: _sdk_set_rainbow(client, target, zone_id, led_count, mode)
+    )
+    if applied is not None:
+        return applied
+    if shutil.which("openrgb") is None:
         return False
 
-    for mode in ["Spectrum Cycle", "Rainbow", "Rainbow Wave",
-                 "Color Cycle", "Breathing"]:
+    candidates: Tuple[str, ...] = () if mode is None else (mode,)
+    if mode is None:
+        if entry is None:
+            entry = next((d for d in list_devices() if d["id"] == device_id), None)
+        modes: List[str] = entry.get("modes", []) if entry else []
+        picked: Optional[str] = pick_rainbow_mode(modes)
+        if picked is None and modes:
+            logger.warning("Nenhum modo arco-íris encontrado no dispositivo")
+            return False
+        # Sem a lista de modos (linha "Modes:" não lida), tenta em ordem
+        candidates = RAINBOW_MODES if picked is None else (picked,)
+
+    for candidate in candidates:
         args = ["--noautoconnect", "-d", str(device_id)]
         if zone_id is not None:
             args += ["-z", str(zone_id)]
         if led_count is not None:
             args += ["-sz", str(led_count)]
-        args += ["-m", mode]
-        output = _run_openrgb(*args)
-        if output is not None:
-            logger.info(f"Modo {mode} aplicado ao dispositivo {device_id}")
+        args += ["-m", candidate]
+        if _run_openrgb(*args) is not None:
+            logger.info(f"Modo {candidate} aplicado ao dispositivo {device_id}")
             return True
-
-    logger.warning("Nenhum modo arco-íris encontrado no dispositivo")
     return False
 
 
@@ -233,19 +720,64 @@ def apply_color_setting(
     device_id: Optional[int] = None,
     zone_id: Optional[int] = None,
     led_count: Optional[int] = None,
+    cache: Optional[ArgbDeviceCache] = None,
 ) -> bool:
     """
     Aplica a configuração de cor salva.
 
+    Com ``cache``, o dispositivo (sem ``device_id``) e o modo arco-íris
+    vêm do cache de detecção; se a cor falhar, a detecção é refeita e a
+    cor é tentada mais uma vez no dispositivo reencontrado. Com
+    ``device_id``, a zona detectada não é usada (só a configurada).
+
     Args:
         color_value: "#RRGGBB", COLOR_RAINBOW, ou COLOR_OFF
         device_id: ID do dispositivo OpenRGB (None = auto)
+        zone_id: Zona (None = a detectada ou o dispositivo inteiro)
+        led_count: Tamanho da zona (None = o detectado ou o atual)
+        cache: Cache de detecção do dispositivo ARGB
 
     Returns:
         True se aplicado com sucesso.
     """
+    if cache is None:
+        return _apply_color(color_value, device_id, zone_id, led_count)
+    detected: bool = device_id is None
+
+    def _apply_to(device: ArgbDevice) -> bool:
+        return _apply_color(
+            color_value, device.id,
+            device.zone_id if zone_id is None and detected else zone_id,
+            device.led_count if led_count is None and detected else led_count,
+            device.rainbow_mode,
+        )
+
+    device: Optional[ArgbDevice] = cache.resolve(device_id)
+    if device is None:
+        if not detected:
+            # ID configurado fora da lista: tenta assim mesmo
+            return _apply_color(color_value, device_id, zone_id, led_count)
+        logger.warning("Nenhum dispositivo RGB encontrado")
+        return False
+    if _apply_to(device):
+        return True
+    if _expired():
+        return False
+
+    # Falhou: o dispositivo pode ter mudado de índice ou de zona
+    fresh: Optional[ArgbDevice] = cache.resolve(device_id, force=True)
+    if fresh is None or (fresh.id, fresh.zone_id, fresh.led_count, fresh.rainbow_mode) == (
+        device.id, device.zone_id, device.led_count, device.rainbow_mode
+    ):
+        return False
+    return _apply_to(fresh)
+
+
+def _apply_color(color_value: str, device_id: Optional[int], zone_id: Optional[int],
+                 led_count: Optional[int], rainbow_mode: Optional[str] = None) -> bool:
+    """Aplica uma cor, arco-íris ou desligado a um dispositivo."""
     if color_value == COLOR_RAINBOW:
-        return set_rainbow(device_id, zone_id, led_count)
+        return set_rainbow(device_id, zone_id, led_count, rainbow_mode)
     elif color_value == COLOR_OFF:
         return set_off(device_id, zone_id, led_count)
     else:
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 """Configuração e constantes globais."""
 
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 # Versão
 VERSION: str = "1.4.0"
@@ -14,6 +15,53 @@ VENDOR_ID: int = 0x3633
 
 # Display
 INTERVAL: int = 2  # segundos entre atualizações
+# Tempo de permanência de cada página (segundos); no modo automático as
+# páginas se alternam
+PAGE_DWELL: Dict[str, float] = {"temp": INTERVAL, "util": INTERVAL}
+KEEPALIVE_INTERVAL: int = 10  # segundos máximos sem reenviar um quadro igual
+# Reconexão: backoff exponencial para falhas ao abrir o dispositivo e
+# polling apenas quando o monitor de hotplug não estiver disponível
+RECONNECT_BACKOFF_MIN: float = 0.25
+RECONNECT_BACKOFF_MAX: float = 60.0
+RECONNECT_POLL: int = 3
+# Intervalo (segundos) entre tentativas de achar o sensor hwmon no sysfs
+SENSOR_RETRY_INTERVAL: float = 60.0
+# Filtros (src/filters.py): suavização da temperatura ("none", "ema" ou
+# "median"), histerese do número exibido por página (unidades da tela) e
+# alarme que liga na hora e desliga só abaixo de alarm_temp -
+# ALARM_HYSTERESIS, depois de pelo menos ALARM_HOLD segundos ligado
+TEMP_SMOOTHING: str = "ema"
+TEMP_EMA_ALPHA: float = 0.4
+TEMP_MEDIAN_WINDOW: int = 5
+DISPLAY_HYSTERESIS: Dict[str, float] = {"temp": 1.0, "util": 2.0}
+ALARM_HYSTERESIS: float = 3.0
+ALARM_HOLD: float = 10.0
+# Amostragem adaptativa (settings "sampling": "adaptive"): rápida quando a
+# temperatura ou o uso da CPU variam mais que os limites por segundo, e
+# volta gradualmente (x ADAPTIVE_DECAY por ciclo) à lenta quando estáveis
+SAMPLING_FIXED: str = "fixed"
+SAMPLING_ADAPTIVE: str = "adaptive"
+ADAPTIVE_FAST: float = 0.5
+ADAPTIVE_SLOW: float = 8.0
+ADAPTIVE_DECAY: float = 1.5
+ADAPTIVE_TEMP_RATE: float = 1.0   # Celsius por segundo
+ADAPTIVE_CPU_RATE: float = 15.0   # pontos percentuais por segundo
+STATS_LOG_INTERVAL: int = 300  # segundos entre resumos de estatísticas no log
+# Histórico em memória: um dia de amostras e janelas de 1, 5 e 15 minutos
+HISTORY_CAPACITY: int = 24 * 3600 // INTERVAL
+HISTORY_WINDOWS: Tuple[int, ...] = (60, 300, 900)
+# Registro em disco (src/telemetry_log.py): um registro a cada 10 s por
+# 90 dias (~12 MB), com msync a cada minuto
+TELEMETRY_LOG_INTERVAL: int = 10
+TELEMETRY_LOG_CAPACITY: int = 90 * 24 * 3600 // TELEMETRY_LOG_INTERVAL
+TELEMETRY_LOG_SYNC: int = 60
+# Log de texto: rotaciona ao atingir 1 MB, guardando 3 arquivos antigos
+LOG_MAX_BYTES: int = 1024 * 1024
+LOG_BACKUP_COUNT: int = 3
+
+# Motores do driver (--engine); o asyncio só é importado quando escolhido
+ENGINE_THREAD: str = "thread"
+ENGINE_ASYNCIO: str = "asyncio"
 
 # Modelos conhecidos
 KNOWN_MODELS: Dict[int, str] = {
@@ -25,6 +73,16 @@ KNOWN_MODELS: Dict[int, str] = {
     0x0008: "AG400 Digital",
 }
 
+# Servidor SDK do OpenRGB (src/openrgb_sdk.py); sem servidor, usa o CLI
+OPENRGB_HOST: str = "127.0.0.1"
+OPENRGB_PORT: int = 6742
+OPENRGB_TIMEOUT: float = 2.0
+# Validade do dispositivo ARGB salvo (settings['openrgb_device']); depois
+# disso, ou após uma falha, a detecção é refeita
+OPENRGB_DISCOVERY_TTL: float = 7 * 24 * 3600.0
+# Prazo de uma aplicação de cor LED (detecção + comando) no worker de LEDs
+LED_APPLY_TIMEOUT: float = 30.0
+
 # Temperaturas de alarme disponíveis (Celsius)
 ALARM_TEMPS: list[int] = [60, 70, 80, 90]
 
@@ -35,6 +93,13 @@ AUTOSTART_FILE: Path = AUTOSTART_DIR / f"{APP_NAME}.desktop"
 LOCK_FILE: str = f"/tmp/{APP_NAME}.lock"
 LOG_FILE: Path = CONFIG_DIR / f"{APP_NAME}.log"
 SETTINGS_FILE: Path = CONFIG_DIR / "settings.json"
+TELEMETRY_LOG_FILE: Path = CONFIG_DIR / "telemetry.bin"
+# Socket de controle da instância em execução (src/control.py, src/ctl.py)
+CONTROL_SOCKET: str = (
+    os.path.join(os.environ["XDG_RUNTIME_DIR"], f"{APP_NAME}.sock")
+    if os.environ.get("XDG_RUNTIME_DIR")
+    else f"/tmp/{APP_NAME}-{os.getuid()}.sock"
+)
 
 # GitHub
 GITHUB_URL: str = "https://github.com/marquimRcc/deepcool-ak620-digital-linux-regataos-opensuse"
@@ -0,0 +1,491 @@
+# -*- coding: utf-8 -*-
+"""
+Socket de controle - consulta e altera a instância em execução.
+
+Escuta em um socket Unix (``CONTROL_SOCKET``, em ``$XDG_RUNTIME_DIR``) com
+uma requisição JSON por linha e uma resposta JSON por linha:
+
+    {"cmd": "status"}
+    {"cmd": "set-mode", "mode": "temp", "device": 0}
+    {"cmd": "set-unit", "unit": "F"}
+    {"cmd": "set-alarm", "enabled": true, "temp": 80}
+    {"cmd": "set-color", "color": "#00FF00"}     (ou "rainbow", "off")
+    {"cmd": "subscribe"}
+
+Respostas: ``{"ok": true, "result": {...}}`` ou ``{"ok": false, "error": "..."}``,
+com o ``id`` da requisição quando enviado. ``device`` (índice ou chave) é
+opcional; sem ele o comando vale para todos os dispositivos. Depois de
+``subscribe`` a conexão também recebe ``{"event": "status", "data": {...}}``
+a cada leitura. O cliente de linha de comando é ``src/ctl.py``.
+"""
+
+import os
+import json
+import socket
+import logging
+import selectors
+import threading
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .config import CONTROL_SOCKET
+from .hardware import DeviceInfo
+from .history import SampleHistory
+from .sampler import TelemetrySnapshot
+from .settings import SettingsManager
+from .utils import (
+    private_umask, remove_stale_socket, validate_display_mode, validate_temperature_unit,
+)
+
+if TYPE_CHECKING:
+    from .driver import DeepCoolDriver
+
+logger = logging.getLogger(__name__)
+
+COMMANDS = ("status", "set-mode", "set-unit", "set-alarm", "set-color", "subscribe")
+MAX_REQUEST: int = 64 * 1024    # bytes por linha de requisição
+MAX_PENDING: int = 256 * 1024   # saída acumulada por assinante antes de descartar eventos
+
+# handler(comando, requisição) -> resultado
+Handler = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+# dispatch(função) -> resultado da função, executada na thread do dono
+Dispatch = Callable[[Callable[[], Dict[str, Any]]], Dict[str, Any]]
+
+
+class ControlError(ValueError):
+    """Requisição inválida; a mensagem é devolvida ao cliente."""
+
+
+def device_changes(command: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converte set-mode/set-unit/set-alarm em configurações do driver.
+
+    Args:
+        command: Nome do comando
+        request: Requisição recebida
+
+    Returns:
+        Alterações para ``DeepCoolDriver.update_settings()``
+
+    Raises:
+        ControlError: Se o comando ou os argumentos forem inválidos
+    """
+    if command == "set-mode":
+        mode = request.get("mode")
+        if not isinstance(mode, str) or not validate_display_mode(mode):
+            raise ControlError(f"Modo inválido: {mode!r} (auto, temp, util)")
+        return {"display_mode": mode}
+
+    if command == "set-unit":
+        unit = request.get("unit")
+        unit = unit.upper() if isinstance(unit, str) else unit
+        if not isinstance(unit, str) or not validate_temperature_unit(unit):
+            raise ControlError(f"Unidade inválida: {unit!r} (C, F)")
+        return {"temp_unit": unit}
+
+    if command == "set-alarm":
+        enabled = request.get("enabled")
+        if not isinstance(enabled, bool):
+            raise ControlError("set-alarm exige \"enabled\": true/false")
+        changes: Dict[str, Any] = {"alarm_enabled": enabled}
+        if "temp" in request:
+            temp = request["temp"]
+            if (isinstance(temp, bool) or not isinstance(temp, (int, float))
+                    or not 0 <= temp <= 150):
+                raise ControlError(f"Temperatura de alarme inválida: {temp!r}")
+            changes["alarm_temp"] = int(temp)
+        return changes
+
+    raise ControlError(f"Comando desconhecido: {command!r}")
+
+
+def parse_color(request: Dict[str, Any]) -> str:
+    """
+    Lê a cor de um set-color.
+
+    Args:
+        request: Requisição com "color" (hex, "rainbow" ou "off")
+
+    Returns:
+        Valor de cor no formato salvo em ``led_color``
+
+    Raises:
+        ControlError: Se a cor for inválida
+    """
+    from .colors import COLOR_OFF, COLOR_RAINBOW, validate_color
+
+    color = request.get("color")
+    if isinstance(color, str):
+        color = {"rainbow": COLOR_RAINBOW, "off": COLOR_OFF}.get(color.lower(), color)
+    if not isinstance(color, str) or not validate_color(color):
+        raise ControlError(f"Cor inválida: {color!r} (#RRGGBB, rainbow, off)")
+    if color in (COLOR_RAINBOW, COLOR_OFF):
+        return color
+    return "#" + color.lstrip("#").upper()
+
+
+def select_devices(request: Dict[str, Any], keys: List[str]) -> List[int]:
+    """
+    Resolve o campo "device" da requisição.
+
+    Args:
+        request: Requisição recebida
+        keys: Chaves dos dispositivos (``DeviceInfo.key``), na ordem dos drivers
+
+    Returns:
+        Índices dos dispositivos afetados (todos se "device" for omitido)
+
+    Raises:
+        ControlError: Se o dispositivo não existir
+    """
+    device = request.get("device")
+    if device is None:
+        return list(range(len(keys)))
+    if isinstance(device, int) and not isinstance(device, bool) and 0 <= device < len(keys):
+        return [device]
+    if isinstance(device, str) and device in keys:
+        return [keys.index(device)]
+    raise ControlError(f"Dispositivo desconhecido: {device!r}")
+
+
+def status_payload(devices: List[DeviceInfo], models: List[str],
+                   connected: List[Optional[bool]], drivers: List["DeepCoolDriver"],
+                   snapshot: Optional[TelemetrySnapshot],
+                   led_color: Optional[str],
+                   history: Optional[SampleHistory] = None) -> Dict[str, Any]:
+    """
+    Monta o resultado de ``status`` (também enviado aos assinantes).
+
+    Args:
+        devices: Dispositivos, na ordem dos drivers
+        models: Nome do modelo de cada dispositivo
+        connected: Estado de conexão (None = conectando)
+        drivers: Drivers dos dispositivos
+        snapshot: Última leitura de telemetria (None antes da primeira)
+        led_color: Cor LED salva
+        history: Histórico de leituras (janelas de 1/5/15 min no resultado)
+
+    Returns:
+        Dicionário serializável em JSON
+    """
+    entries: List[Dict[str, Any]] = []
+    for index, (info, model, driver) in enumerate(zip(devices, models, drivers)):
+        settings: Dict[str, Any] = driver.get_settings()
+        entry: Dict[str, Any] = {
+            "index": index,
+            "key": info.key,
+            "model": model,
+            "product_id": info.product_id,
+            "connected": connected[index],
+        }
+        entry.update({key: settings[key] for key in SettingsManager.DEVICE_KEYS})
+        entries.append(entry)
+    return {
+        "timestamp": snapshot.timestamp if snapshot else None,
+        "temperature": snapshot.temperature if snapshot else None,
+        "cpu_usage": snapshot.cpu_usage if snapshot else None,
+        "led_color": led_color,
+        "devices": entries,
+        "history": [asdict(stats) for stats in history.windows()] if history is not None else [],
+    }
+
+
+class _Client:
+    """Conexão de um cliente (buffers protegidos pelo lock do servidor)."""
+
+    __slots__ = ("sock", "inbuf", "outbuf", "subscribed", "events")
+
+    def __init__(self, sock: socket.socket):
+        """Inicializa a conexão com buffers vazios."""
+        self.sock: socket.socket = sock
+        self.inbuf: bytearray = bytearray()
+        self.outbuf: bytearray = bytearray()
+        self.subscribed: bool = False
+        self.events: int = selectors.EVENT_READ
+
+
+class ControlServer:
+    """
+    Servidor do socket de controle, em uma única thread com ``selectors``.
+
+    Os comandos são executados por ``handler``; com ``dispatch`` a execução
+    é repassada à thread do dono (a thread da GUI, na bandeja).
+    """
+
+    def __init__(self, handler: Handler, path: str = CONTROL_SOCKET,
+                 dispatch: Optional[Dispatch] = None):
+        """
+        Inicializa o servidor (sem abrir o socket).
+
+        Args:
+            handler: Executa um comando e retorna o resultado; levanta
+                ``ControlError`` para requisições inválidas
+            path: Caminho do socket Unix
+            dispatch: Executa uma função na thread do dono e retorna o
+                resultado (None = executa na thread do servidor)
+        """
+        self.handler: Handler = handler
+        self.path: str = path
+        self.dispatch: Optional[Dispatch] = dispatch
+        self._sock: Optional[socket.socket] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._clients: Dict[int, _Client] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._subscribers: int = 0
+        self._wake_r: int = -1
+        self._wake_w: int = -1
+        self._thread: Optional[threading.Thread] = None
+        self._running: bool = False
+
+    @property
+    def has_subscribers(self) -> bool:
+        """True se algum cliente pediu ``subscribe``."""
+        return self._subscribers > 0
+
+    # ── Ciclo de vida ──
+
+    def start(self) -> bool:
+        """
+        Abre o socket e inicia a thread do servidor.
+
+        Returns:
+            True se o socket foi aberto (falhas só desativam o controle)
+        """
+        try:
+            self._sock = self._bind()
+        except OSError as e:
+            logger.warning(f"Socket de controle indisponível ({self.path}): {e}")
+            return False
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._sock, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="deepcool-control", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Socket de controle em {self.path}")
+        return True
+
+    def _bind(self) -> socket.socket:
+        """Cria o socket de escuta (acessível só pelo usuário)."""
+        sock = socket.socket(
+            socket.AF_UNIX,
+            socket.SOCK_STREAM | socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC,
+        )
+        try:
+            # Só um socket antigo é removido (nunca um arquivo comum em
+            # um caminho personalizado), e ele já nasce com 0600
+            remove_stale_socket(self.path)
+            with private_umask():
+                sock.bind(self.path)
+            os.chmod(self.path, 0o600)
+            sock.listen(8)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def stop(self) -> None:
+        """Encerra a thread e remove o socket."""
+        if not self._running:
+            return
+        self._running = False
+        self._wake()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+
+    def _wake(self) -> None:
+        """Acorda o ``select()`` da thread do servidor."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Pipe cheio (já há um despertar pendente) ou fechado
+
+    # ── Eventos ──
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        """
+        Envia um evento aos assinantes (thread-safe).
+
+        Assinantes lentos perdem eventos em vez de acumular memória; o
+        próximo evento traz o estado completo de novo.
+
+        Args:
+            event: Nome do evento (ex: "status")
+            data: Conteúdo serializável em JSON
+        """
+        if not self._subscribers:
+            return
+        line: bytes = (json.dumps({"event": event, "data": data}) + "\n").encode()
+        with self._lock:
+            for client in self._clients.values():
+                if client.subscribed and len(client.outbuf) < MAX_PENDING:
+                    client.outbuf += line
+        self._wake()
+
+    # ── Thread do servidor ──
+
+    def _run(self) -> None:
+        """Loop do servidor."""
+        assert self._selector is not None
+        try:
+            while self._running:
+                for key, events in self._selector.select():
+                    if key.fileobj is self._sock:
+                        self._accept()
+                    elif key.fileobj == self._wake_r:
+                        try:
+                            os.read(self._wake_r, 512)
+                        except BlockingIOError:
+                            pass
+                    elif events & selectors.EVENT_READ:
+                        self._read(key.data)
+                self._flush_all()
+        except Exception as e:
+            logger.error(f"Erro no socket de controle: {e}", exc_info=True)
+        finally:
+            self._close()
+
+    def _accept(self) -> None:
+        """Aceita novas conexões."""
+        assert self._sock is not None and self._selector is not None
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            conn.setblocking(False)
+            client = _Client(conn)
+            with self._lock:
+                self._clients[conn.fileno()] = client
+            self._selector.register(conn, selectors.EVENT_READ, client)
+
+    def _read(self, client: _Client) -> None:
+        """Lê dados de um cliente e responde às linhas completas."""
+        try:
+            data: bytes = client.sock.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+
+        client.inbuf += data
+        while True:
+            end: int = client.inbuf.find(b"\n")
+            if end < 0:
+                break
+            line: bytes = bytes(client.inbuf[:end])
+            del client.inbuf[:end + 1]
+            if line.strip():
+                self._send(client, self._process(client, line))
+
+        if len(client.inbuf) > MAX_REQUEST:
+            logger.warning("Requisição de controle grande demais, desconectando")
+            self._drop(client)
+
+    def _process(self, client: _Client, line: bytes) -> Dict[str, Any]:
+        """
+        Executa uma requisição.
+
+        Args:
+            client: Conexão de origem
+            line: Linha JSON recebida
+
+        Returns:
+            Resposta
+        """
+        request_id: Any = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ControlError("A requisição deve ser um objeto JSON")
+            request_id = request.get("id")
+            command = request.get("cmd")
+            if command not in COMMANDS:
+                raise ControlError(f"Comando desconhecido: {command!r}")
+            if command == "subscribe":
+                if not client.subscribed:
+                    client.subscribed = True
+                    self._subscribers += 1
+                command = "status"  # A resposta traz o estado atual
+            response: Dict[str, Any] = {"ok": True, "result": self._call(command, request)}
+        except ValueError as e:  # ControlError e JSON inválido
+            response = {"ok": False, "error": str(e)}
+        except Exception as e:
+            logger.error(f"Erro ao executar comando de controle: {e}", exc_info=True)
+            response = {"ok": False, "error": f"Erro interno: {e}"}
+        if request_id is not None:
+            response["id"] = request_id
+        return response
+
+    def _call(self, command: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Executa o handler na thread do dono (se houver ``dispatch``)."""
+        if self.dispatch is None:
+            return self.handler(command, request)
+        return self.dispatch(lambda: self.handler(command, request))
+
+    def _send(self, client: _Client, message: Dict[str, Any]) -> None:
+        """Enfileira uma mensagem para o cliente."""
+        with self._lock:
+            client.outbuf += (json.dumps(message) + "\n").encode()
+
+    def _flush_all(self) -> None:
+        """Escreve o que estiver pendente e ajusta os eventos do selector."""
+        assert self._selector is not None
+        broken: List[_Client] = []
+        with self._lock:
+            for client in self._clients.values():
+                if client.outbuf:
+                    try:
+                        sent: int = client.sock.send(client.outbuf)
+                        del client.outbuf[:sent]
+                    except BlockingIOError:
+                        pass
+                    except OSError:
+                        broken.append(client)
+                        continue
+                events: int = selectors.EVENT_READ
+                if client.outbuf:
+                    events |= selectors.EVENT_WRITE
+                if events != client.events:
+                    client.events = events
+                    self._selector.modify(client.sock, events, client)
+        for client in broken:
+            self._drop(client)
+
+    def _drop(self, client: _Client) -> None:
+        """Fecha a conexão de um cliente."""
+        assert self._selector is not None
+        with self._lock:
+            if self._clients.pop(client.sock.fileno(), None) is None:
+                return
+            if client.subscribed:
+                self._subscribers -= 1
+        self._selector.unregister(client.sock)
+        client.sock.close()
+
+    def _close(self) -> None:
+        """Fecha todas as conexões e remove o socket."""
+        for client in list(self._clients.values()):
+            self._drop(client)
+        if self._selector is not None:
+            self._selector.close()
+        if self._sock is not None:
+            self._sock.close()
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_r = self._wake_w = -1
+        self._running = False
+        logger.info("Socket de controle encerrado")
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Cliente de linha de comando do socket de controle.
+
+Fala com a instância em execução (bandeja ou daemon) sem importar o Qt
+nem os módulos do driver. Exemplos:
+
+    python3 -m src.ctl status
+    python3 -m src.ctl set-mode temp --device 0
+    python3 -m src.ctl set-unit F
+    python3 -m src.ctl set-alarm on --temp 80
+    python3 -m src.ctl set-color "#00FF00"
+    python3 -m src.ctl subscribe
+
+Códigos de saída: 0 sucesso, 1 comando recusado, 2 instância não encontrada.
+"""
+
+import sys
+import json
+import socket
+import argparse
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .config import CONTROL_SOCKET
+
+TIMEOUT: float = 5.0
+
+
+class ControlClient:
+    """Conexão com o socket de controle."""
+
+    def __init__(self, path: str = CONTROL_SOCKET, timeout: Optional[float] = TIMEOUT):
+        """
+        Conecta ao socket.
+
+        Args:
+            path: Caminho do socket Unix
+            timeout: Tempo máximo de espera por resposta (None = sem limite)
+
+        Raises:
+            OSError: Se a instância não estiver rodando
+        """
+        self.sock: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(path)
+        except OSError:
+            self.sock.close()
+            raise
+        self._reader = self.sock.makefile("rb")
+
+    def request(self, cmd: str, **args: Any) -> Dict[str, Any]:
+        """
+        Envia um comando e espera a resposta.
+
+        Args:
+            cmd: Comando (status, set-mode, ...)
+            **args: Argumentos do comando
+
+        Returns:
+            Resposta do servidor ({"ok": ..., "result"/"error": ...})
+
+        Raises:
+            OSError: Se a conexão cair
+        """
+        self.sock.sendall((json.dumps({"cmd": cmd, **args}) + "\n").encode())
+        return self._read()
+
+    def events(self) -> Iterator[Dict[str, Any]]:
+        """
+        Itera sobre os eventos recebidos após ``subscribe``.
+
+        Yields:
+            Mensagens {"event": ..., "data": ...}
+        """
+        while True:
+            yield self._read()
+
+    def _read(self) -> Dict[str, Any]:
+        """Lê uma linha JSON."""
+        line: bytes = self._reader.readline()
+        if not line:
+            raise ConnectionError("Conexão encerrada pela instância")
+        return json.loads(line)
+
+    def close(self) -> None:
+        """Fecha a conexão."""
+        self._reader.close()
+        self.sock.close()
+
+
+def format_status(status: Dict[str, Any]) -> str:
+    """
+    Formata o resultado de ``status`` para leitura humana.
+
+    Args:
+        status: Resultado do comando status
+
+    Returns:
+        Texto com uma linha de telemetria e uma por dispositivo
+    """
+    lines: List[str] = []
+    if status.get("temperature") is None:
+        lines.append("Temperatura: --  CPU: --")
+    else:
+        lines.append(f"Temperatura: {status['temperature']:.1f}°C  CPU: {status['cpu_usage']}%")
+    for device in status.get("devices", []):
+        state = {True: "conectado", False: "desconectado", None: "conectando"}[device["connected"]]
+        alarm = f"{device['alarm_temp']}°C" if device["alarm_enabled"] else "desligado"
+        lines.append(
+            f"[{device['index']}] {device['model']} ({device['key']}): {state}, "
+            f"modo={device['display_mode']}, unidade={device['temp_unit']}, alarme={alarm}"
+        )
+    for stats in status.get("history", []):
+        lines.append(
+            f"{int(stats['window'] // 60)} min: {stats['temp_min']:.1f}–{stats['temp_max']:.1f}°C "
+            f"(p95 {stats['temp_p95']:.1f}), CPU p95 {stats['cpu_p95']}% "
+            f"({stats['samples']} amostras)"
+        )
+    lines.append(f"Cor LED: {status.get('led_color')}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Lê as opções de linha de comando.
+
+    Args:
+        argv: Argumentos sem o nome do programa
+
+    Returns:
+        Opções reconhecidas
+    """
+    # Opções comuns, aceitas depois do comando
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--socket', default=CONTROL_SOCKET, help="Caminho do socket de controle")
+    common.add_argument('--json', action='store_true', help="Imprime as respostas em JSON")
+    common.add_argument('--device', help="Índice ou chave do dispositivo (padrão: todos)")
+
+    parser = argparse.ArgumentParser(
+        prog="python3 -m src.ctl",
+        description="Controla a instância do DeepCool Digital em execução",
+    )
+    commands = parser.add_subparsers(dest='cmd', required=True)
+
+    commands.add_parser('status', parents=[common], help="Mostra telemetria e configurações")
+    mode = commands.add_parser('set-mode', parents=[common], help="Define o modo de exibição")
+    mode.add_argument('mode', choices=('auto', 'temp', 'util'))
+    unit = commands.add_parser('set-unit', parents=[common],
+                               help="Define a unidade de temperatura")
+    unit.add_argument('unit', choices=('C', 'F', 'c', 'f'))
+    alarm = commands.add_parser('set-alarm', parents=[common], help="Liga ou desliga o alarme")
+    alarm.add_argument('state', choices=('on', 'off'))
+    alarm.add_argument('--temp', type=int, help="Temperatura do alarme (°C)")
+    color = commands.add_parser('set-color', parents=[common],
+                                help="Define a cor LED (OpenRGB)")
+    color.add_argument('color', help="#RRGGBB, rainbow ou off")
+    commands.add_parser('subscribe', parents=[common],
+                        help="Acompanha as atualizações de status")
+    return parser.parse_args(argv)
+
+
+def build_request(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Monta os argumentos do comando a partir das opções.
+
+    Args:
+        args: Opções de linha de comando
+
+    Returns:
+        Campos da requisição (além de "cmd")
+    """
+    request: Dict[str, Any] = {}
+    if args.device is not None:
+        device: Union[int, str] = int(args.device) if args.device.isdigit() else args.device
+        request['device'] = device
+    if args.cmd == 'set-mode':
+        request['mode'] = args.mode
+    elif args.cmd == 'set-unit':
+        request['unit'] = args.unit.upper()
+    elif args.cmd == 'set-alarm':
+        request['enabled'] = args.state == 'on'
+        if args.temp is not None:
+            request['temp'] = args.temp
+    elif args.cmd == 'set-color':
+        request['color'] = args.color
+    return request
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Executa um comando.
+
+    Args:
+        argv: Argumentos (padrão: ``sys.argv[1:]``)
+
+    Returns:
+        Código de saída
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        client = ControlClient(args.socket, timeout=None if args.cmd == 'subscribe' else TIMEOUT)
+    except OSError as e:
+        print(f"Instância não encontrada em {args.socket}: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        response: Dict[str, Any] = client.request(args.cmd, **build_request(args))
+        if not response.get("ok"):
+            print(f"Erro: {response.get('error')}", file=sys.stderr)
+            return 1
+        print(json.dumps(response["result"]) if args.json else format_status(response["result"]),
+              flush=True)
+        if args.cmd == 'subscribe':
+            for message in client.events():
+                data = message.get("data", {})
+                print(json.dumps(data) if args.json else format_status(data), flush=True)
+        return 0
+    except KeyboardInterrupt:
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"Erro de comunicação: {e}", file=sys.stderr)
+        return 2
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
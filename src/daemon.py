@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+Modo daemon - driver sem interface gráfica e sem importar o PyQt5.
+
+Os drivers, o amostrador e as configurações são os mesmos da bandeja, mas
+os sinais são callbacks simples. Controle por sinais Unix:
+
+  - SIGTERM / SIGINT: encerra
+  - SIGHUP: recarrega ``settings.json``
+  - SIGUSR1: registra status e estatísticas no log
+
+Em execução também atende o socket de controle (``src/control.py``).
+
+Com ``Type=notify`` no systemd, o daemon avisa quando está pronto
+(``READY=1``) e quando está encerrando (``STOPPING=1``).
+"""
+
+import os
+import signal
+import socket
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .config import ENGINE_ASYNCIO, ENGINE_THREAD
+from .control import (
+    ControlServer, device_changes, parse_color, select_devices, status_payload,
+)
+from .driver import DeepCoolDriver
+from .metrics import render_metrics
+from .hardware import DeviceInfo, detect_model
+from .history import SampleHistory
+from .sampler import Sampler, TelemetrySnapshot
+from .settings import SettingsManager
+from .signals import DriverSignals, LedSignals
+from .startup import StartupProfiler
+from .telemetry_log import TelemetryLog
+from .transport import TRANSPORT_AUTO
+
+if TYPE_CHECKING:
+    from .async_engine import AsyncDriverEngine
+    from .colors import ArgbDeviceCache
+    from .led_worker import LedWorker
+    from .metrics_server import MetricsServer
+
+logger = logging.getLogger(__name__)
+
+
+def sd_notify(state: str) -> bool:
+    """
+    Envia uma notificação de estado ao systemd (protocolo sd_notify).
+
+    Args:
+        state: Ex: "READY=1", "STOPPING=1", "STATUS=..."
+
+    Returns:
+        True se enviado (False fora do systemd ou em erro)
+    """
+    address: Optional[str] = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return False
+    if address.startswith("@"):
+        address = "\0" + address[1:]  # Socket abstrato
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC) as sock:
+            sock.connect(address)
+            sock.sendall(state.encode())
+        return True
+    except OSError as e:
+        logger.warning(f"Falha ao notificar o systemd: {e}")
+        return False
+
+
+class DeepCoolDaemon:
+    """Executa os drivers em segundo plano, sem bandeja."""
+
+    def __init__(self, devices: List[DeviceInfo], sensor: str,
+                 engine: str = ENGINE_THREAD, transport: str = TRANSPORT_AUTO,
+                 write_timeout: Optional[float] = None,
+                 profiler: Optional[StartupProfiler] = None,
+                 metrics: Optional[str] = None):
+        """
+        Inicializa o daemon.
+
+        Args:
+            devices: Dispositivos DeepCool detectados (um driver para cada)
+            sensor: Nome do sensor de temperatura
+            engine: Motor do driver ("thread" ou "asyncio")
+            transport: Backend de transporte HID
+            write_timeout: Tempo máximo de escrita em segundos (hidraw)
+            profiler: Perfil de inicialização (``--profile-startup``)
+            metrics: Endereço do endpoint de métricas (``--metrics``)
+        """
+        self.profiler: StartupProfiler = profiler or StartupProfiler()
+        self.devices: List[DeviceInfo] = list(devices)
+        self.models: List[str] = [detect_model(d.product_id) for d in self.devices]
+        self.sensor: str = sensor
+        self.engine_name: str = engine
+        self._engine: Optional["AsyncDriverEngine"] = None
+
+        # Estado (None = ainda conectando)
+        self.connected: List[Optional[bool]] = [None] * len(self.devices)
+        self.last_snapshot: Optional[TelemetrySnapshot] = None
+        # Os callbacks rodam na thread de cada driver
+        self._snapshot_lock: threading.Lock = threading.Lock()
+        self.led_color: Optional[str] = None
+        self.history: SampleHistory = SampleHistory()
+        self.telemetry_log: TelemetryLog = TelemetryLog()
+        self.control: ControlServer = ControlServer(self._handle_control)
+        self.metrics_address: Optional[str] = metrics
+        self.metrics_server: Optional["MetricsServer"] = None
+        self.argb_cache: Optional["ArgbDeviceCache"] = None  # Criado no primeiro uso
+        self.led_signals: LedSignals = LedSignals()
+        self.led_signals.applied.connect(self._on_led_applied)
+        self.led_worker: Optional["LedWorker"] = None  # Criado em start()
+
+        self.settings_manager: SettingsManager = SettingsManager()
+        self.sampler: Sampler = Sampler(sensor)
+
+        self.signals: List[DriverSignals] = []
+        self.drivers: List[DeepCoolDriver] = []
+        for index, info in enumerate(self.devices):
+            signals: DriverSignals = DriverSignals()
+            signals.status_updated.connect(self._on_status_updated)
+            signals.connection_changed.connect(
+                lambda connected, i=index: self._on_connection_changed(i, connected)
+            )
+            self.signals.append(signals)
+            self.drivers.append(DeepCoolDriver(
+                signals, info.product_id, sensor,
+                device_info=info, sampler=self.sampler,
+                transport=transport, write_timeout=write_timeout,
+            ))
+
+        # Pedidos vindos dos handlers de sinais, tratados no loop principal
+        self._wake: threading.Event = threading.Event()
+        self._stop_requested: bool = False
+        self._reload_requested: bool = False
+        self._status_requested: bool = False
+
+        self.load_settings()
+        self.profiler.mark("configurações")
+
+    # ── Configurações ──
+
+    def load_settings(self) -> Dict[str, Any]:
+        """
+        Carrega ``settings.json`` e aplica a cada driver.
+
+        Returns:
+            Configurações carregadas
+        """
+        saved: Dict[str, Any] = self.settings_manager.load()
+        self.sampler.set_smoothing(saved['temp_smoothing'])
+        for driver, info in zip(self.drivers, self.devices):
+            driver.apply_settings(self.settings_manager.device_settings(saved, info.key))
+        self.led_color = saved.get('led_color')
+        logger.info(f"Configurações carregadas: {saved}")
+        return saved
+
+    def save_settings(self) -> bool:
+        """
+        Salva as configurações atuais dos drivers (preservando a cor LED).
+
+        Returns:
+            True se salvo com sucesso
+        """
+        changes: Dict[str, Any] = self.drivers[0].get_settings()
+        changes['devices'] = {}
+        for driver, info in zip(self.drivers, self.devices):
+            driver_settings = driver.get_settings()
+            changes['devices'][info.key] = {
+                key: driver_settings[key] for key in SettingsManager.DEVICE_KEYS
+            }
+        return self.settings_manager.update(changes)
+
+    # ── Callbacks dos drivers (thread do driver) ──
+
+    def _on_status_updated(self, mode: str, snapshot: TelemetrySnapshot) -> None:
+        """
+        Guarda o último snapshot (compartilhado entre drivers).
+
+        Cada leitura é registrada uma vez só: o mesmo snapshot emitido por
+        outro driver, ou um mais antigo que chega atrasado, é descartado.
+        """
+        with self._snapshot_lock:
+            last: Optional[TelemetrySnapshot] = self.last_snapshot
+            if last is not None and snapshot.monotonic <= last.monotonic:
+                return
+            self.last_snapshot = snapshot
+            self.history.append(snapshot)
+            driver: DeepCoolDriver = self.drivers[0]
+            self.telemetry_log.append(
+                snapshot.timestamp, snapshot.temperature, snapshot.cpu_usage,
+                driver.get_settings(), driver.alarm_active,
+            )
+        self._publish_status()
+
+    def _on_connection_changed(self, index: int, connected: bool) -> None:
+        """Registra mudanças de conexão de um dispositivo."""
+        if self.connected[index] == connected:
+            return
+        self.connected[index] = connected
+        if connected:
+            logger.info(f"Dispositivo conectado: {self.models[index]}")
+        else:
+            logger.warning(f"Dispositivo desconectado: {self.models[index]}")
+        self._publish_status()
+
+    # ── Socket de controle (thread do servidor) ──
+
+    def control_status(self) -> Dict[str, Any]:
+        """Resultado do comando status."""
+        return status_payload(
+            self.devices, self.models, self.connected, self.drivers,
+            self.last_snapshot, self.led_color, self.history,
+        )
+
+    def render_metrics(self) -> str:
+        """Texto OpenMetrics (chamado na thread do endpoint)."""
+        return render_metrics(
+            self.devices, self.models, self.connected, self.drivers, self.sampler
+        )
+
+    def _publish_status(self) -> None:
+        """Envia o status atual aos assinantes do socket de controle."""
+        if self.control.has_subscribers:
+            self.control.publish("status", self.control_status())
+
+    def set_led_color(self, color: str) -> None:
+        """
+        Salva a cor LED e aplica em segundo plano (OpenRGB).
+
+        Args:
+            color: Cor hex, rainbow ou off (já validada)
+        """
+        self.settings_manager.update({'led_color': color})
+        self.led_color = color
+        if self.led_worker is not None:
+            self.led_worker.submit(color)
+
+    def _handle_control(self, command: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa um comando do socket de controle.
+
+        Args:
+            command: Nome do comando
+            request: Requisição recebida
+
+        Returns:
+            Status após o comando
+
+        Raises:
+            ControlError: Se a requisição for inválida
+        """
+        if command == "set-color":
+            self.set_led_color(parse_color(request))
+        elif command != "status":
+            changes: Dict[str, Any] = device_changes(command, request)
+            for index in select_devices(request, [d.key for d in self.devices]):
+                self.drivers[index].update_settings(**changes)
+            self.save_settings()
+            logger.info(f"Controle: {command} {changes}")
+        return self.control_status()
+
+    # ── Ciclo de vida ──
+
+    def _apply_led(self, color: str) -> Optional[bool]:
+        """
+        Aplica uma cor LED (chamado na thread do worker de LEDs).
+
+        Returns:
+            True/False, ou None se o OpenRGB não está disponível
+        """
+        from .colors import ArgbDeviceCache, apply_color_setting, is_openrgb_available
+        if not is_openrgb_available():
+            return None
+        if self.argb_cache is None:
+            self.argb_cache = ArgbDeviceCache(self.settings_manager)
+        saved: Dict[str, Any] = self.settings_manager.load()
+        return apply_color_setting(
+            color, saved.get('openrgb_device_id'), saved.get('openrgb_zone_id'),
+            saved.get('openrgb_led_count'), cache=self.argb_cache,
+        )
+
+    def _on_led_applied(self, color: str, success: bool) -> None:
+        """Resultado do worker de LEDs (thread do worker)."""
+        if success:
+            logger.info(f"Cor LED aplicada: {color}")
+        else:
+            logger.warning(f"Falha ao aplicar cor LED: {color}")
+
+    def start(self) -> None:
+        """Inicia os drivers no motor configurado."""
+        if self.engine_name == ENGINE_ASYNCIO:
+            from .async_engine import AsyncDriverEngine
+            self._engine = AsyncDriverEngine(self.drivers)
+            self._engine.start()
+        else:
+            for driver in self.drivers:
+                driver.start()
+        self.profiler.mark("drivers")
+        from .led_worker import LedWorker
+        self.led_worker = LedWorker(self._apply_led, self.led_signals)
+        self.led_worker.start()
+        if self.led_color:
+            self.led_worker.submit(self.led_color)
+        self.telemetry_log.open()
+        self.control.start()
+        if self.metrics_address:
+            from .metrics_server import MetricsServer
+            self.metrics_server = MetricsServer(self.metrics_address, self.render_metrics)
+            self.metrics_server.start()
+        logger.info(f"Daemon iniciado ({len(self.drivers)} dispositivo(s))")
+
+    def stop(self) -> None:
+        """Para o socket de controle e os drivers (e o motor asyncio, se houver)."""
+        self.control.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+        if self.led_worker is not None:
+            self.led_worker.stop()
+        if self._engine is not None:
+            self._engine.stop()
+            self._engine = None
+        else:
+            for driver in self.drivers:
+                driver.stop()
+            for driver in self.drivers:
+                if driver.is_alive():
+                    driver.join(timeout=1)
+        self.telemetry_log.close()
+
+    def log_status(self) -> None:
+        """Registra o status de cada dispositivo e as estatísticas do driver."""
+        snapshot = self.last_snapshot
+        if snapshot is not None:
+            logger.info(
+                f"Status: {snapshot.temperature:.1f}°C, CPU {snapshot.cpu_usage}%"
+            )
+        for model, connected, driver in zip(self.models, self.connected, self.drivers):
+            logger.info(f"{model}: conectado={connected}, {driver.get_stats()}")
+
+    # ── Sinais Unix ──
+
+    def request_stop(self) -> None:
+        """Pede o encerramento do loop principal (thread-safe)."""
+        self._stop_requested = True
+        self._wake.set()
+
+    def _handle_signal(self, signum: int, frame: Any) -> None:
+        """Handler de sinais: só marca o pedido e acorda o loop principal."""
+        if signum in (signal.SIGTERM, signal.SIGINT):
+            self._stop_requested = True
+        elif signum == signal.SIGHUP:
+            self._reload_requested = True
+        elif signum == signal.SIGUSR1:
+            self._status_requested = True
+        self._wake.set()
+
+    def _install_signal_handlers(self) -> None:
+        """Instala os handlers (deve ser chamado na thread principal)."""
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGUSR1):
+            signal.signal(signum, self._handle_signal)
+
+    def run(self) -> int:
+        """
+        Executa até receber SIGTERM/SIGINT.
+
+        Returns:
+            Código de saída
+        """
+        self._install_signal_handlers()
+        self.start()
+        sd_notify("READY=1")
+
+        try:
+            while True:
+                self._wake.wait()
+                self._wake.clear()
+                if self._stop_requested:
+                    break
+                if self._reload_requested:
+                    self._reload_requested = False
+                    logger.info("SIGHUP: recarregando configurações")
+                    self.load_settings()
+                if self._status_requested:
+                    self._status_requested = False
+                    self.log_status()
+        finally:
+            sd_notify("STOPPING=1")
+            logger.info("Encerrando daemon...")
+            self.stop()
+        return 0
@@ -1,78 +1,146 @@
 # -*- coding: utf-8 -*-
 """Driver HID - thread que comunica com o cooler DeepCool."""
 
+import math
 import time
 import threading
 import logging
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
-import hid
-import psutil
-from PyQt5.QtCore import pyqtSignal, QObject
-
-from .config import VENDOR_ID, INTERVAL
+from .config import (
+    VENDOR_ID, INTERVAL, PAGE_DWELL, KEEPALIVE_INTERVAL, STATS_LOG_INTERVAL,
+    RECONNECT_BACKOFF_MIN, RECONNECT_BACKOFF_MAX, RECONNECT_POLL,
+    DISPLAY_HYSTERESIS, ALARM_HYSTERESIS, ALARM_HOLD, SAMPLING_ADAPTIVE, SAMPLING_FIXED,
+)
+from .filters import AlarmDebounce, DisplayHysteresis
 from .protocol import build_packet, DisplayMode
-from .hardware import get_temperature, get_cpu_usage
-from .utils import format_temperature
+from .hardware import DeviceInfo
+from .metrics import Histogram
+from .sampler import Sampler, TelemetrySnapshot
+from .scheduler import AdaptiveRate, DeadlineScheduler
+from .signals import DriverSignals
+from .transport import HidTransport, TransportError, TRANSPORT_AUTO, TRANSPORT_VIRTUAL, create_transport
+
+if TYPE_CHECKING:
+    from .hotplug import HotplugMonitor
 
 logger = logging.getLogger(__name__)
 
+# Retorno de step(): dispositivo ausente, esperar evento de hotplug
+WAIT_HOTPLUG: float = math.inf
+
 
-class DriverSignals(QObject):
-    """Sinais Qt para comunicação entre driver (thread) e GUI."""
-    status_updated = pyqtSignal(str, float, int)   # mode, temp_celsius, cpu_percent
-    connection_changed = pyqtSignal(bool)           # connected
-    error_occurred = pyqtSignal(str)                # error_message
+@dataclass
+class DriverStats:
+    """Contadores de escrita do driver."""
+    frames_written: int = 0
+    frames_suppressed: int = 0
+    reconnects: int = 0
 
 
 class DeepCoolDriver(threading.Thread):
     """Thread que lê sensores e envia dados para o cooler via HID."""
 
-    def __init__(self, signals: DriverSignals, product_id: int, sensor: str):
+    def __init__(self, signals: DriverSignals, product_id: int, sensor: str,
+                 device_info: Optional[DeviceInfo] = None,
+                 sampler: Optional[Sampler] = None,
+                 transport: Union[str, HidTransport] = TRANSPORT_AUTO,
+                 write_timeout: Optional[float] = None):
         """
         Inicializa o driver.
         
         Args:
-            signals: Objeto de sinais Qt para comunicação com GUI
+            signals: Sinais do driver (``DriverSignals`` com callbacks ou
+                ``QtDriverSignals`` na interface gráfica)
             product_id: Product ID do dispositivo USB
             sensor: Nome do sensor de temperatura
+            device_info: Dispositivo específico a abrir (por hidraw/serial);
+                se None, abre o primeiro com o Product ID
+            sampler: Amostrador compartilhado entre drivers (criado se None)
+            transport: Backend de transporte HID ("auto", "hidraw", "hidapi",
+                "virtual") ou uma instância de ``HidTransport``
+            write_timeout: Tempo máximo de escrita em segundos (hidraw)
         """
         super().__init__(daemon=True)
         self.signals: DriverSignals = signals
         self.product_id: int = product_id
         self.sensor: str = sensor
+        self.device_info: Optional[DeviceInfo] = device_info
         self.running: bool = True
-        self.device: Optional[hid.device] = None
+        self.transport: HidTransport = (
+            transport if isinstance(transport, HidTransport)
+            else create_transport(transport, write_timeout)
+        )
+        self.device: Optional[HidTransport] = None
+        self.sampler: Sampler = sampler or Sampler(sensor)
 
         # Configurações (alteráveis pelo menu)
         self.display_mode: str = "auto"   # "auto", "temp", "util"
         self.temp_unit: str = "C"         # "C" ou "F"
         self.alarm_enabled: bool = False
         self.alarm_temp: int = 80         # Celsius
+        self.keepalive_interval: int = KEEPALIVE_INTERVAL
+        self.page_dwell: Dict[str, float] = dict(PAGE_DWELL)
+        self.display_hysteresis: Dict[str, float] = dict(DISPLAY_HYSTERESIS)
+        self.alarm_hysteresis: float = ALARM_HYSTERESIS
+        self.alarm_hold: float = ALARM_HOLD
+        self.sampling: str = SAMPLING_FIXED    # "fixed" ou "adaptive"
+
+        # Filtros de exibição (um por modo do quadro: temp_c, temp_f, util)
+        self._shown: Dict[str, DisplayHysteresis] = {}
+        self._alarm: AlarmDebounce = AlarmDebounce()
+
+        # Agendamento por deadline; o evento acorda o loop em mudanças
+        self.scheduler: DeadlineScheduler = DeadlineScheduler()
+        self.rate: AdaptiveRate = AdaptiveRate()
+        self._auto_page: str = "temp"
+        self._wake_callbacks: List[Callable[[], None]] = []
+
+        # Supressão de quadros repetidos
+        self.stats: DriverStats = DriverStats()
+        self._last_frame: Optional[bytes] = None
+        self._last_write: float = 0.0
+        self._last_stats_log: float = time.monotonic()
+        # Latência de cada escrita HID (exportada em metrics.py)
+        self.write_latency: Histogram = Histogram()
+        # Sinalizado após o primeiro quadro escrito (perfil de inicialização)
+        self.first_frame: threading.Event = threading.Event()
+
+        # Reconexão orientada a eventos
+        self.hotplug: Optional["HotplugMonitor"] = None
+        self._hotplug_checked: bool = False
+        self._backoff: float = RECONNECT_BACKOFF_MIN
+        self._absent: bool = False
+        self._connected_once: bool = False
         
         logger.info(f"Driver inicializado para produto 0x{product_id:04x}, sensor: {sensor}")
 
     def _connect(self) -> bool:
         """
-        Tenta conectar ao dispositivo HID.
+        Tenta conectar ao dispositivo HID pelo backend de transporte.
         
         Returns:
             True se conectado com sucesso
         """
+        info: Optional[DeviceInfo] = self.device_info
         try:
-            self.device = hid.device()
-            self.device.open(VENDOR_ID, self.product_id)
-            self.device.set_nonblocking(1)
+            self.transport.open(info, self.product_id)
+            self.device = self.transport
             
             # Enviar pacote de inicialização
-            init_packet: list[int] = build_packet(mode="start")
+            init_packet: bytes = build_packet(mode="start")
             self.device.write(init_packet)
+            self._last_frame = None
             
-            logger.info(f"Conectado ao dispositivo 0x{VENDOR_ID:04x}:0x{self.product_id:04x}")
+            logger.info(
+                f"Conectado ao dispositivo 0x{VENDOR_ID:04x}:0x{self.product_id:04x}"
+                + (f" ({info.hidraw_path or info.serial})" if info else "")
+            )
             self.signals.connection_changed.emit(True)
             return True
             
-        except hid.HIDException as e:
+        except TransportError as e:
             logger.error(f"Erro HID ao conectar: {e}")
             self.device = None
             self.signals.connection_changed.emit(False)
@@ -95,6 +163,85 @@ class DeepCoolDriver(threading.Thread):
             self.signals.error_occurred.emit(f"Erro ao conectar: {e}")
             return False
 
+    def _find_device(self) -> Optional[DeviceInfo]:
+        """
+        Localiza este dispositivo na enumeração atual.
+
+        O nó hidraw muda a cada reconexão, então a busca é pelo serial e,
+        entre dispositivos iguais, pela mesma porta USB. Outra porta só é
+        aceita quando não há ambiguidade (um único candidato).
+
+        Returns:
+            Dispositivo encontrado ou None
+        """
+        candidates: List[DeviceInfo] = [
+            info for info in self.transport.enumerate()
+            if info.product_id == self.product_id
+        ]
+        known: Optional[DeviceInfo] = self.device_info
+        if known is None:
+            return candidates[0] if candidates else None
+
+        if known.serial:
+            candidates = [c for c in candidates if c.serial == known.serial]
+        same_port = [c for c in candidates if c.sysfs_path == known.sysfs_path]
+        if same_port:
+            return same_port[0]
+        return candidates[0] if len(candidates) == 1 else None
+
+    def _device_present(self) -> bool:
+        """
+        Verifica se o dispositivo está enumerado (atualizando o nó hidraw).
+
+        Returns:
+            True se presente
+        """
+        found: Optional[DeviceInfo] = self._find_device()
+        if found is not None and self.device_info is not None:
+            self.device_info = found
+        return found is not None
+
+    def _ensure_hotplug(self) -> None:
+        """Abre o monitor de hotplug enquanto o dispositivo está ausente."""
+        if not self._hotplug_checked:
+            self._hotplug_checked = True
+            from .hotplug import HotplugMonitor
+            self.hotplug = HotplugMonitor.create()
+
+    def _close_hotplug(self) -> None:
+        """
+        Fecha o monitor de hotplug (reaberto na próxima ausência).
+
+        Conectado, o monitor não é lido; aberto, o socket netlink
+        acumularia todos os uevents do sistema.
+        """
+        monitor: Optional["HotplugMonitor"] = self.hotplug
+        self.hotplug = None
+        self._hotplug_checked = False
+        if monitor is not None:
+            monitor.close()
+
+    def _reconnect_delay(self) -> float:
+        """
+        Decide quanto esperar antes de tentar conectar de novo.
+
+        Returns:
+            WAIT_HOTPLUG se o dispositivo está ausente e há monitor de
+            hotplug; caso contrário, o próximo passo do backoff exponencial
+        """
+        if not self._device_present():
+            if not self._absent:
+                self._absent = True
+                logger.info("Dispositivo ausente, aguardando hotplug...")
+                self.signals.connection_changed.emit(False)
+            if self.hotplug is not None:
+                return WAIT_HOTPLUG
+            return RECONNECT_POLL
+
+        delay: float = self._backoff
+        self._backoff = min(self._backoff * 2, RECONNECT_BACKOFF_MAX)
+        return delay
+
     def _disconnect(self) -> None:
         """Desconecta do dispositivo."""
         if self.device:
@@ -105,10 +252,15 @@ class DeepCoolDriver(threading.Thread):
                 logger.warning(f"Erro ao desconectar dispositivo: {e}")
             finally:
                 self.device = None
+                self._last_frame = None
 
     def _is_alarm_active(self, temp_c: float) -> bool:
         """
         Verifica se o alarme deve ser ativado.
+
+        Liga em ``alarm_temp`` e só desliga abaixo de
+        ``alarm_temp - alarm_hysteresis``, depois de pelo menos
+        ``alarm_hold`` segundos ligado (o pisca não alterna perto do limite).
         
         Args:
             temp_c: Temperatura em Celsius
@@ -116,138 +268,372 @@ class DeepCoolDriver(threading.Thread):
         Returns:
             True se alarme deve ser ativado
         """
-        return self.alarm_enabled and temp_c >= self.alarm_temp
+        if not self.alarm_enabled:
+            self._alarm.reset()
+            return False
+        return self._alarm.update(
+            temp_c, self.alarm_temp, self.alarm_hysteresis, self.alarm_hold,
+            time.monotonic(),
+        )
 
-    def _send(self, value: int, mode: DisplayMode) -> None:
+    @property
+    def alarm_active(self) -> bool:
+        """Estado atual do alarme (após histerese)."""
+        return self.alarm_enabled and self._alarm.active
+
+    def _displayed(self, value: float, mode: DisplayMode) -> int:
+        """
+        Aplica a histerese de exibição da página.
+
+        Args:
+            value: Valor na unidade da tela
+            mode: Modo do quadro (cada unidade tem seu próprio estado)
+
+        Returns:
+            Número a exibir
+        """
+        page: str = "util" if mode == "util" else "temp"
+        shown: Optional[DisplayHysteresis] = self._shown.get(mode)
+        if shown is None:
+            shown = self._shown[mode] = DisplayHysteresis()
+        return shown.update(value, self.display_hysteresis.get(page, 0))
+
+    def _send(self, value: int, mode: DisplayMode, snapshot: TelemetrySnapshot) -> None:
         """
         Envia pacote para o dispositivo.
+
+        Um quadro idêntico ao último escrito não é reenviado, exceto
+        quando ``keepalive_interval`` segundos se passaram desde a última
+        escrita (para o firmware não expirar).
         
         Args:
             value: Valor a ser exibido
             mode: Modo de exibição
+            snapshot: Leituras do ciclo atual (usadas na decisão do alarme)
             
         Raises:
-            hid.HIDException: Erro de comunicação HID
+            TransportError: Erro de comunicação HID
             OSError: Erro de I/O
         """
         try:
-            temp_c: float = get_temperature(self.sensor)
-            alarm: bool = self._is_alarm_active(temp_c) if mode != "util" else False
-            data: list[int] = build_packet(value=value, mode=mode, alarm=alarm)
+            alarm: bool = (
+                self._is_alarm_active(snapshot.temperature)
+                if mode != "util" else False
+            )
+            data: bytes = build_packet(value=value, mode=mode, alarm=alarm)
             
             if self.device is None:
                 raise IOError("Dispositivo não conectado")
+
+            now: float = time.monotonic()
+            if (data == self._last_frame
+                    and now - self._last_write < self.keepalive_interval):
+                self.stats.frames_suppressed += 1
+                logger.debug(f"Quadro repetido suprimido: mode={mode}, value={value}")
+                self._log_stats(now)
+                return
             
-            self.device.set_nonblocking(1)
+            write_start: float = time.perf_counter()
             bytes_written: int = self.device.write(data)
+            self.write_latency.observe(time.perf_counter() - write_start)
             
             if bytes_written == 0:
                 logger.warning("Nenhum byte escrito no dispositivo")
                 raise IOError("Falha ao escrever no dispositivo HID")
-                
+
+            self._last_frame = data
+            self._last_write = now
+            self.stats.frames_written += 1
+            if self.stats.frames_written == 1:
+                self.first_frame.set()
             logger.debug(f"Pacote enviado: mode={mode}, value={value}, alarm={alarm}")
+            self._log_stats(now)
             
-        except hid.HIDException as e:
+        except TransportError as e:
             logger.error(f"Erro HID ao enviar dados: {e}")
             raise
         except OSError as e:
             logger.error(f"Erro de I/O ao enviar dados: {e}")
             raise
-        except RuntimeError as e:
-            logger.error(f"Erro ao ler sensor: {e}")
-            raise
 
-    def _cycle_temp(self) -> None:
+    def _log_stats(self, now: float) -> None:
+        """
+        Registra periodicamente os contadores de escrita no log.
+
+        Args:
+            now: Relógio monotônico atual
+        """
+        if now - self._last_stats_log < STATS_LOG_INTERVAL:
+            return
+        self._last_stats_log = now
+        sched = self.scheduler.get_stats()
+        logger.info(
+            f"Quadros escritos: {self.stats.frames_written}, "
+            f"suprimidos: {self.stats.frames_suppressed}, "
+            f"overruns: {sched['overruns']}, "
+            f"jitter médio/máx: {sched['mean_jitter'] * 1000:.1f}/"
+            f"{sched['max_jitter'] * 1000:.1f} ms"
+        )
+        if self.sampling == SAMPLING_ADAPTIVE:
+            rate = self.rate.get_stats()
+            logger.info(
+                "Amostragem adaptativa (despertares/h): " + ", ".join(
+                    f"{regime} {rate[f'{regime}_per_hour']:.0f} "
+                    f"({rate[f'{regime}_seconds'] / 60:.0f} min)"
+                    for regime in AdaptiveRate.REGIMES
+                )
+            )
+
+    def _sample(self) -> TelemetrySnapshot:
         """
-        Envia temperatura e emite status.
+        Obtém o snapshot do ciclo no amostrador compartilhado.
+
+        Um snapshot mais novo que 90% do menor período de exibição (ou do
+        período adaptativo) é reaproveitado, então vários drivers no mesmo
+        ritmo leem os sensores uma única vez por período, qualquer que seja
+        a defasagem entre eles.
+
+        Returns:
+            Snapshot do ciclo
+        """
+        if self.sampling == SAMPLING_ADAPTIVE:
+            return self.sampler.latest(self.rate.interval * 0.9)
+        return self.sampler.latest(min(self.page_dwell.values()) * 0.9)
+
+    def _cycle_temp(self) -> TelemetrySnapshot:
+        """
+        Amostra sensores, envia temperatura e emite status.
+
+        Returns:
+            Snapshot usado no ciclo
         
         Raises:
             RuntimeError: Erro ao ler sensores
-            hid.HIDException: Erro de comunicação HID
+            TransportError: Erro de comunicação HID
         """
-        temp_c: float = get_temperature(self.sensor)
-        usage: int = get_cpu_usage()
-        temp_display, _ = format_temperature(temp_c, self.temp_unit)
-        mode: DisplayMode = "temp_c" if self.temp_unit == "C" else "temp_f"
-        
-        self._send(temp_display, mode)
-        self.signals.status_updated.emit("temp", temp_c, usage)
+        snapshot: TelemetrySnapshot = self._sample()
+        if self.temp_unit == "C":
+            mode: DisplayMode = "temp_c"
+            value: float = snapshot.temperature
+        else:
+            mode = "temp_f"
+            value = snapshot.temperature * 9 / 5 + 32
 
-    def _cycle_util(self) -> None:
+        self._send(self._displayed(value, mode), mode, snapshot)
+        self.signals.status_updated.emit("temp", snapshot)
+        return snapshot
+
+    def _cycle_util(self) -> TelemetrySnapshot:
         """
-        Envia uso de CPU e emite status.
+        Amostra sensores, envia uso de CPU e emite status.
+
+        Returns:
+            Snapshot usado no ciclo
         
         Raises:
             RuntimeError: Erro ao ler sensores
-            hid.HIDException: Erro de comunicação HID
+            TransportError: Erro de comunicação HID
         """
-        temp_c: float = get_temperature(self.sensor)
-        usage: int = get_cpu_usage()
+        snapshot: TelemetrySnapshot = self._sample()
         
-        self._send(usage, "util")
-        self.signals.status_updated.emit("util", temp_c, usage)
+        self._send(self._displayed(snapshot.cpu_usage, "util"), "util", snapshot)
+        self.signals.status_updated.emit("util", snapshot)
+        return snapshot
+
+    def _current_page(self) -> str:
+        """
+        Retorna a página a exibir no ciclo atual.
+
+        Returns:
+            "temp" ou "util"
+        """
+        if self.display_mode in ("temp", "util"):
+            return self.display_mode
+        return self._auto_page
+
+    def advance_page(self) -> None:
+        """Alterna a página do modo automático."""
+        if self.display_mode not in ("temp", "util"):
+            self._auto_page = "util" if self._auto_page == "temp" else "temp"
+
+    def _tick(self) -> float:
+        """
+        Executa um ciclo de exibição da página atual.
+
+        Returns:
+            Tempo de permanência da página (segundos)
+
+        Raises:
+            RuntimeError: Erro ao ler sensores
+            TransportError: Erro de comunicação HID
+        """
+        page: str = self._current_page()
+        if page == "temp":
+            snapshot: TelemetrySnapshot = self._cycle_temp()
+        else:
+            snapshot = self._cycle_util()
+        dwell: float = self.page_dwell.get(page, INTERVAL)
+        if self.sampling != SAMPLING_ADAPTIVE:
+            return dwell
+        interval: float = self.rate.update(snapshot)
+        # No modo automático as páginas continuam alternando no tempo de
+        # permanência; só as leituras de sensores seguem o período adaptativo
+        if self.display_mode not in ("temp", "util"):
+            return dwell
+        return min(interval, self.keepalive_interval)
+
+    def _sleep(self, seconds: float) -> None:
+        """
+        Espera interrompível (por ``wake()`` ou ``stop()``).
+
+        Args:
+            seconds: Tempo máximo de espera
+        """
+        if self.scheduler.wake_event.wait(seconds):
+            self.scheduler.wake_event.clear()
+
+    def step(self) -> Optional[float]:
+        """
+        Executa uma etapa do loop: conecta se preciso ou exibe a página atual.
+
+        Returns:
+            None se um ciclo foi exibido e agendado em ``self.scheduler``;
+            caso contrário, segundos a esperar antes da próxima etapa
+            (reconexão ou erro)
+        """
+        try:
+            # Tentar conectar se desconectado. O monitor de hotplug só é
+            # aberto quando o dispositivo está ausente; a presença é conferida
+            # de novo depois de abri-lo para não perder um evento no meio
+            if self.device is None:
+                if not self._device_present():
+                    self._ensure_hotplug()
+                    if not self._device_present():
+                        return self._reconnect_delay()
+                if not self._connect():
+                    delay: float = self._reconnect_delay()
+                    logger.debug(f"Aguardando {delay:.2f}s para tentar reconectar...")
+                    return delay
+                if self._connected_once:
+                    self.stats.reconnects += 1
+                self._connected_once = True
+                self._close_hotplug()
+                self._absent = False
+                self._backoff = RECONNECT_BACKOFF_MIN
+                self.scheduler.reset()
+
+            dwell: float = self._tick()
+            self.scheduler.schedule(dwell)
+            return None
+
+        except OSError as e:
+            logger.error(f"Erro de comunicação com dispositivo: {e}")
+            self._disconnect()
+            self.signals.connection_changed.emit(False)
+            self.signals.error_occurred.emit("Dispositivo desconectado")
+            return RECONNECT_BACKOFF_MIN
+
+        except RuntimeError as e:
+            logger.error(f"Erro ao ler sensores: {e}")
+            # Não desconecta, apenas aguarda antes de tentar novamente
+            return INTERVAL
+
+        except Exception as e:
+            logger.error(f"Erro inesperado no loop do driver: {e}", exc_info=True)
+            self._disconnect()
+            self.signals.connection_changed.emit(False)
+            return self._reconnect_delay()
 
     def run(self) -> None:
         """Loop principal do driver."""
         logger.info("Thread do driver iniciada")
-        
-        # Inicializar leitura de CPU
-        try:
-            psutil.cpu_percent()
-            time.sleep(0.5)
-        except Exception as e:
-            logger.error(f"Erro ao inicializar leitura de CPU: {e}")
+        self._listen_virtual(True)
 
         while self.running:
-            try:
-                # Tentar conectar se desconectado
-                if self.device is None:
-                    if not self._connect():
-                        logger.debug("Aguardando para tentar reconectar...")
-                        time.sleep(3)
-                        continue
-
-                # Executar ciclo de acordo com o modo
-                if self.display_mode == "temp":
-                    self._cycle_temp()
-                    time.sleep(INTERVAL)
-
-                elif self.display_mode == "util":
-                    self._cycle_util()
-                    time.sleep(INTERVAL)
-
-                else:  # auto
-                    self._cycle_temp()
-                    time.sleep(INTERVAL)
-                    if not self.running:
-                        break
-                    self._cycle_util()
-                    time.sleep(INTERVAL)
-
-            except (hid.HIDException, OSError) as e:
-                logger.error(f"Erro de comunicação com dispositivo: {e}")
-                self._disconnect()
-                self.signals.connection_changed.emit(False)
-                self.signals.error_occurred.emit("Dispositivo desconectado")
-                time.sleep(3)
-                
-            except RuntimeError as e:
-                logger.error(f"Erro ao ler sensores: {e}")
-                # Não desconecta, apenas aguarda antes de tentar novamente
-                time.sleep(INTERVAL)
-                
-            except Exception as e:
-                logger.error(f"Erro inesperado no loop do driver: {e}", exc_info=True)
-                self._disconnect()
-                self.signals.connection_changed.emit(False)
-                time.sleep(3)
-        
+            delay: Optional[float] = self.step()
+            if delay == WAIT_HOTPLUG:
+                self._wait_hotplug()
+            elif delay is not None:
+                self._sleep(delay)
+            # Ao acordar por mudança de configuração, a mesma página é
+            # redesenhada imediatamente; no deadline, avança a página
+            elif not self.scheduler.wait():
+                self.advance_page()
+
+        self._close_hotplug()
+        self._listen_virtual(False)
         logger.info("Thread do driver encerrada")
 
+    def _wait_hotplug(self) -> None:
+        """Bloqueia até um evento hidraw ou ``wake()`` (sem polling)."""
+        if self.hotplug is None:
+            self._sleep(RECONNECT_POLL)
+            return
+        try:
+            if self.hotplug.wait():
+                logger.info("Evento de hotplug recebido, tentando conectar")
+        except OSError as e:
+            logger.warning(f"Falha no monitor de hotplug, usando polling: {e}")
+            self._close_hotplug()
+            self._sleep(RECONNECT_POLL)
+            return
+        self.scheduler.wake_event.clear()
+
+    def wake(self) -> None:
+        """Acorda o loop para aplicar mudanças imediatamente."""
+        self.scheduler.wake()
+        if self.hotplug is not None:
+            self.hotplug.interrupt()
+        for callback in self._wake_callbacks:
+            callback()
+
+    def _listen_virtual(self, listen: bool) -> None:
+        """
+        Liga ou desliga o despertar por plug/unplug do dispositivo virtual.
+
+        O dispositivo virtual não gera eventos de hotplug; sem o ouvinte,
+        a reconexão só aconteceria no polling.
+
+        Args:
+            listen: True para registrar ``wake``, False para remover
+        """
+        if self.transport.name != TRANSPORT_VIRTUAL:
+            return
+        device = self.transport.virtual_device
+        if listen:
+            device.add_listener(self.wake)
+        else:
+            device.remove_listener(self.wake)
+
+    def add_wake_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Registra uma função chamada a cada ``wake()``.
+
+        Usado por motores que não esperam no ``threading.Event`` do
+        agendador (ex: asyncio).
+
+        Args:
+            callback: Função sem argumentos (deve ser thread-safe)
+        """
+        self._wake_callbacks.append(callback)
+
+    def remove_wake_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Remove uma função registrada com ``add_wake_callback`` (se houver).
+
+        Args:
+            callback: Função registrada
+        """
+        try:
+            self._wake_callbacks.remove(callback)
+        except ValueError:
+            pass
+
     def stop(self) -> None:
         """Para o driver e desconecta."""
         logger.info("Parando driver...")
         self.running = False
+        self.wake()
         self._disconnect()
 
     def get_settings(self) -> Dict[str, Any]:
@@ -262,6 +648,12 @@ class DeepCoolDriver(threading.Thread):
             'temp_unit': self.temp_unit,
             'alarm_enabled': self.alarm_enabled,
             'alarm_temp': self.alarm_temp,
+            'keepalive_interval': self.keepalive_interval,
+            'page_dwell': dict(self.page_dwell),
+            'display_hysteresis': dict(self.display_hysteresis),
+            'alarm_hysteresis': self.alarm_hysteresis,
+            'alarm_hold': self.alarm_hold,
+            'sampling': self.sampling,
         }
 
     def apply_settings(self, settings: Dict[str, Any]) -> None:
@@ -275,5 +667,37 @@ class DeepCoolDriver(threading.Thread):
         self.temp_unit = settings.get('temp_unit', 'C')
         self.alarm_enabled = settings.get('alarm_enabled', False)
         self.alarm_temp = settings.get('alarm_temp', 80)
+        self.keepalive_interval = settings.get('keepalive_interval', KEEPALIVE_INTERVAL)
+        self.page_dwell = dict(settings.get('page_dwell', PAGE_DWELL))
+        self.display_hysteresis = dict(settings.get('display_hysteresis', DISPLAY_HYSTERESIS))
+        self.alarm_hysteresis = settings.get('alarm_hysteresis', ALARM_HYSTERESIS)
+        self.alarm_hold = settings.get('alarm_hold', ALARM_HOLD)
+        self.sampling = settings.get('sampling', SAMPLING_FIXED)
+        self.wake()
         
         logger.info(f"Configurações aplicadas: {settings}")
+
+    def update_settings(self, **changes: Any) -> None:
+        """
+        Altera configurações e acorda o loop para aplicá-las na hora.
+
+        Args:
+            **changes: Atributos a alterar (display_mode, temp_unit,
+                alarm_enabled, alarm_temp, ...)
+        """
+        for key, value in changes.items():
+            setattr(self, key, value)
+        self.wake()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores de escrita e de pontualidade do agendador.
+
+        Returns:
+            Dicionário com os contadores
+        """
+        stats: Dict[str, Any] = asdict(self.stats)
+        stats.update(self.scheduler.get_stats())
+        if self.sampling == SAMPLING_ADAPTIVE:
+            stats['sampling'] = self.rate.get_stats()
+        return stats
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+Dispositivo DeepCool virtual - emula o display sem hardware.
+
+Cada relatório de 64 bytes escrito é validado e decodificado com
+``decode_packet`` e vira o estado do display virtual (modo, dígitos,
+barra e alarme). O dispositivo mantém contadores, pode simular latência
+e falhas de escrita e pode ser "desconectado" e "reconectado", o que
+permite medir a vazão do driver e o comportamento de reconexão sem USB.
+
+Uso:
+    device = VirtualDeepCoolDevice()
+    driver = DeepCoolDriver(signals, device.product_id, sensor,
+                            device_info=device.info,
+                            transport=VirtualTransport(device))
+    # O driver se registra como ouvinte: plug/unplug o acordam
+"""
+
+import time
+import errno
+import random
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional, Tuple
+
+from .config import VENDOR_ID
+from .hardware import DeviceInfo
+from .protocol import DecodedPacket, DisplayMode, decode_packet
+from .transport import HidTransport, TransportError, TRANSPORT_VIRTUAL
+
+logger = logging.getLogger(__name__)
+
+# Quantidade de relatórios mantidos no histórico
+HISTORY_SIZE: int = 1024
+
+
+@dataclass(frozen=True)
+class DisplayState:
+    """
+    Estado visível do display virtual.
+
+    Attributes:
+        initialized: True após o pacote de inicialização
+        mode: Modo exibido (None antes do primeiro valor)
+        value: Valor numérico (0-999)
+        digits: Dígitos (centena, dezena, unidade)
+        bar: Nível da barra do topo (0-10)
+        alarm: True se o display está piscando
+    """
+    initialized: bool = False
+    mode: Optional[DisplayMode] = None
+    value: int = 0
+    digits: Tuple[int, int, int] = (0, 0, 0)
+    bar: int = 0
+    alarm: bool = False
+
+    def render(self) -> str:
+        """
+        Texto como aparece no display (zeros à esquerda ficam vazios).
+
+        Returns:
+            Ex: " 45°C", "  7%", " 45°C!" (alarme piscando)
+        """
+        if self.mode is None:
+            return "---"
+        hundreds, tens, units = self.digits
+        text: str = (
+            (str(hundreds) if hundreds else " ")
+            + (str(tens) if hundreds or tens else " ")
+            + str(units)
+        )
+        suffix: str = {"temp_c": "°C", "temp_f": "°F", "util": "%"}[self.mode]
+        return text + suffix + ("!" if self.alarm else "")
+
+
+@dataclass
+class EmulatorStats:
+    """Contadores do dispositivo virtual."""
+    reports: int = 0
+    init_reports: int = 0
+    invalid_reports: int = 0
+    injected_failures: int = 0
+    opens: int = 0
+    bytes_received: int = 0
+    first_report: float = 0.0
+    last_report: float = 0.0
+
+    def throughput(self) -> float:
+        """
+        Relatórios válidos por segundo entre o primeiro e o último.
+
+        Returns:
+            Taxa de relatórios (0 se houver menos de dois)
+        """
+        elapsed: float = self.last_report - self.first_report
+        if self.reports < 2 or elapsed <= 0:
+            return 0.0
+        return (self.reports - 1) / elapsed
+
+
+class VirtualDeepCoolDevice:
+    """Cooler DeepCool emulado em memória."""
+
+    def __init__(self, product_id: int = 0x0001, serial: str = "VIRTUAL",
+                 latency: float = 0.0, failure_rate: float = 0.0,
+                 strict: bool = True, seed: Optional[int] = None,
+                 history: int = HISTORY_SIZE):
+        """
+        Cria o dispositivo (conectado).
+
+        Args:
+            product_id: Product ID anunciado
+            serial: Número de série anunciado
+            latency: Atraso simulado por escrita (segundos)
+            failure_rate: Probabilidade (0-1) de uma escrita falhar
+            strict: Se True, relatórios inválidos geram erro de escrita
+            seed: Semente do gerador de falhas (reprodutível)
+            history: Relatórios mantidos em ``self.history`` (0 = nenhum)
+        """
+        self.product_id: int = product_id
+        self.serial: str = serial
+        self.latency: float = latency
+        self.failure_rate: float = failure_rate
+        self.strict: bool = strict
+        self.present: bool = True
+
+        self.state: DisplayState = DisplayState()
+        self.stats: EmulatorStats = EmulatorStats()
+        self.history: Deque[Tuple[float, DecodedPacket]] = deque(maxlen=history)
+
+        self._random: random.Random = random.Random(seed)
+        self._fail_next: int = 0
+        self._open_count: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def info(self) -> DeviceInfo:
+        """Descrição do dispositivo, como retornada pela enumeração."""
+        return DeviceInfo(
+            vendor_id=VENDOR_ID,
+            product_id=self.product_id,
+            hidraw_path=None,
+            serial=self.serial,
+            interface=0,
+            sysfs_path=f"virtual/{self.serial}",
+        )
+
+    # ── Controle do teste ──
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Registra uma função chamada em ``plug()``/``unplug()``.
+
+        Args:
+            callback: Função sem argumentos (ex: ``driver.wake``)
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Remove uma função registrada com ``add_listener`` (se houver).
+
+        Args:
+            callback: Função registrada
+        """
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify(self) -> None:
+        """Avisa os ouvintes de uma mudança de presença."""
+        for callback in self._listeners:
+            callback()
+
+    def unplug(self) -> None:
+        """Simula a remoção do cabo USB."""
+        with self._lock:
+            self.present = False
+            self.state = DisplayState()
+        logger.info(f"Dispositivo virtual {self.serial} removido")
+        self._notify()
+
+    def plug(self) -> None:
+        """Simula a reconexão do cabo USB."""
+        with self._lock:
+            self.present = True
+        logger.info(f"Dispositivo virtual {self.serial} conectado")
+        self._notify()
+
+    def fail_next(self, count: int = 1) -> None:
+        """
+        Faz as próximas ``count`` escritas falharem.
+
+        Args:
+            count: Número de escritas a falhar
+        """
+        with self._lock:
+            self._fail_next += count
+
+    # ── Lado do transporte ──
+
+    def open(self) -> None:
+        """
+        Abre o dispositivo.
+
+        Raises:
+            TransportError: Se o dispositivo estiver desconectado
+        """
+        with self._lock:
+            if not self.present:
+                raise TransportError(errno.ENODEV, f"Dispositivo virtual {self.serial} ausente")
+            self._open_count += 1
+            self.stats.opens += 1
+
+    def close(self) -> None:
+        """Fecha uma abertura do dispositivo."""
+        with self._lock:
+            self._open_count = max(0, self._open_count - 1)
+
+    def handle_report(self, data: bytes) -> int:
+        """
+        Recebe um relatório HID e atualiza o display.
+
+        Args:
+            data: Relatório de 64 bytes
+
+        Returns:
+            Número de bytes aceitos
+
+        Raises:
+            TransportError: Dispositivo ausente, falha injetada ou
+                relatório inválido (modo estrito)
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        with self._lock:
+            if not self.present:
+                raise TransportError(errno.ENODEV, f"Dispositivo virtual {self.serial} ausente")
+            if self._fail_next > 0 or (
+                self.failure_rate > 0 and self._random.random() < self.failure_rate
+            ):
+                self._fail_next = max(0, self._fail_next - 1)
+                self.stats.injected_failures += 1
+                raise TransportError(errno.EIO, "Falha de escrita simulada")
+
+            try:
+                packet: DecodedPacket = decode_packet(bytes(data))
+            except ValueError as e:
+                self.stats.invalid_reports += 1
+                logger.warning(f"Relatório inválido no dispositivo virtual: {e}")
+                if self.strict:
+                    raise TransportError(errno.EINVAL, f"Relatório inválido: {e}") from e
+                return len(data)
+
+            now: float = time.monotonic()
+            if self.stats.reports == 0:
+                self.stats.first_report = now
+            self.stats.reports += 1
+            self.stats.last_report = now
+            self.stats.bytes_received += len(data)
+            self.history.append((now, packet))
+
+            if packet.mode == "start":
+                self.stats.init_reports += 1
+                self.state = DisplayState(initialized=True)
+            else:
+                self.state = DisplayState(
+                    initialized=self.state.initialized,
+                    mode=packet.mode,
+                    value=packet.value,
+                    digits=packet.digits,
+                    bar=packet.bar,
+                    alarm=packet.alarm,
+                )
+            return len(data)
+
+
+class VirtualTransport(HidTransport):
+    """Transporte que entrega os relatórios a um ``VirtualDeepCoolDevice``."""
+
+    name: str = TRANSPORT_VIRTUAL
+
+    def __init__(self, device: VirtualDeepCoolDevice):
+        """
+        Inicializa o transporte.
+
+        Args:
+            device: Dispositivo virtual de destino
+        """
+        self.virtual_device: VirtualDeepCoolDevice = device
+        self._open: bool = False
+
+    def enumerate(self) -> List[DeviceInfo]:
+        """
+        Lista o dispositivo virtual, se ele estiver conectado.
+
+        Returns:
+            Lista com o dispositivo virtual, ou vazia
+        """
+        return [self.virtual_device.info] if self.virtual_device.present else []
+
+    def open(self, info: Optional[DeviceInfo], product_id: int) -> None:
+        """
+        Abre o dispositivo virtual (``info`` e ``product_id`` são ignorados).
+
+        Args:
+            info: Dispositivo específico (ignorado)
+            product_id: Product ID do dispositivo USB (ignorado)
+
+        Raises:
+            TransportError: Se o dispositivo virtual estiver desconectado
+        """
+        self.close()
+        self.virtual_device.open()
+        self._open = True
+
+    def write(self, data: bytes) -> int:
+        """
+        Entrega o relatório ao dispositivo virtual.
+
+        Args:
+            data: Relatório completo (o byte 0 é o report ID)
+
+        Returns:
+            Número de bytes escritos
+
+        Raises:
+            TransportError: Dispositivo não aberto, desconectado ou falha
+                simulada
+        """
+        if not self._open:
+            raise TransportError(errno.EBADF, "Dispositivo virtual não aberto")
+        return self.virtual_device.handle_report(data)
+
+    def close(self) -> None:
+        """Fecha o dispositivo virtual (idempotente)."""
+        if self._open:
+            self._open = False
+            self.virtual_device.close()
+
+
+_default_device: Optional[VirtualDeepCoolDevice] = None
+
+
+def default_device() -> VirtualDeepCoolDevice:
+    """
+    Dispositivo virtual compartilhado usado por ``--transport virtual``.
+
+    Returns:
+        Instância única criada sob demanda
+    """
+    global _default_device
+    if _default_device is None:
+        _default_device = VirtualDeepCoolDevice()
+    return _default_device
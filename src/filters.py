@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Filtros entre a amostragem e o quadro HID.
+
+- Suavização da temperatura (EMA ou mediana das últimas N leituras),
+  aplicada uma vez por snapshot no amostrador compartilhado.
+- Histerese de exibição: o número mostrado só muda quando o valor se
+  afasta pelo menos ``step`` unidades do que está na tela.
+- Alarme com limiares separados (liga em ``alarm_temp``, desliga abaixo de
+  ``alarm_temp - hysteresis``) e tempo mínimo em cada estado.
+
+Com leituras calmas, quadros consecutivos ficam idênticos e são suprimidos
+pelo driver (menos escritas USB e menos atualizações da interface).
+"""
+
+import math
+import logging
+from collections import deque
+from typing import Deque, Dict, Optional, Type
+
+from .config import TEMP_EMA_ALPHA, TEMP_MEDIAN_WINDOW
+
+logger = logging.getLogger(__name__)
+
+SMOOTHING_NONE: str = "none"
+SMOOTHING_EMA: str = "ema"
+SMOOTHING_MEDIAN: str = "median"
+
+
+class Smoother:
+    """Suavização sem efeito (repassa a leitura)."""
+
+    name: str = SMOOTHING_NONE
+
+    def update(self, value: float) -> float:
+        """
+        Incorpora uma leitura.
+
+        Args:
+            value: Leitura bruta
+
+        Returns:
+            Valor suavizado
+        """
+        return value
+
+    def reset(self) -> None:
+        """Descarta o estado acumulado."""
+
+
+class EmaSmoother(Smoother):
+    """Média móvel exponencial."""
+
+    name = SMOOTHING_EMA
+
+    def __init__(self, alpha: float = TEMP_EMA_ALPHA):
+        """
+        Inicializa o filtro.
+
+        Args:
+            alpha: Peso da leitura nova (0-1; menor = mais suave)
+        """
+        self.alpha: float = alpha
+        self._value: Optional[float] = None
+
+    def update(self, value: float) -> float:
+        """Incorpora uma leitura e retorna a média."""
+        if self._value is None:
+            self._value = value
+        else:
+            self._value += self.alpha * (value - self._value)
+        return self._value
+
+    def reset(self) -> None:
+        """Descarta a média."""
+        self._value = None
+
+
+class MedianSmoother(Smoother):
+    """Mediana das últimas N leituras (descarta picos isolados)."""
+
+    name = SMOOTHING_MEDIAN
+
+    def __init__(self, window: int = TEMP_MEDIAN_WINDOW):
+        """
+        Inicializa o filtro.
+
+        Args:
+            window: Número de leituras consideradas
+        """
+        self._values: Deque[float] = deque(maxlen=window)
+
+    def update(self, value: float) -> float:
+        """Incorpora uma leitura e retorna a mediana da janela."""
+        self._values.append(value)
+        ordered = sorted(self._values)
+        middle: int = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    def reset(self) -> None:
+        """Descarta a janela."""
+        self._values.clear()
+
+
+SMOOTHERS: Dict[str, Type[Smoother]] = {
+    SMOOTHING_NONE: Smoother,
+    SMOOTHING_EMA: EmaSmoother,
+    SMOOTHING_MEDIAN: MedianSmoother,
+}
+
+
+def create_smoother(name: str) -> Smoother:
+    """
+    Cria o filtro de suavização pelo nome.
+
+    Args:
+        name: "none", "ema" ou "median"
+
+    Returns:
+        Filtro novo (sem suavização se o nome for desconhecido)
+    """
+    smoother_class: Optional[Type[Smoother]] = SMOOTHERS.get(name)
+    if smoother_class is None:
+        logger.warning(f"Suavização desconhecida: {name}, usando '{SMOOTHING_NONE}'")
+        smoother_class = Smoother
+    return smoother_class()
+
+
+class DisplayHysteresis:
+    """Mantém o número exibido até o valor se afastar ``step`` unidades."""
+
+    def __init__(self):
+        """Inicializa sem valor exibido."""
+        self.shown: Optional[int] = None
+
+    def update(self, value: float, step: float) -> int:
+        """
+        Decide o número a exibir.
+
+        Args:
+            value: Valor atual (unidade da tela)
+            step: Distância mínima para trocar o número (0 = só arredonda)
+
+        Returns:
+            Número a exibir
+        """
+        if self.shown is None or abs(value - self.shown) >= step:
+            self.shown = round(value)
+        return self.shown
+
+
+class AlarmDebounce:
+    """Alarme com histerese e tempo mínimo ligado."""
+
+    def __init__(self):
+        """Inicializa com o alarme desligado."""
+        self.active: bool = False
+        self._changed: float = -math.inf
+
+    def update(self, temp_c: float, threshold: float, hysteresis: float,
+               hold: float, now: float) -> bool:
+        """
+        Atualiza o estado do alarme.
+
+        Liga assim que ``temp_c >= threshold`` e desliga com
+        ``temp_c < threshold - hysteresis``, mas só depois de ficar ligado
+        por pelo menos ``hold`` segundos. O tempo mínimo nunca atrasa o
+        alarme: uma temperatura que volta ao limite logo após o alarme
+        desligar o liga de novo na hora.
+
+        Args:
+            temp_c: Temperatura (Celsius)
+            threshold: Temperatura de disparo (Celsius)
+            hysteresis: Queda necessária para desligar (Celsius)
+            hold: Tempo mínimo ligado (segundos)
+            now: Relógio monotônico atual
+
+        Returns:
+            True se o alarme está ativo
+        """
+        wanted: bool = (
+            temp_c >= threshold - hysteresis if self.active else temp_c >= threshold
+        )
+        if wanted and not self.active:
+            self.active = True
+            self._changed = now
+        elif not wanted and self.active and now - self._changed >= hold:
+            self.active = False
+        return self.active
+
+    def reset(self) -> None:
+        """Desliga o alarme imediatamente (ex.: alarme desativado no menu)."""
+        self.active = False
+        self._changed = -math.inf
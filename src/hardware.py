@@ -1,16 +1,254 @@
 # -*- coding: utf-8 -*-
 """Detecção de hardware: sensor, device USB e modelo."""
 
-import subprocess
+import os
+import glob
+import time
+import threading
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
-import psutil
-
-from .config import KNOWN_MODELS
+from .config import KNOWN_MODELS, SENSOR_RETRY_INTERVAL, VENDOR_ID
 
 logger = logging.getLogger(__name__)
 
+# Raiz do sysfs com os chips hwmon
+HWMON_ROOT: str = "/sys/class/hwmon"
+
+# Contadores de tempo de CPU do kernel
+PROC_STAT: str = "/proc/stat"
+
+# Dispositivos USB no sysfs
+USB_DEVICES_ROOT: str = "/sys/bus/usb/devices"
+
+
+@dataclass(frozen=True)
+class DeviceInfo:
+    """
+    Dispositivo DeepCool encontrado na enumeração.
+
+    Attributes:
+        vendor_id: Vendor ID USB
+        product_id: Product ID USB
+        hidraw_path: Nó /dev/hidrawN (None se não houver interface HID)
+        serial: Número de série USB (None se o firmware não informar)
+        interface: Número da interface USB do nó hidraw
+        sysfs_path: Caminho do dispositivo no sysfs (ou path do hidapi)
+    """
+    vendor_id: int
+    product_id: int
+    hidraw_path: Optional[str]
+    serial: Optional[str]
+    interface: Optional[int]
+    sysfs_path: str
+
+    @property
+    def key(self) -> str:
+        """Identificador estável para configurações por dispositivo."""
+        if self.serial:
+            return self.serial
+        return f"{self.product_id:04x}@{os.path.basename(self.sysfs_path)}"
+
+
+def _psutil_key(path: str) -> str:
+    """
+    Chave de ordenação do ``psutil.sensors_temperatures()``.
+
+    O psutil ordena os caminhos sem o sufixo (``.../hwmon3/temp1``) como
+    texto: ``temp1`` < ``temp10`` < ``temp2`` e ``hwmon10`` < ``hwmon2``.
+
+    Args:
+        path: Caminho (ex: ``.../temp10_input``)
+
+    Returns:
+        Caminho até o primeiro "_" do nome do arquivo
+    """
+    directory, name = os.path.split(path)
+    return os.path.join(directory, name.split("_")[0])
+
+
+class SensorReader:
+    """
+    Leitor persistente de um sensor de temperatura hwmon.
+
+    Resolve o chip (pelo arquivo ``name``) para um único ``temp*_input``
+    uma vez, mantém o descritor aberto e relê com ``os.pread``. A
+    resolução só é refeita quando a leitura falha, por exemplo quando o
+    índice ``hwmonN`` muda após recarregar o módulo do kernel.
+
+    A escolha do ``temp*_input`` segue a mesma ordem do
+    ``psutil.sensors_temperatures()`` (texto, não numérica; ver
+    ``_psutil_key``), de modo que o valor lido é o mesmo de
+    ``temps[sensor][0].current`` usado como alternativa.
+
+    Thread-safe: o ``Sampler`` é compartilhado entre as threads dos
+    drivers, então leitura e troca do descritor usam o mesmo lock.
+    """
+
+    def __init__(self, sensor: str, hwmon_root: str = HWMON_ROOT):
+        """
+        Inicializa o leitor (sem abrir arquivos).
+
+        Args:
+            sensor: Nome do chip hwmon (ex: "k10temp", "coretemp")
+            hwmon_root: Diretório raiz dos chips hwmon
+        """
+        self.sensor: str = sensor
+        self.hwmon_root: str = hwmon_root
+        self.path: Optional[str] = None
+        self._fd: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def _find_input(self) -> str:
+        """
+        Procura o arquivo ``temp*_input`` do chip.
+
+        Returns:
+            Caminho do arquivo de entrada de temperatura
+
+        Raises:
+            RuntimeError: Se o chip ou a entrada não forem encontrados
+        """
+        inputs: List[str] = []
+        for chip in glob.glob(os.path.join(self.hwmon_root, "hwmon*")):
+            # Alguns drivers antigos expõem os arquivos em device/
+            for base in (chip, os.path.join(chip, "device")):
+                try:
+                    with open(os.path.join(base, "name"), "r") as f:
+                        name = f.read().strip()
+                except OSError:
+                    continue
+                if name == self.sensor:
+                    inputs += glob.glob(os.path.join(base, "temp*_input"))
+
+        for path in sorted(inputs, key=_psutil_key):
+            try:
+                with open(path, "rb") as f:
+                    int(f.read().strip())
+                return path
+            except (OSError, ValueError):
+                continue
+
+        raise RuntimeError(
+            f"Sensor '{self.sensor}' não encontrado em {self.hwmon_root}"
+        )
+
+    def resolve(self) -> str:
+        """
+        Resolve o caminho do sensor e abre o descritor persistente.
+
+        Returns:
+            Caminho resolvido
+
+        Raises:
+            RuntimeError: Se o sensor não for encontrado
+        """
+        with self._lock:
+            return self._resolve_locked()
+
+    def _resolve_locked(self) -> str:
+        """Corpo de ``resolve`` (chamador deve segurar o lock)."""
+        self._close_locked()
+        path = self._find_input()
+        try:
+            self._fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError as e:
+            raise RuntimeError(f"Erro ao abrir {path}: {e}") from e
+        self.path = path
+        logger.debug(f"Sensor '{self.sensor}' resolvido para {path}")
+        return path
+
+    def read(self) -> float:
+        """
+        Lê a temperatura atual (em Celsius).
+
+        Returns:
+            Temperatura em Celsius
+
+        Raises:
+            RuntimeError: Se o sensor não puder ser lido nem re-resolvido
+        """
+        # Sob o lock: outra thread pode estar fechando este descritor, e o
+        # número poderia ser reutilizado por outro arquivo
+        with self._lock:
+            if self._fd is not None:
+                try:
+                    return int(os.pread(self._fd, 32, 0)) / 1000.0
+                except (OSError, ValueError) as e:
+                    logger.warning(
+                        f"Falha ao ler {self.path} ({e}), re-resolvendo sensor"
+                    )
+
+            self._resolve_locked()
+            try:
+                return int(os.pread(self._fd, 32, 0)) / 1000.0
+            except (OSError, ValueError, TypeError) as e:
+                raise RuntimeError(
+                    f"Erro ao ler temperatura de {self.path}: {e}"
+                ) from e
+
+    def _close_locked(self) -> None:
+        """Fecha o descritor atual (chamador deve segurar o lock)."""
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+            self.path = None
+
+    def close(self) -> None:
+        """Fecha o descritor persistente."""
+        with self._lock:
+            self._close_locked()
+
+
+# Sensores preferidos, em ordem: Intel, AMD, AMD alternativo
+PREFERRED_SENSORS: Tuple[str, ...] = ('coretemp', 'k10temp', 'zenpower')
+
+# Leitores persistentes por nome de sensor
+_readers: Dict[str, SensorReader] = {}
+# Sensores não encontrados no sysfs: relógio monotônico da próxima tentativa
+_retry_at: Dict[str, float] = {}
+_readers_lock: threading.Lock = threading.Lock()
+
+
+def get_sensor_reader(sensor: str) -> Optional[SensorReader]:
+    """
+    Retorna (criando e resolvendo se preciso) o leitor hwmon do sensor.
+
+    Uma resolução que falha (ex: módulo do kernel ainda não carregado) é
+    tentada de novo a cada ``SENSOR_RETRY_INTERVAL`` segundos; até lá o
+    chamador usa o psutil.
+
+    Args:
+        sensor: Nome do sensor
+
+    Returns:
+        Leitor resolvido ou None se o sensor não existir no sysfs
+    """
+    reader: Optional[SensorReader] = _readers.get(sensor)
+    if reader is not None:
+        return reader
+
+    with _readers_lock:
+        reader = _readers.get(sensor)
+        if reader is None and time.monotonic() >= _retry_at.get(sensor, 0.0):
+            candidate: SensorReader = SensorReader(sensor)
+            try:
+                candidate.resolve()
+            except RuntimeError as e:
+                if sensor in _retry_at:
+                    logger.debug(f"Leitura direta via hwmon ainda indisponível: {e}")
+                else:
+                    logger.warning(f"Leitura direta via hwmon indisponível: {e}")
+                _retry_at[sensor] = time.monotonic() + SENSOR_RETRY_INTERVAL
+            else:
+                _readers[sensor] = reader = candidate
+                _retry_at.pop(sensor, None)
+    return reader
+
 
 def detect_sensor() -> str:
     """
@@ -22,6 +260,19 @@ def detect_sensor() -> str:
     Raises:
         RuntimeError: Se nenhum sensor válido for encontrado
     """
+    # Caminho rápido: sensores preferidos direto do hwmon, sem importar o psutil
+    for name in PREFERRED_SENSORS:
+        reader: SensorReader = SensorReader(name)
+        try:
+            reader.resolve()
+        except RuntimeError:
+            continue
+        with _readers_lock:
+            _readers.setdefault(name, reader)
+        logger.info(f"Sensor detectado: {name}")
+        return name
+
+    import psutil
     try:
         temps = psutil.sensors_temperatures()
     except AttributeError as e:
@@ -36,15 +287,17 @@ def detect_sensor() -> str:
         raise RuntimeError("Nenhum sensor de temperatura disponível no sistema")
     
     # Prioridade: Intel, AMD, AMD alternativo
-    for name in ['coretemp', 'k10temp', 'zenpower']:
+    for name in PREFERRED_SENSORS:
         if name in temps and temps[name]:
             logger.info(f"Sensor detectado: {name}")
+            get_sensor_reader(name)
             return name
     
     # Fallback: primeiro sensor válido (excluindo sensores não confiáveis)
     for name, entries in temps.items():
         if entries and name not in ['acpitz', 'nvme', 'iwlwifi']:
             logger.info(f"Sensor detectado (fallback): {name}")
+            get_sensor_reader(name)
             return name
     
     # Se chegou aqui, usa coretemp como último recurso
@@ -52,59 +305,171 @@ def detect_sensor() -> str:
     return 'coretemp'
 
 
-def detect_product_id() -> int:
+def _read_attr(path: str) -> Optional[str]:
+    """
+    Lê um atributo de texto do sysfs.
+
+    Args:
+        path: Caminho do atributo
+
+    Returns:
+        Conteúdo sem espaços nas pontas ou None se não existir
+    """
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _discover_sysfs(vendor_id: int, usb_root: str) -> List[DeviceInfo]:
+    """
+    Enumera dispositivos USB do fabricante pelo sysfs.
+
+    Args:
+        vendor_id: Vendor ID procurado
+        usb_root: Diretório com os dispositivos USB
+
+    Returns:
+        Um item por nó hidraw (ou por dispositivo sem hidraw)
+
+    Raises:
+        OSError: Se ``usb_root`` não puder ser listado
+    """
+    devices: List[DeviceInfo] = []
+    for entry in sorted(os.listdir(usb_root)):
+        # Entradas com ":" são interfaces, não dispositivos
+        if ":" in entry:
+            continue
+        dev_path: str = os.path.join(usb_root, entry)
+        vid: Optional[str] = _read_attr(os.path.join(dev_path, "idVendor"))
+        if vid is None or int(vid, 16) != vendor_id:
+            continue
+        pid_text: Optional[str] = _read_attr(os.path.join(dev_path, "idProduct"))
+        if pid_text is None:
+            continue
+        product_id: int = int(pid_text, 16)
+        serial: Optional[str] = _read_attr(os.path.join(dev_path, "serial")) or None
+
+        found: bool = False
+        for intf in sorted(glob.glob(os.path.join(dev_path, f"{entry}:*"))):
+            number: Optional[str] = _read_attr(os.path.join(intf, "bInterfaceNumber"))
+            for node in sorted(glob.glob(os.path.join(intf, "*", "hidraw", "hidraw*"))):
+                devices.append(DeviceInfo(
+                    vendor_id=vendor_id,
+                    product_id=product_id,
+                    hidraw_path=f"/dev/{os.path.basename(node)}",
+                    serial=serial,
+                    interface=int(number, 16) if number else None,
+                    sysfs_path=dev_path,
+                ))
+                found = True
+        if not found:
+            devices.append(DeviceInfo(vendor_id, product_id, None, serial, None, dev_path))
+    return devices
+
+
+def _discover_hidapi(vendor_id: int) -> List[DeviceInfo]:
+    """
+    Enumera dispositivos via ``hid.enumerate`` (quando não há sysfs).
+
+    Args:
+        vendor_id: Vendor ID procurado
+
+    Returns:
+        Dispositivos encontrados (vazio se o hidapi não estiver disponível)
+    """
+    try:
+        import hid
+        entries = hid.enumerate(vendor_id, 0)
+    except Exception as e:
+        logger.warning(f"Enumeração via hidapi indisponível: {e}")
+        return []
+
+    devices: List[DeviceInfo] = []
+    for entry in entries:
+        path = entry.get("path", b"")
+        path_text: str = path.decode(errors="replace") if isinstance(path, bytes) else str(path)
+        devices.append(DeviceInfo(
+            vendor_id=vendor_id,
+            product_id=int(entry.get("product_id", 0)),
+            hidraw_path=path_text if path_text.startswith("/dev/hidraw") else None,
+            serial=entry.get("serial_number") or None,
+            interface=entry.get("interface_number"),
+            sysfs_path=path_text,
+        ))
+    return devices
+
+
+def discover_devices(vendor_id: int = VENDOR_ID,
+                     usb_root: str = USB_DEVICES_ROOT) -> List[DeviceInfo]:
+    """
+    Enumera os dispositivos DeepCool conectados, sem processos externos.
+
+    Lê ``idVendor``/``idProduct`` em /sys/bus/usb/devices e localiza os nós
+    hidraw de cada interface; recorre ao ``hid.enumerate`` se o sysfs não
+    estiver disponível.
+
+    Args:
+        vendor_id: Vendor ID procurado
+        usb_root: Diretório com os dispositivos USB
+
+    Returns:
+        Lista de dispositivos (vazia se nenhum estiver conectado)
+    """
+    try:
+        return _discover_sysfs(vendor_id, usb_root)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Enumeração via sysfs falhou ({e}), usando hidapi")
+        return _discover_hidapi(vendor_id)
+
+
+def detect_devices() -> List[DeviceInfo]:
     """
-    Detecta o Product ID do dispositivo DeepCool via lsusb.
+    Detecta todos os dispositivos DeepCool conectados (um por USB).
     
     Returns:
-        Product ID do dispositivo (hexadecimal)
+        Dispositivos encontrados, na ordem do barramento
         
     Raises:
-        RuntimeError: Se o dispositivo não for encontrado ou ocorrer erro
+        RuntimeError: Se nenhum dispositivo for encontrado
     """
-    try:
-        result = subprocess.run(
-            ['lsusb'],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=True
+    devices: List[DeviceInfo] = []
+    seen: set = set()
+    for info in discover_devices():
+        # Um driver por dispositivo, mesmo com várias interfaces hidraw
+        if info.sysfs_path in seen:
+            continue
+        seen.add(info.sysfs_path)
+        devices.append(info)
+        logger.info(
+            f"Dispositivo DeepCool encontrado: 0x{info.product_id:04x} "
+            f"({info.hidraw_path or 'sem hidraw'}, serial: {info.serial})"
         )
-    except subprocess.TimeoutExpired as e:
-        logger.error("Timeout ao executar lsusb")
-        raise RuntimeError("Timeout ao detectar dispositivos USB") from e
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Erro ao executar lsusb: {e}")
-        raise RuntimeError("Erro ao listar dispositivos USB") from e
-    except FileNotFoundError as e:
-        logger.error("Comando lsusb não encontrado")
-        raise RuntimeError("Comando 'lsusb' não está instalado") from e
-    
-    # Procurar pelo vendor ID DeepCool
-    vendor_id_str: str = '3633'
-    for line in result.stdout.split('\n'):
-        if vendor_id_str in line.lower():
-            try:
-                # Formato: "Bus 001 Device 002: ID 3633:0004 ..."
-                id_part: str = line.split('ID ')[1].split(' ')[0]
-                vendor: str
-                product: str
-                vendor, product = id_part.split(':')
-                product_id: int = int(product, 16)
-                logger.info(f"Dispositivo DeepCool encontrado: 0x{product_id:04x}")
-                return product_id
-            except (IndexError, ValueError) as e:
-                logger.warning(f"Erro ao parsear linha do lsusb: {line}")
-                continue
+    if devices:
+        return devices
     
     # Dispositivo não encontrado
-    error_msg: str = f"Dispositivo DeepCool (Vendor ID: {vendor_id_str}) não encontrado"
+    error_msg: str = f"Dispositivo DeepCool (Vendor ID: {VENDOR_ID:04x}) não encontrado"
     logger.error(error_msg)
     raise RuntimeError(
         f"{error_msg}. Verifique se o cooler está conectado via USB."
     )
 
 
+def detect_product_id() -> int:
+    """
+    Detecta o Product ID do dispositivo DeepCool.
+    
+    Returns:
+        Product ID do primeiro dispositivo encontrado
+        
+    Raises:
+        RuntimeError: Se o dispositivo não for encontrado
+    """
+    return detect_devices()[0].product_id
+
+
 def detect_model(product_id: int) -> str:
     """
     Retorna nome do modelo pelo Product ID.
@@ -123,6 +488,10 @@ def detect_model(product_id: int) -> str:
 def get_temperature(sensor: str) -> float:
     """
     Lê temperatura atual do sensor (em Celsius).
+
+    Usa o leitor hwmon persistente (uma única syscall por leitura) e
+    recorre ao ``psutil.sensors_temperatures()`` apenas quando o sensor
+    não é acessível diretamente pelo sysfs.
     
     Args:
         sensor: Nome do sensor
@@ -133,6 +502,13 @@ def get_temperature(sensor: str) -> float:
     Raises:
         RuntimeError: Se não for possível ler a temperatura
     """
+    reader = get_sensor_reader(sensor)
+    if reader is not None:
+        temp: float = reader.read()
+        logger.debug(f"Temperatura lida: {temp}°C")
+        return temp
+
+    import psutil
     try:
         temps = psutil.sensors_temperatures()
         if sensor not in temps:
@@ -143,7 +519,7 @@ def get_temperature(sensor: str) -> float:
             logger.error(f"Sensor '{sensor}' não retornou dados")
             raise RuntimeError(f"Sensor '{sensor}' não retornou leituras")
         
-        temp: float = temps[sensor][0].current
+        temp = temps[sensor][0].current
         logger.debug(f"Temperatura lida: {temp}°C")
         return temp
         
@@ -155,20 +531,152 @@ def get_temperature(sensor: str) -> float:
         raise RuntimeError(f"Erro ao ler temperatura: {e}") from e
 
 
-def get_cpu_usage() -> int:
+class CpuUsageSampler:
+    """
+    Amostrador de uso da CPU por delta de contadores do ``/proc/stat``.
+
+    Guarda os jiffies da leitura anterior e calcula o uso no intervalo
+    real desde a última chamada, sem dormir. O arquivo fica aberto e é
+    relido com ``os.pread``.
+    """
+
+    def __init__(self, stat_path: str = PROC_STAT):
+        """
+        Inicializa o amostrador e registra a leitura de referência.
+
+        Args:
+            stat_path: Caminho do arquivo no formato do /proc/stat
+
+        Raises:
+            OSError: Se o arquivo não puder ser aberto
+        """
+        self.stat_path: str = stat_path
+        self._fd: int = os.open(stat_path, os.O_RDONLY | os.O_CLOEXEC)
+        self._read_size: int = 4096
+        self._lock: threading.Lock = threading.Lock()
+        self._prev: List[Tuple[int, int]] = self._read_counters()
+        self._last: List[float] = [0.0] * len(self._prev)
+
+    def _read_counters(self) -> List[Tuple[int, int]]:
+        """
+        Lê os contadores (total, ocioso) da linha agregada e de cada núcleo.
+
+        Returns:
+            Lista com a linha "cpu" seguida das linhas "cpuN"
+        """
+        while True:
+            data: bytes = os.pread(self._fd, self._read_size, 0)
+            counters: List[Tuple[int, int]] = []
+            complete: bool = False
+            for line in data.split(b"\n"):
+                if not line.startswith(b"cpu"):
+                    # Primeira linha após as de CPU: todas foram lidas
+                    complete = bool(counters)
+                    break
+                fields = line.split()
+                if len(fields) < 5:
+                    break
+                values = [int(v) for v in fields[1:9]]
+                # idle + iowait contam como ociosos
+                idle: int = values[3] + (values[4] if len(values) > 4 else 0)
+                counters.append((sum(values), idle))
+
+            if complete or len(data) < self._read_size:
+                return counters
+            # Muitos núcleos: o buffer não coube todas as linhas "cpu"
+            self._read_size *= 2
+
+    def sample(self) -> Tuple[float, List[float]]:
+        """
+        Calcula o uso desde a chamada anterior.
+
+        Returns:
+            Tupla (uso_agregado, uso_por_núcleo) em percentual (0-100)
+        """
+        with self._lock:
+            current = self._read_counters()
+            if len(current) != len(self._prev):
+                # Núcleos entraram/saíram (hotplug): recomeça a referência
+                self._prev = current
+                self._last = [0.0] * len(current)
+                return 0.0, self._last[1:]
+
+            usage: List[float] = []
+            for i, ((total, idle), (p_total, p_idle)) in enumerate(
+                zip(current, self._prev)
+            ):
+                d_total: int = total - p_total
+                if d_total <= 0:
+                    # Sem jiffies decorridos: repete o último valor
+                    usage.append(self._last[i])
+                    continue
+                busy: float = 100.0 * (d_total - (idle - p_idle)) / d_total
+                usage.append(min(100.0, max(0.0, busy)))
+
+            self._prev = current
+            self._last = usage
+            return usage[0], usage[1:]
+
+
+_cpu_sampler: Optional[CpuUsageSampler] = None
+_cpu_sampler_lock: threading.Lock = threading.Lock()
+
+
+def _get_cpu_sampler() -> Optional[CpuUsageSampler]:
+    """
+    Retorna o amostrador compartilhado do /proc/stat.
+
+    Returns:
+        Amostrador ou None se o /proc/stat não estiver disponível
+    """
+    global _cpu_sampler
+    if _cpu_sampler is None:
+        with _cpu_sampler_lock:
+            if _cpu_sampler is None:
+                try:
+                    _cpu_sampler = CpuUsageSampler()
+                except OSError as e:
+                    logger.warning(f"{PROC_STAT} indisponível, usando psutil: {e}")
+                    return None
+    return _cpu_sampler
+
+
+def sample_cpu_usage() -> Tuple[float, List[float]]:
     """
-    Lê uso atual da CPU (percentual).
+    Lê o uso da CPU agregado e por núcleo desde a leitura anterior.
+
+    Não bloqueia: o intervalo medido é o tempo real entre chamadas.
     
     Returns:
-        Uso da CPU em percentual (0-100)
+        Tupla (uso_agregado, uso_por_núcleo) em percentual (0-100)
         
     Raises:
         RuntimeError: Se não for possível ler o uso da CPU
     """
     try:
-        usage: int = round(psutil.cpu_percent(interval=0.1))
-        logger.debug(f"Uso da CPU: {usage}%")
-        return usage
+        sampler = _get_cpu_sampler()
+        if sampler is not None:
+            return sampler.sample()
+        import psutil
+        per_core: List[float] = psutil.cpu_percent(interval=None, percpu=True)
+        total: float = sum(per_core) / len(per_core) if per_core else 0.0
+        return total, per_core
     except Exception as e:
         logger.error(f"Erro ao ler uso da CPU: {e}")
         raise RuntimeError(f"Erro ao ler uso da CPU: {e}") from e
+
+
+def get_cpu_usage() -> int:
+    """
+    Lê uso atual da CPU (percentual) desde a leitura anterior.
+    
+    Returns:
+        Uso da CPU em percentual (0-100)
+        
+    Raises:
+        RuntimeError: Se não for possível ler o uso da CPU
+    """
+    total, _ = sample_cpu_usage()
+    usage: int = round(total)
+    logger.debug(f"Uso da CPU: {usage}%")
+    return usage
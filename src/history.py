@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Histórico de telemetria em memória fixa.
+
+Buffer circular sobre arrays pré-alocados (``array('d')`` para o relógio,
+``array('f')`` para a temperatura e ``array('B')`` para o uso da CPU):
+13 bytes por amostra, então um dia de amostras a cada 2 s ocupa ~560 KB.
+
+As janelas de 1, 5 e 15 minutos são mantidas a cada amostra, sem copiar
+nem ordenar a janela: mínimo e máximo por filas monotônicas (O(1)
+amortizado), média por somas e p95 por contagens em arrays fixos (a
+temperatura em faixas de 0,1 °C, a CPU por valor). Outras janelas são
+calculadas sob demanda sobre a fatia da janela.
+"""
+
+import math
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from .config import HISTORY_CAPACITY, HISTORY_WINDOWS
+from .sampler import TelemetrySnapshot
+
+# Faixas do p95 de temperatura das janelas: 0,1 °C de -40 a 160 °C
+# (valores fora disso contam na faixa da ponta)
+TEMP_BIN_MIN: float = -40.0
+TEMP_BIN_STEP: float = 0.1
+TEMP_BINS: int = 2001
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    """
+    Estatísticas de uma janela de tempo.
+
+    Attributes:
+        window: Duração da janela (segundos)
+        samples: Amostras na janela
+        temp_min / temp_max / temp_mean / temp_p95: Temperatura (Celsius)
+        cpu_min / cpu_max / cpu_mean / cpu_p95: Uso da CPU (%)
+    """
+    window: float
+    samples: int
+    temp_min: float
+    temp_max: float
+    temp_mean: float
+    temp_p95: float
+    cpu_min: float
+    cpu_max: float
+    cpu_mean: float
+    cpu_p95: float
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """
+    Percentil pelo método nearest-rank.
+
+    Args:
+        ordered: Valores em ordem crescente (não vazio)
+        pct: Percentil (0-100)
+
+    Returns:
+        Valor do percentil
+    """
+    rank: int = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _temp_bin(temperature: float) -> int:
+    """Faixa de 0,1 °C da temperatura (limitada às pontas)."""
+    return min(max(round((temperature - TEMP_BIN_MIN) / TEMP_BIN_STEP), 0), TEMP_BINS - 1)
+
+
+def _p95_bin(counts: array, top: int, samples: int) -> int:
+    """
+    Percentil 95 (nearest-rank) a partir das contagens por faixa.
+
+    Desce a partir da faixa máxima, então percorre só as faixas acima do p95.
+
+    Args:
+        counts: Amostras por faixa
+        top: Faixa do maior valor
+        samples: Total de amostras
+
+    Returns:
+        Faixa do p95
+    """
+    allowed_above: int = samples - max(math.ceil(95 / 100 * samples), 1)
+    above: int = 0
+    for index in range(top, -1, -1):
+        above += counts[index]
+        if above > allowed_above:
+            return index
+    return 0
+
+
+class _RollingWindow:
+    """
+    Estatísticas incrementais de uma janela deslizante.
+
+    As amostras são identificadas pelo índice absoluto (número de amostras
+    gravadas antes dela); entram por ``push`` e saem, da mais antiga para a
+    mais nova, por ``evict``.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Inicializa a janela vazia.
+
+        Args:
+            seconds: Duração da janela
+        """
+        self.seconds: float = seconds
+        self.start: int = 0     # Índice absoluto da amostra mais antiga
+        self.end: int = 0       # Índice absoluto após a mais recente
+        # Filas monotônicas de (índice, valor): a frente é o mínimo/máximo
+        self._temp_low: Deque[Tuple[int, float]] = deque()
+        self._temp_high: Deque[Tuple[int, float]] = deque()
+        self._cpu_low: Deque[Tuple[int, int]] = deque()
+        self._cpu_high: Deque[Tuple[int, int]] = deque()
+        self._temp_sum: float = 0.0
+        self._cpu_sum: int = 0
+        # Contagens para o p95 (memória fixa, independente da janela)
+        self._temp_counts: array = array('I', bytes(4 * TEMP_BINS))
+        self._cpu_counts: array = array('I', bytes(4 * 256))
+
+    def push(self, index: int, temperature: float, cpu: int) -> None:
+        """
+        Acrescenta a amostra mais nova.
+
+        Args:
+            index: Índice absoluto da amostra
+            temperature: Temperatura como gravada no buffer
+            cpu: Uso da CPU como gravado no buffer
+        """
+        while self._temp_low and self._temp_low[-1][1] >= temperature:
+            self._temp_low.pop()
+        self._temp_low.append((index, temperature))
+        while self._temp_high and self._temp_high[-1][1] <= temperature:
+            self._temp_high.pop()
+        self._temp_high.append((index, temperature))
+        while self._cpu_low and self._cpu_low[-1][1] >= cpu:
+            self._cpu_low.pop()
+        self._cpu_low.append((index, cpu))
+        while self._cpu_high and self._cpu_high[-1][1] <= cpu:
+            self._cpu_high.pop()
+        self._cpu_high.append((index, cpu))
+
+        self._temp_sum += temperature
+        self._cpu_sum += cpu
+        self._temp_counts[_temp_bin(temperature)] += 1
+        self._cpu_counts[cpu] += 1
+        self.end = index + 1
+
+    def evict(self, temperature: float, cpu: int) -> None:
+        """
+        Remove a amostra mais antiga (índice ``start``).
+
+        Args:
+            temperature: Temperatura dessa amostra
+            cpu: Uso da CPU dessa amostra
+        """
+        index: int = self.start
+        for queue in (self._temp_low, self._temp_high, self._cpu_low, self._cpu_high):
+            if queue[0][0] == index:
+                queue.popleft()
+        self._temp_sum -= temperature
+        self._cpu_sum -= cpu
+        self._temp_counts[_temp_bin(temperature)] -= 1
+        self._cpu_counts[cpu] -= 1
+        self.start = index + 1
+
+    def stats(self) -> Optional[WindowStats]:
+        """
+        Estatísticas atuais da janela.
+
+        Returns:
+            Estatísticas, ou None se a janela estiver vazia
+        """
+        samples: int = self.end - self.start
+        if not samples:
+            return None
+        temp_max: float = self._temp_high[0][1]
+        cpu_max: int = self._cpu_high[0][1]
+        temp_p95: float = min(
+            round(TEMP_BIN_MIN + _p95_bin(self._temp_counts, _temp_bin(temp_max), samples)
+                  * TEMP_BIN_STEP, 1),
+            temp_max,
+        )
+        return WindowStats(
+            window=self.seconds,
+            samples=samples,
+            temp_min=self._temp_low[0][1],
+            temp_max=temp_max,
+            temp_mean=self._temp_sum / samples,
+            temp_p95=temp_p95,
+            cpu_min=self._cpu_low[0][1],
+            cpu_max=cpu_max,
+            cpu_mean=self._cpu_sum / samples,
+            cpu_p95=_p95_bin(self._cpu_counts, cpu_max, samples),
+        )
+
+
+class SampleHistory:
+    """Buffer circular de amostras (relógio monotônico, temperatura, CPU)."""
+
+    def __init__(self, capacity: int = HISTORY_CAPACITY,
+                 windows: Tuple[float, ...] = HISTORY_WINDOWS):
+        """
+        Pré-aloca o buffer.
+
+        Args:
+            capacity: Número máximo de amostras guardadas
+            windows: Janelas mantidas a cada amostra (segundos)
+        """
+        self.capacity: int = capacity
+        self._time: array = array('d', bytes(8 * capacity))
+        self._temp: array = array('f', bytes(4 * capacity))
+        self._cpu: array = array('B', bytes(capacity))
+        self._next: int = 0     # Próxima posição física a gravar
+        self._count: int = 0
+        self._written: int = 0  # Índice absoluto da próxima amostra
+        self._lock: threading.Lock = threading.Lock()
+        self._rolling: Dict[float, _RollingWindow] = {
+            seconds: _RollingWindow(seconds) for seconds in windows
+        }
+
+    def __len__(self) -> int:
+        """Amostras guardadas."""
+        return self._count
+
+    def append(self, snapshot: TelemetrySnapshot) -> bool:
+        """
+        Grava uma amostra (sobrescreve a mais antiga quando cheio).
+
+        Args:
+            snapshot: Leitura do ciclo
+
+        Returns:
+            True se gravada (ver ``record``)
+        """
+        return self.record(snapshot.monotonic, snapshot.temperature, snapshot.cpu_usage)
+
+    def record(self, monotonic: float, temperature: float, cpu_usage: int) -> bool:
+        """
+        Grava uma amostra a partir dos valores.
+
+        Amostras com relógio igual ou anterior ao da última gravada (ex:
+        snapshot atrasado de outro driver) são descartadas: a busca das
+        janelas e a remoção das mais antigas dependem da ordem.
+
+        Args:
+            monotonic: Relógio monotônico da leitura (crescente)
+            temperature: Temperatura (Celsius)
+            cpu_usage: Uso da CPU (0-100)
+
+        Returns:
+            True se gravada, False se descartada por estar fora de ordem
+        """
+        cpu: int = min(max(int(cpu_usage), 0), 255)
+        with self._lock:
+            index: int = self._next
+            if self._count and monotonic <= self._time[index - 1]:
+                return False
+            if self._count == self.capacity:
+                # A amostra sobrescrita sai antes das janelas que a contêm
+                oldest: int = self._written - self.capacity
+                for rolling in self._rolling.values():
+                    if rolling.start == oldest < rolling.end:
+                        rolling.evict(self._temp[index], self._cpu[index])
+            self._time[index] = monotonic
+            self._temp[index] = temperature
+            self._cpu[index] = cpu
+            self._next = index + 1 if index + 1 < self.capacity else 0
+            if self._count < self.capacity:
+                self._count += 1
+
+            # Valor já arredondado para float32, como será removido depois
+            stored: float = self._temp[index]
+            written: int = self._written
+            self._written = written + 1
+            for rolling in self._rolling.values():
+                rolling.push(written, stored, cpu)
+                since: float = monotonic - rolling.seconds
+                while rolling.start < rolling.end:
+                    position: int = rolling.start % self.capacity
+                    if self._time[position] >= since:
+                        break
+                    rolling.evict(self._temp[position], self._cpu[position])
+            return True
+
+    def _physical(self, logical: int) -> int:
+        """Posição no array da amostra ``logical`` (0 = mais antiga)."""
+        return (self._next - self._count + logical) % self.capacity
+
+    def _slice(self, data: array, first: int) -> array:
+        """Cópia das amostras de ``first`` (lógico) até a mais recente."""
+        start: int = self._physical(first)
+        end: int = start + self._count - first
+        if end <= self.capacity:
+            return data[start:end]
+        return data[start:] + data[:end - self.capacity]
+
+    def _first_since(self, since: float) -> int:
+        """Índice lógico da primeira amostra com relógio >= ``since``."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._time[self._physical(middle)] < since:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def window(self, seconds: float, now: Optional[float] = None) -> Optional[WindowStats]:
+        """
+        Calcula as estatísticas das últimas ``seconds`` segundos.
+
+        Args:
+            seconds: Duração da janela
+            now: Relógio monotônico de referência (padrão: última amostra)
+
+        Returns:
+            Estatísticas, ou None se a janela estiver vazia
+        """
+        with self._lock:
+            rolling: Optional[_RollingWindow] = self._rolling.get(seconds)
+            if rolling is not None and now is None:
+                return rolling.stats()
+            if not self._count:
+                return None
+            if now is None:
+                now = self._time[self._physical(self._count - 1)]
+            first: int = self._first_since(now - seconds)
+            temps: List[float] = sorted(self._slice(self._temp, first))
+            cpus: List[int] = sorted(self._slice(self._cpu, first))
+        if not temps:
+            return None
+        return WindowStats(
+            window=seconds,
+            samples=len(temps),
+            temp_min=temps[0],
+            temp_max=temps[-1],
+            temp_mean=sum(temps) / len(temps),
+            temp_p95=percentile(temps, 95),
+            cpu_min=cpus[0],
+            cpu_max=cpus[-1],
+            cpu_mean=sum(cpus) / len(cpus),
+            cpu_p95=percentile(cpus, 95),
+        )
+
+    def windows(self, seconds: Tuple[float, ...] = HISTORY_WINDOWS) -> List[WindowStats]:
+        """
+        Estatísticas das janelas padrão (1, 5 e 15 minutos).
+
+        Args:
+            seconds: Durações das janelas
+
+        Returns:
+            Estatísticas das janelas não vazias, na ordem pedida
+        """
+        results: List[WindowStats] = []
+        for duration in seconds:
+            stats = self.window(duration)
+            if stats is not None:
+                results.append(stats)
+        return results
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+Detecção de hotplug de dispositivos hidraw sem polling.
+
+Usa o socket netlink de uevents do kernel e, quando ele não está
+disponível (containers, sandboxes), inotify no diretório de nós de
+dispositivo. Enquanto o cooler está ausente, o driver fica bloqueado no
+descritor do monitor sem nenhum despertar periódico.
+
+O backend inotify aceita qualquer diretório, então uma pasta temporária
+com arquivos ``hidrawN`` criados/removidos simula o plug/unplug.
+"""
+
+import os
+import errno
+import socket
+import select
+import struct
+import logging
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Netlink (linux/netlink.h)
+NETLINK_KOBJECT_UEVENT: int = 15
+UEVENT_GROUP_KERNEL: int = 1
+SOL_NETLINK: int = 270
+NETLINK_NO_ENOBUFS: int = 5
+
+# inotify (sys/inotify.h)
+IN_ATTRIB: int = 0x00000004
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_NONBLOCK: int = os.O_NONBLOCK
+IN_CLOEXEC: int = os.O_CLOEXEC
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+DEV_DIR: str = "/dev"
+
+
+class HotplugMonitor:
+    """Monitor de eventos de hotplug de nós hidraw."""
+
+    def __init__(self, dev_dir: Optional[str] = None):
+        """
+        Abre o monitor.
+
+        Args:
+            dev_dir: Diretório a observar via inotify. Se None, usa
+                uevents do kernel (netlink), com inotify em /dev como
+                alternativa.
+
+        Raises:
+            OSError: Se nenhum backend puder ser aberto
+        """
+        self.backend: str
+        self._sock: Optional[socket.socket] = None
+        self._fd: int = -1
+
+        if dev_dir is None:
+            try:
+                self._open_netlink()
+            except OSError as e:
+                logger.info(f"Netlink indisponível ({e}), usando inotify em {DEV_DIR}")
+                self._open_inotify(DEV_DIR)
+        else:
+            self._open_inotify(dev_dir)
+
+        # Pipe para interromper wait() a partir de outra thread; o lock
+        # impede que interrupt() escreva num descritor já fechado (e
+        # talvez reutilizado pelo nó hidraw ou por um socket)
+        self._lock: threading.Lock = threading.Lock()
+        self._pipe_r, self._pipe_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        logger.debug(f"Monitor de hotplug aberto ({self.backend})")
+
+    @classmethod
+    def create(cls, dev_dir: Optional[str] = None) -> Optional["HotplugMonitor"]:
+        """
+        Abre um monitor, retornando None se o sistema não suportar.
+
+        Args:
+            dev_dir: Ver ``__init__``
+
+        Returns:
+            Monitor ou None
+        """
+        try:
+            return cls(dev_dir)
+        except OSError as e:
+            logger.warning(f"Detecção de hotplug indisponível: {e}")
+            return None
+
+    def _open_netlink(self) -> None:
+        """Abre o socket de uevents do kernel."""
+        sock = socket.socket(
+            socket.AF_NETLINK,
+            socket.SOCK_DGRAM | socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC,
+            NETLINK_KOBJECT_UEVENT,
+        )
+        try:
+            sock.bind((0, UEVENT_GROUP_KERNEL))
+        except OSError:
+            sock.close()
+            raise
+        try:
+            # Com o buffer cheio, descarta eventos em vez de falhar o read()
+            sock.setsockopt(SOL_NETLINK, NETLINK_NO_ENOBUFS, 1)
+        except OSError as e:
+            logger.debug(f"NETLINK_NO_ENOBUFS indisponível: {e}")
+        self._sock = sock
+        self._fd = sock.fileno()
+        self.backend = "netlink"
+
+    def _open_inotify(self, dev_dir: str) -> None:
+        """
+        Abre um descritor inotify observando ``dev_dir``.
+
+        Args:
+            dev_dir: Diretório com os nós hidraw
+        """
+        import ctypes  # Só quando o netlink não está disponível
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd: int = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        mask: int = IN_CREATE | IN_DELETE | IN_ATTRIB | IN_MOVED_TO
+        if libc.inotify_add_watch(fd, os.fsencode(dev_dir), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch({dev_dir}): {os.strerror(err)}")
+        self._fd = fd
+        self.backend = "inotify"
+
+    def fileno(self) -> int:
+        """Descritor que fica legível quando há eventos pendentes."""
+        return self._fd
+
+    def drain(self) -> bool:
+        """
+        Consome os eventos pendentes sem bloquear.
+
+        Returns:
+            True se algum evento envolve um nó hidraw, ou se eventos foram
+            perdidos por estouro do buffer (o chamador deve procurar o
+            dispositivo de novo)
+
+        Raises:
+            OSError: Em erros de leitura que não sejam estouro do buffer
+        """
+        relevant: bool = False
+        while True:
+            try:
+                data: bytes = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return relevant
+            except InterruptedError:
+                continue
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                logger.debug("Buffer de uevents estourou, procurando o dispositivo de novo")
+                relevant = True
+                continue
+            if not data:
+                return relevant
+            if self.backend == "netlink":
+                relevant |= b"SUBSYSTEM=hidraw" in data
+            else:
+                relevant |= self._parse_inotify(data)
+
+    @staticmethod
+    def _parse_inotify(data: bytes) -> bool:
+        """
+        Verifica se um lote de eventos inotify cita um nó hidraw.
+
+        Args:
+            data: Bytes lidos do descritor inotify
+
+        Returns:
+            True se algum nome começa com "hidraw"
+        """
+        offset: int = 0
+        while offset + _INOTIFY_EVENT.size <= len(data):
+            _, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name: bytes = data[offset:offset + length]
+            offset += length
+            if name.startswith(b"hidraw"):
+                return True
+        return False
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Bloqueia até um evento hidraw, ``interrupt()`` ou o tempo limite.
+
+        Args:
+            timeout: Tempo máximo em segundos (None = sem limite)
+
+        Returns:
+            True se houve evento hidraw
+        """
+        while True:
+            try:
+                ready, _, _ = select.select([self._fd, self._pipe_r], [], [], timeout)
+            except InterruptedError:
+                continue
+            if not ready:
+                return False
+            if self._pipe_r in ready:
+                try:
+                    while os.read(self._pipe_r, 64):
+                        pass
+                except BlockingIOError:
+                    pass
+                return False
+            if self.drain():
+                return True
+            # Eventos de outros dispositivos: continuar esperando
+
+    def interrupt(self) -> None:
+        """Interrompe um ``wait()`` em andamento (thread-safe; nada após ``close``)."""
+        with self._lock:
+            if self._pipe_w < 0:
+                return
+            try:
+                os.write(self._pipe_w, b"\0")
+            except (BlockingIOError, OSError):
+                pass
+
+    def close(self) -> None:
+        """Fecha o monitor (idempotente)."""
+        with self._lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+            elif self._fd >= 0:
+                os.close(self._fd)
+            self._fd = -1
+            for fd in (self._pipe_r, self._pipe_w):
+                if fd >= 0:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            self._pipe_r = self._pipe_w = -1
@@ -22,6 +22,8 @@ TRANSLATIONS = {
         "disconnected": "Desconectado",
         "connecting": "Conectando...",
         "already_running": "já está em execução.",
+        "history": "Histórico",
+        "peak": "Pico",
 
         # Cores da borda LED
         "color_menu_title": "Cor da borda",
@@ -58,6 +60,8 @@ TRANSLATIONS = {
         "disconnected": "Disconnected",
         "connecting": "Connecting...",
         "already_running": "is already running.",
+        "history": "History",
+        "peak": "Peak",
 
         # Border LED colors
         "color_menu_title": "Border color",
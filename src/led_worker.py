@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Worker único para aplicar as cores LED (OpenRGB).
+
+Cada clique no menu (ou ``set-color`` no socket de controle) só deposita a
+cor em uma caixa de um lugar; uma thread de vida longa aplica uma cor por
+vez. Um pedido novo substitui o pendente e cancela o que está em
+andamento (o processo do OpenRGB CLI é encerrado), então nunca há duas
+operações simultâneas no mesmo dispositivo e a última escolha sempre vence.
+
+O resultado sai pelo sinal ``applied(color, success)``: na bandeja é um
+sinal Qt, entregue na thread da GUI; no daemon, um callback simples.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from .colors import CancelToken, cancel_scope
+from .config import LED_APPLY_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class LedWorker(threading.Thread):
+    """Aplica cores LED uma de cada vez; o pedido mais recente vence."""
+
+    def __init__(self, apply: Callable[[str], Optional[bool]], signals: Any,
+                 timeout: float = LED_APPLY_TIMEOUT):
+        """
+        Inicializa o worker (sem iniciar a thread).
+
+        Args:
+            apply: Função bloqueante que aplica uma cor; retorna True/False,
+                ou None se nada foi feito (ex: OpenRGB ausente), caso em que
+                nenhum resultado é emitido
+            signals: Objeto com o sinal ``applied`` (LedSignals ou QtLedSignals)
+            timeout: Prazo de cada aplicação (segundos)
+        """
+        super().__init__(name="deepcool-led", daemon=True)
+        self.apply: Callable[[str], Optional[bool]] = apply
+        self.signals: Any = signals
+        self.timeout: float = timeout
+        self.running: bool = True
+        self._pending: Optional[str] = None
+        self._token: Optional[CancelToken] = None
+        self._cond: threading.Condition = threading.Condition()
+
+    def submit(self, color: str) -> None:
+        """
+        Pede a aplicação de uma cor (substitui o pedido pendente).
+
+        Args:
+            color: Cor hex, rainbow ou off
+        """
+        with self._cond:
+            if self._pending is not None:
+                logger.debug(f"Cor LED {self._pending} substituída por {color}")
+            self._pending = color
+            if self._token is not None:
+                self._token.cancel()
+            self._cond.notify()
+
+    def stop(self, timeout: float = 2) -> None:
+        """
+        Cancela a operação em andamento e encerra a thread.
+
+        Args:
+            timeout: Tempo máximo de espera pela thread
+        """
+        with self._cond:
+            self.running = False
+            self._pending = None
+            if self._token is not None:
+                self._token.cancel()
+            self._cond.notify()
+        if self.is_alive():
+            self.join(timeout)
+
+    def run(self) -> None:
+        """Loop do worker: espera um pedido, aplica e emite o resultado."""
+        while True:
+            with self._cond:
+                while self._pending is None and self.running:
+                    self._cond.wait()
+                if not self.running:
+                    return
+                color: str = self._pending
+                self._pending = None
+                token = self._token = CancelToken(self.timeout)
+
+            try:
+                with cancel_scope(token):
+                    success: Optional[bool] = self.apply(color)
+            except Exception as e:
+                logger.error(f"Erro ao aplicar cor LED {color}: {e}", exc_info=True)
+                success = False
+
+            with self._cond:
+                self._token = None
+            if token.cancelled:
+                logger.debug(f"Cor LED {color} cancelada por um pedido mais novo")
+                continue
+            if token.expired and not success:
+                logger.warning(f"Cor LED {color}: prazo de {self.timeout:g}s esgotado")
+            if success is not None:
+                self.signals.applied.emit(color, success)
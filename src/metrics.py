@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Métricas no formato OpenMetrics (Prometheus).
+
+Os valores vêm de contadores e histogramas mantidos pelo driver, pelo
+amostrador e pelo controle de cores; ``render_metrics()`` só formata o que
+já foi medido, então uma coleta não lê sensores nem toca no dispositivo.
+O endpoint HTTP fica em ``metrics_server.py`` (carregado só com ``--metrics``).
+"""
+
+import os
+import time
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from .hardware import DeviceInfo
+
+if TYPE_CHECKING:
+    from .driver import DeepCoolDriver
+    from .sampler import Sampler
+
+CONTENT_TYPE: str = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Limites dos buckets (segundos)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+)
+OPENRGB_BUCKETS: Tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Histograma com buckets fixos; ``observe()`` é O(log n) e não aloca listas."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        """
+        Inicializa o histograma zerado.
+
+        Args:
+            buckets: Limites superiores, em ordem crescente (+Inf é implícito)
+        """
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self._counts: List[int] = [0] * (len(self.buckets) + 1)
+        self._sum: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Registra uma medição.
+
+        Args:
+            value: Valor medido (segundos)
+        """
+        index: int = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """
+        Retorna contagens acumuladas por bucket, soma e total.
+
+        Returns:
+            Tupla (acumulados incluindo +Inf, soma, total)
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+        cumulative: List[int] = []
+        running: int = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, total_sum, running
+
+
+# Chamadas ao OpenRGB (colors.py), compartilhadas pelo processo
+OPENRGB_SECONDS: Histogram = Histogram(OPENRGB_BUCKETS)
+
+
+def process_stats() -> Dict[str, float]:
+    """
+    Lê CPU, memória e início do próprio processo em ``/proc/self``.
+
+    Returns:
+        Dicionário com cpu_seconds, rss_bytes e start_time (epoch); vazio
+        se ``/proc`` não estiver disponível
+    """
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            stat: bytes = f.read()
+        with open("/proc/self/statm", "rb") as f:
+            rss_pages: int = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return {}
+    fields: List[bytes] = stat[stat.rindex(b")") + 2:].split()
+    ticks: int = os.sysconf("SC_CLK_TCK")
+    age: float = time.clock_gettime(time.CLOCK_BOOTTIME) - int(fields[19]) / ticks
+    return {
+        "cpu_seconds": (int(fields[11]) + int(fields[12])) / ticks,
+        "rss_bytes": rss_pages * os.sysconf("SC_PAGE_SIZE"),
+        "start_time": time.time() - age,
+    }
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    """Formata ``{chave="valor",...}`` com o escape do OpenMetrics."""
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class _Writer:
+    """Acumula as linhas de uma exposição OpenMetrics."""
+
+    def __init__(self):
+        """Inicializa sem linhas."""
+        self.lines: List[str] = []
+
+    def family(self, name: str, kind: str, help_text: str, unit: str = "") -> None:
+        """Abre uma família de métricas (TYPE, UNIT e HELP)."""
+        self.lines.append(f"# TYPE {name} {kind}")
+        if unit:
+            self.lines.append(f"# UNIT {name} {unit}")
+        self.lines.append(f"# HELP {name} {help_text}")
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        """Adiciona uma amostra."""
+        self.lines.append(f"{name}{_labels(labels or {})} {value}")
+
+    def histogram(self, name: str, histogram: Histogram,
+                  labels: Optional[Dict[str, str]] = None) -> None:
+        """Adiciona buckets, soma e contagem de um histograma."""
+        labels = labels or {}
+        cumulative, total_sum, count = histogram.snapshot()
+        bounds = [repr(float(b)) for b in histogram.buckets] + ["+Inf"]
+        for bound, value in zip(bounds, cumulative):
+            self.sample(f"{name}_bucket", value, {**labels, "le": bound})
+        self.sample(f"{name}_sum", total_sum, labels)
+        self.sample(f"{name}_count", count, labels)
+
+    def render(self) -> str:
+        """Texto final, terminado em ``# EOF``."""
+        return "\n".join(self.lines) + "\n# EOF\n"
+
+
+def render_metrics(devices: List[DeviceInfo], models: List[str],
+                   connected: List[Optional[bool]], drivers: List["DeepCoolDriver"],
+                   sampler: "Sampler") -> str:
+    """
+    Formata todas as métricas no texto OpenMetrics.
+
+    Args:
+        devices: Dispositivos, na ordem dos drivers
+        models: Nome do modelo de cada dispositivo
+        connected: Estado de conexão (None = conectando)
+        drivers: Drivers dos dispositivos
+        sampler: Amostrador compartilhado (só o último snapshot é lido)
+
+    Returns:
+        Exposição terminada em ``# EOF``
+    """
+    out = _Writer()
+    snapshot = sampler.last
+    sensor = {"sensor": sampler.sensor}
+
+    if snapshot is not None:
+        out.family("deepcool_temperature_celsius", "gauge",
+                   "Temperatura da CPU no último snapshot (suavizada)", "celsius")
+        out.sample("deepcool_temperature_celsius", snapshot.temperature, sensor)
+        out.family("deepcool_temperature_raw_celsius", "gauge",
+                   "Leitura do sensor antes da suavização", "celsius")
+        out.sample("deepcool_temperature_raw_celsius", snapshot.raw_temperature, sensor)
+        out.family("deepcool_cpu_usage_percent", "gauge", "Uso da CPU no último snapshot")
+        out.sample("deepcool_cpu_usage_percent", snapshot.cpu_usage)
+        out.family("deepcool_snapshot_timestamp_seconds", "gauge",
+                   "Horário do último snapshot (epoch)", "seconds")
+        out.sample("deepcool_snapshot_timestamp_seconds", snapshot.timestamp)
+
+    device_labels = [
+        {"device": info.key, "model": model} for info, model in zip(devices, models)
+    ]
+    stats = [driver.get_stats() for driver in drivers]
+
+    out.family("deepcool_device_connected", "gauge", "1 se o dispositivo está conectado")
+    for labels, state in zip(device_labels, connected):
+        out.sample("deepcool_device_connected", 1 if state else 0, labels)
+
+    for name, key, help_text in (
+        ("deepcool_frames_written", "frames_written", "Quadros HID escritos"),
+        ("deepcool_frames_suppressed", "frames_suppressed", "Quadros repetidos não reenviados"),
+        ("deepcool_reconnects", "reconnects", "Reconexões após perda do dispositivo"),
+        ("deepcool_scheduler_overruns", "overruns", "Ciclos que perderam o deadline"),
+    ):
+        out.family(name, "counter", help_text)
+        for labels, driver_stats in zip(device_labels, stats):
+            out.sample(f"{name}_total", driver_stats[key], labels)
+
+    adaptive = [(labels, driver_stats['sampling'])
+                for labels, driver_stats in zip(device_labels, stats) if 'sampling' in driver_stats]
+    if adaptive:
+        out.family("deepcool_sampling_wakeups", "counter",
+                   "Ciclos da amostragem adaptativa por regime")
+        for labels, rate in adaptive:
+            for regime in ("fast", "decay", "slow"):
+                out.sample("deepcool_sampling_wakeups_total", rate[f"{regime}_wakeups"],
+                           {**labels, "regime": regime})
+
+    out.family("deepcool_hid_write_seconds", "histogram",
+               "Latência de escrita de um quadro HID", "seconds")
+    for labels, driver in zip(device_labels, drivers):
+        out.histogram("deepcool_hid_write_seconds", driver.write_latency, labels)
+
+    out.family("deepcool_sensor_read_seconds", "histogram",
+               "Latência de leitura dos sensores por snapshot", "seconds")
+    out.histogram("deepcool_sensor_read_seconds", sampler.temp_latency,
+                  {"source": "temperature"})
+    out.histogram("deepcool_sensor_read_seconds", sampler.cpu_latency, {"source": "cpu"})
+
+    out.family("deepcool_openrgb_call_seconds", "histogram",
+               "Duração das chamadas ao OpenRGB", "seconds")
+    out.histogram("deepcool_openrgb_call_seconds", OPENRGB_SECONDS)
+
+    process = process_stats()
+    if process:
+        out.family("process_cpu_seconds", "counter", "Tempo de CPU do processo", "seconds")
+        out.sample("process_cpu_seconds_total", process["cpu_seconds"])
+        out.family("process_resident_memory_bytes", "gauge", "Memória residente (RSS)", "bytes")
+        out.sample("process_resident_memory_bytes", process["rss_bytes"])
+        out.family("process_start_time_seconds", "gauge",
+                   "Início do processo (epoch)", "seconds")
+        out.sample("process_start_time_seconds", round(process["start_time"], 3))
+
+    return out.render()
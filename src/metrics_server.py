@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Endpoint HTTP das métricas (``--metrics``).
+
+Serve ``GET /metrics`` em TCP (``9101``, ``127.0.0.1:9101``) ou em um
+socket Unix (caminho absoluto). Módulo separado para que o ``http.server``
+só seja importado quando o endpoint for pedido.
+"""
+
+import os
+import socket
+import logging
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler
+from typing import Callable, Optional, Tuple, Union
+
+from .metrics import CONTENT_TYPE
+from .utils import private_umask, remove_stale_socket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST: str = "127.0.0.1"
+
+
+def parse_address(address: str) -> Union[str, Tuple[str, int]]:
+    """
+    Interpreta o endereço de ``--metrics``.
+
+    Args:
+        address: "PORTA", "HOST:PORTA" ou caminho absoluto de socket Unix
+
+    Returns:
+        Caminho do socket ou tupla (host, porta)
+
+    Raises:
+        ValueError: Se o endereço for inválido
+    """
+    if address.startswith("/"):
+        return address
+    host, _, port = address.rpartition(":")
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Endereço de métricas inválido: {address}")
+    return (host.strip("[]") or DEFAULT_HOST, int(port))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Responde ``GET /metrics`` com o texto OpenMetrics."""
+
+    server_version = "deepcool-digital"
+
+    def do_GET(self) -> None:
+        """Atende uma coleta."""
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body: bytes = self.server.collect().encode()  # type: ignore[attr-defined]
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Coletas vão para o log em nível debug."""
+        logger.debug(f"Métricas: {format % args}")
+
+
+class _TCPServer(socketserver.TCPServer):
+    """Servidor TCP (sem resolução de nome no bind, ao contrário do HTTPServer)."""
+    allow_reuse_address = True
+
+
+class _TCP6Server(_TCPServer):
+    """Servidor TCP em endereço IPv6."""
+    address_family = socket.AF_INET6
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    """Servidor em socket Unix."""
+
+    def get_request(self):
+        """Endereço fixo do cliente (o handler HTTP espera uma tupla)."""
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+class MetricsServer:
+    """Endpoint de métricas em uma thread própria."""
+
+    def __init__(self, address: str, collect: Callable[[], str]):
+        """
+        Inicializa o servidor (sem abrir o socket).
+
+        Args:
+            address: Endereço de ``--metrics`` (ver ``parse_address``)
+            collect: Função que gera o texto OpenMetrics
+        """
+        self.address: str = address
+        self.collect: Callable[[], str] = collect
+        self._server: Optional[socketserver.BaseServer] = None
+
+    def start(self) -> bool:
+        """
+        Abre o socket e começa a atender.
+
+        Returns:
+            True se o endpoint foi aberto (falhas só desativam as métricas)
+        """
+        try:
+            target = parse_address(self.address)
+            if isinstance(target, str):
+                remove_stale_socket(target)
+                with private_umask():
+                    server: socketserver.BaseServer = _UnixServer(target, _MetricsHandler)
+                try:
+                    os.chmod(target, 0o600)  # Acessível só pelo usuário
+                except OSError:
+                    server.server_close()
+                    raise
+            elif ":" in target[0]:
+                server = _TCP6Server(target, _MetricsHandler)
+            else:
+                server = _TCPServer(target, _MetricsHandler)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Endpoint de métricas indisponível ({self.address}): {e}")
+            return False
+
+        server.collect = self.collect  # type: ignore[attr-defined]
+        self._server = server
+        threading.Thread(
+            target=server.serve_forever, name="deepcool-metrics", daemon=True
+        ).start()
+        logger.info(f"Métricas em {self.address}")
+        return True
+
+    def stop(self) -> None:
+        """Encerra o endpoint."""
+        server = self._server
+        if server is None:
+            return
+        self._server = None
+        server.shutdown()
+        server.server_close()
+        if isinstance(server, _UnixServer):
+            try:
+                os.unlink(server.server_address)  # type: ignore[arg-type]
+            except OSError:
+                pass
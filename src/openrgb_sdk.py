@@ -0,0 +1,517 @@
+# -*- coding: utf-8 -*-
+"""
+Cliente do protocolo de rede do OpenRGB (SDK, TCP em localhost:6742).
+
+Mantém uma conexão aberta com o servidor do OpenRGB (``openrgb --server``
+ou a opção "SDK Server" da interface), guarda os metadados dos
+controladores (modos, zonas e LEDs) e envia UpdateLEDs/UpdateMode
+diretamente: uma troca de cor vira alguns pacotes TCP em vez de um
+processo ``openrgb`` que redetecta todo o hardware.
+
+Cada pacote tem um cabeçalho de 16 bytes (``ORGB``, índice do
+controlador, id do pacote e tamanho dos dados), em little-endian. Os
+dados dos controladores são pedidos na versão 3 do protocolo (antes dos
+segmentos de zona), negociada com o servidor.
+"""
+
+import select
+import socket
+import struct
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from .config import APP_DISPLAY_NAME, OPENRGB_HOST, OPENRGB_PORT, OPENRGB_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+MAGIC: bytes = b"ORGB"
+HEADER: struct.Struct = struct.Struct("<4sIII")
+# Versão mais recente cujo formato de controlador é decodificado aqui
+PROTOCOL_VERSION: int = 3
+
+# Ids dos pacotes
+REQUEST_CONTROLLER_COUNT: int = 0
+REQUEST_CONTROLLER_DATA: int = 1
+REQUEST_PROTOCOL_VERSION: int = 40
+SET_CLIENT_NAME: int = 50
+DEVICE_LIST_UPDATED: int = 100
+RESIZE_ZONE: int = 1000
+UPDATE_LEDS: int = 1050
+UPDATE_ZONE_LEDS: int = 1051
+UPDATE_MODE: int = 1101
+
+# Tipos de dispositivo e de cor de modo usados pelo cliente
+DEVICE_TYPE_MOTHERBOARD: int = 0
+MODE_COLORS_NONE: int = 0
+MODE_COLORS_PER_LED: int = 1
+MODE_COLORS_MODE_SPECIFIC: int = 2
+
+RGB = Tuple[int, int, int]
+
+
+class OpenRGBError(OSError):
+    """Falha de comunicação com o servidor do OpenRGB."""
+
+
+@dataclass
+class Mode:
+    """Modo de um controlador (campos na ordem do protocolo)."""
+    index: int
+    name: str
+    value: int = 0
+    flags: int = 0
+    speed_min: int = 0
+    speed_max: int = 0
+    brightness_min: int = 0
+    brightness_max: int = 0
+    colors_min: int = 0
+    colors_max: int = 0
+    speed: int = 0
+    brightness: int = 0
+    direction: int = 0
+    color_mode: int = MODE_COLORS_NONE
+    colors: List[RGB] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Zone:
+    """Zona de LEDs de um controlador."""
+    index: int
+    name: str
+    type: int
+    leds_min: int
+    leds_max: int
+    leds_count: int
+
+    @property
+    def resizable(self) -> bool:
+        """True se o tamanho da zona pode ser alterado (headers ARGB)."""
+        return self.leds_min != self.leds_max
+
+
+@dataclass
+class Controller:
+    """Metadados de um controlador RGB."""
+    index: int
+    type: int
+    name: str
+    vendor: str
+    description: str
+    version: str
+    serial: str
+    location: str
+    active_mode: int
+    modes: List[Mode]
+    zones: List[Zone]
+    led_count: int
+
+    def find_mode(self, name: str) -> Optional[Mode]:
+        """
+        Procura um modo pelo nome (sem diferenciar maiúsculas).
+
+        Args:
+            name: Nome do modo (ex: "Direct", "Static")
+
+        Returns:
+            Modo ou None se o controlador não o suporta
+        """
+        lowered: str = name.lower()
+        for mode in self.modes:
+            if mode.name.lower() == lowered:
+                return mode
+        return None
+
+
+# ──────────────────────────────────────────────────────────────
+# Codificação
+# ──────────────────────────────────────────────────────────────
+def pack_string(text: str) -> bytes:
+    """Texto com tamanho (uint16, incluindo o terminador nulo)."""
+    data: bytes = text.encode("utf-8") + b"\0"
+    return struct.pack("<H", len(data)) + data
+
+
+def pack_colors(colors: Sequence[RGB]) -> bytes:
+    """Lista de cores (uint16 + RGBColor de 4 bytes: R, G, B, 0)."""
+    return struct.pack("<H", len(colors)) + b"".join(
+        bytes((r, g, b, 0)) for r, g, b in colors
+    )
+
+
+def encode_mode(mode: Mode, version: int = PROTOCOL_VERSION) -> bytes:
+    """
+    Codifica um modo no formato do protocolo.
+
+    Args:
+        mode: Modo a codificar
+        version: Versão do protocolo negociada
+
+    Returns:
+        Bytes do modo (sem o índice)
+    """
+    parts: List[bytes] = [
+        pack_string(mode.name),
+        struct.pack("<iIII", mode.value, mode.flags, mode.speed_min, mode.speed_max),
+    ]
+    if version >= 3:
+        parts.append(struct.pack("<II", mode.brightness_min, mode.brightness_max))
+    parts.append(struct.pack("<III", mode.colors_min, mode.colors_max, mode.speed))
+    if version >= 3:
+        parts.append(struct.pack("<I", mode.brightness))
+    parts.append(struct.pack("<II", mode.direction, mode.color_mode))
+    parts.append(pack_colors(mode.colors))
+    return b"".join(parts)
+
+
+class _Reader:
+    """Leitura sequencial dos campos de um pacote."""
+
+    def __init__(self, data: bytes):
+        """Inicializa no início dos dados."""
+        self.data: bytes = data
+        self.offset: int = 0
+
+    def unpack(self, fmt: str) -> Tuple:
+        """Lê campos com um formato ``struct`` (little-endian)."""
+        values = struct.unpack_from("<" + fmt, self.data, self.offset)
+        self.offset += struct.calcsize("<" + fmt)
+        return values
+
+    def u16(self) -> int:
+        """Lê um uint16."""
+        return self.unpack("H")[0]
+
+    def u32(self) -> int:
+        """Lê um uint32."""
+        return self.unpack("I")[0]
+
+    def string(self) -> str:
+        """Lê um texto com tamanho."""
+        length: int = self.u16()
+        raw: bytes = self.data[self.offset:self.offset + length]
+        self.offset += length
+        return raw.rstrip(b"\0").decode("utf-8", errors="replace")
+
+    def colors(self) -> List[RGB]:
+        """Lê uma lista de cores."""
+        return [self.unpack("BBBx") for _ in range(self.u16())]
+
+
+def parse_mode(reader: _Reader, index: int, version: int) -> Mode:
+    """Decodifica um modo na posição atual do leitor."""
+    name: str = reader.string()
+    value, flags, speed_min, speed_max = reader.unpack("iIII")
+    brightness_min = brightness_max = brightness = 0
+    if version >= 3:
+        brightness_min, brightness_max = reader.unpack("II")
+    colors_min, colors_max, speed = reader.unpack("III")
+    if version >= 3:
+        brightness = reader.u32()
+    direction, color_mode = reader.unpack("II")
+    return Mode(
+        index, name, value, flags, speed_min, speed_max, brightness_min, brightness_max,
+        colors_min, colors_max, speed, brightness, direction, color_mode, reader.colors(),
+    )
+
+
+def parse_controller(data: bytes, index: int, version: int) -> Controller:
+    """
+    Decodifica a resposta de REQUEST_CONTROLLER_DATA.
+
+    Args:
+        data: Dados do pacote (começando pelo tamanho)
+        index: Índice do controlador
+        version: Versão do protocolo pedida
+
+    Returns:
+        Metadados do controlador
+
+    Raises:
+        OpenRGBError: Se os dados estiverem truncados
+    """
+    reader = _Reader(data)
+    try:
+        reader.u32()  # Tamanho total
+        device_type: int = reader.unpack("i")[0]
+        name: str = reader.string()
+        vendor: str = reader.string() if version >= 1 else ""
+        description, device_version, serial, location = (
+            reader.string(), reader.string(), reader.string(), reader.string()
+        )
+        mode_count: int = reader.u16()
+        active_mode: int = reader.unpack("i")[0]
+        modes: List[Mode] = [parse_mode(reader, i, version) for i in range(mode_count)]
+
+        zones: List[Zone] = []
+        for zone_index in range(reader.u16()):
+            zone_name: str = reader.string()
+            zone_type, leds_min, leds_max, leds_count = reader.unpack("iIII")
+            reader.offset += reader.u16()  # Matriz de LEDs (não usada)
+            zones.append(Zone(zone_index, zone_name, zone_type, leds_min, leds_max, leds_count))
+
+        led_count: int = reader.u16()
+    except struct.error as e:
+        raise OpenRGBError(f"Dados do controlador {index} truncados: {e}") from None
+    return Controller(
+        index, device_type, name, vendor, description, device_version, serial, location,
+        active_mode, modes, zones, led_count,
+    )
+
+
+# ──────────────────────────────────────────────────────────────
+# Cliente
+# ──────────────────────────────────────────────────────────────
+class OpenRGBClient:
+    """Conexão persistente com o servidor SDK do OpenRGB."""
+
+    def __init__(self, host: str = OPENRGB_HOST, port: int = OPENRGB_PORT,
+                 timeout: float = OPENRGB_TIMEOUT, name: str = APP_DISPLAY_NAME):
+        """
+        Inicializa o cliente (sem conectar).
+
+        Args:
+            host: Endereço do servidor
+            port: Porta do servidor
+            timeout: Tempo máximo de cada operação (segundos)
+            name: Nome do cliente mostrado na interface do OpenRGB
+        """
+        self.host: str = host
+        self.port: int = port
+        self.timeout: float = timeout
+        self.name: str = name
+        self.version: int = 0
+        self._sock: Optional[socket.socket] = None
+        self._controllers: Optional[List[Controller]] = None
+        self._lock: threading.RLock = threading.RLock()
+
+    @property
+    def connected(self) -> bool:
+        """True se há uma conexão aberta."""
+        return self._sock is not None
+
+    def connect(self) -> None:
+        """
+        Conecta, negocia a versão do protocolo e registra o nome do cliente.
+
+        Raises:
+            OpenRGBError: Se o servidor não estiver disponível
+        """
+        with self._lock:
+            if self._sock is not None:
+                return
+            try:
+                self._sock = socket.create_connection((self.host, self.port), self.timeout)
+                self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError as e:
+                self._sock = None
+                raise OpenRGBError(f"Servidor OpenRGB indisponível em "
+                                   f"{self.host}:{self.port}: {e}") from None
+
+            try:
+                reply: bytes = self._request(
+                    0, REQUEST_PROTOCOL_VERSION,
+                    struct.pack("<I", PROTOCOL_VERSION), REQUEST_PROTOCOL_VERSION,
+                )
+                self.version = min(struct.unpack_from("<I", reply)[0], PROTOCOL_VERSION)
+            except socket.timeout:
+                self.version = 0  # Servidores antigos não respondem a este pedido
+            except OSError:
+                self.close()
+                raise
+            self._send(0, SET_CLIENT_NAME, self.name.encode("utf-8") + b"\0")
+            logger.info(f"Conectado ao SDK do OpenRGB em {self.host}:{self.port} "
+                        f"(protocolo {self.version})")
+
+    def close(self) -> None:
+        """Fecha a conexão e descarta os metadados."""
+        with self._lock:
+            if self._sock is not None:
+                try:
+                    self._sock.close()
+                except OSError:
+                    pass
+            self._sock = None
+            self._controllers = None
+
+    def _send(self, device: int, packet_id: int, payload: bytes = b"") -> None:
+        """Envia um pacote (fecha a conexão em erro)."""
+        if self._sock is None:
+            raise OpenRGBError("Não conectado ao servidor OpenRGB")
+        try:
+            self._sock.sendall(HEADER.pack(MAGIC, device, packet_id, len(payload)) + payload)
+        except OSError as e:
+            self.close()
+            raise OpenRGBError(f"Falha ao enviar ao OpenRGB: {e}") from None
+
+    def _recv_exact(self, size: int) -> bytes:
+        """Lê exatamente ``size`` bytes."""
+        assert self._sock is not None
+        chunks: List[bytes] = []
+        while size:
+            chunk: bytes = self._sock.recv(size)
+            if not chunk:
+                raise OpenRGBError("Conexão encerrada pelo servidor OpenRGB")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def _poll(self) -> None:
+        """
+        Consome, sem bloquear, os pacotes que o servidor enviou por conta própria.
+
+        Avisos de lista alterada descartam os metadados guardados; sem esta
+        leitura eles se acumulariam no buffer enquanto só há escritas.
+
+        Raises:
+            OpenRGBError: Em erro de comunicação
+        """
+        while self._sock is not None:
+            # Com timeout no socket, recv() esperaria mesmo com MSG_DONTWAIT
+            if not select.select([self._sock], [], [], 0)[0]:
+                return
+            try:
+                header: bytes = self._sock.recv(
+                    HEADER.size, socket.MSG_PEEK | socket.MSG_DONTWAIT
+                )
+            except BlockingIOError:
+                return
+            except OSError as e:
+                self.close()
+                raise OpenRGBError(f"Falha ao ler do OpenRGB: {e}") from None
+            if not header:
+                self.close()
+                raise OpenRGBError("Conexão encerrada pelo servidor OpenRGB")
+            if len(header) < HEADER.size:
+                return  # Cabeçalho incompleto: lido na próxima vez
+            magic, _, packet_id, size = HEADER.unpack(header)
+            if magic != MAGIC:
+                self.close()
+                raise OpenRGBError("Resposta inválida do servidor OpenRGB")
+            try:
+                self._recv_exact(HEADER.size + size)
+            except OSError as e:
+                self.close()
+                raise OpenRGBError(f"Falha ao ler do OpenRGB: {e}") from None
+            if packet_id == DEVICE_LIST_UPDATED:
+                logger.info("OpenRGB: lista de dispositivos alterada")
+                self._controllers = None
+
+    def _request(self, device: int, packet_id: int, payload: bytes, reply_id: int) -> bytes:
+        """
+        Envia um pedido e espera a resposta com ``reply_id``.
+
+        Avisos de lista alterada recebidos no meio descartam os metadados.
+
+        Raises:
+            socket.timeout: Se o servidor não responder a tempo
+            OpenRGBError: Em erro de comunicação
+        """
+        self._send(device, packet_id, payload)
+        while True:
+            try:
+                magic, _, received_id, size = HEADER.unpack(self._recv_exact(HEADER.size))
+                data: bytes = self._recv_exact(size)
+            except socket.timeout:
+                raise
+            except OSError as e:
+                self.close()
+                raise OpenRGBError(f"Falha ao ler do OpenRGB: {e}") from None
+            if magic != MAGIC:
+                self.close()
+                raise OpenRGBError("Resposta inválida do servidor OpenRGB")
+            if received_id == reply_id:
+                return data
+            if received_id == DEVICE_LIST_UPDATED:
+                logger.info("OpenRGB: lista de dispositivos alterada")
+                self._controllers = None
+
+    def controllers(self, refresh: bool = False) -> List[Controller]:
+        """
+        Metadados de todos os controladores (guardados após a primeira leitura).
+
+        Args:
+            refresh: Relê do servidor mesmo com dados guardados
+
+        Returns:
+            Controladores na ordem do servidor
+
+        Raises:
+            OpenRGBError: Em erro de comunicação
+        """
+        with self._lock:
+            self._poll()
+            if self._controllers is not None and not refresh:
+                return self._controllers
+            try:
+                count: int = struct.unpack_from("<I", self._request(
+                    0, REQUEST_CONTROLLER_COUNT, b"", REQUEST_CONTROLLER_COUNT
+                ))[0]
+                version_data: bytes = struct.pack("<I", self.version) if self.version else b""
+                controllers: List[Controller] = [
+                    parse_controller(
+                        self._request(index, REQUEST_CONTROLLER_DATA, version_data,
+                                      REQUEST_CONTROLLER_DATA),
+                        index, self.version,
+                    )
+                    for index in range(count)
+                ]
+            except socket.timeout:
+                self.close()
+                raise OpenRGBError("Servidor OpenRGB não respondeu") from None
+            self._controllers = controllers
+            return controllers
+
+    def controller(self, index: int) -> Controller:
+        """
+        Metadados de um controlador.
+
+        Args:
+            index: Índice do controlador
+
+        Returns:
+            Controlador
+
+        Raises:
+            OpenRGBError: Se o índice não existir ou em erro de comunicação
+        """
+        controllers: List[Controller] = self.controllers()
+        if not 0 <= index < len(controllers):
+            raise OpenRGBError(f"Controlador OpenRGB {index} não existe")
+        return controllers[index]
+
+    def invalidate(self) -> None:
+        """Descarta os metadados guardados (relidos no próximo uso)."""
+        with self._lock:
+            self._controllers = None
+
+    def resize_zone(self, device: int, zone: int, size: int) -> None:
+        """Altera o número de LEDs de uma zona (descarta os metadados)."""
+        with self._lock:
+            self._poll()
+            self._send(device, RESIZE_ZONE, struct.pack("<ii", zone, size))
+            self._controllers = None
+
+    def update_leds(self, device: int, colors: Sequence[RGB]) -> None:
+        """Define a cor de todos os LEDs do controlador."""
+        payload: bytes = pack_colors(colors)
+        with self._lock:
+            self._poll()
+            self._send(device, UPDATE_LEDS, struct.pack("<I", 4 + len(payload)) + payload)
+
+    def update_zone_leds(self, device: int, zone: int, colors: Sequence[RGB]) -> None:
+        """Define a cor dos LEDs de uma zona."""
+        payload: bytes = struct.pack("<I", zone) + pack_colors(colors)
+        with self._lock:
+            self._poll()
+            self._send(device, UPDATE_ZONE_LEDS, struct.pack("<I", 4 + len(payload)) + payload)
+
+    def update_mode(self, device: int, mode: Mode) -> None:
+        """Ativa um modo (com suas cores e velocidade)."""
+        with self._lock:
+            payload: bytes = struct.pack("<i", mode.index) + encode_mode(mode, self.version)
+            self._poll()
+            self._send(device, UPDATE_MODE, struct.pack("<I", 4 + len(payload)) + payload)
+            if self._controllers is not None and device < len(self._controllers):
+                self._controllers[device].active_mode = mode.index
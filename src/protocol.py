@@ -18,7 +18,12 @@ Baseado em:
   - Issue #9 (Tasshack): protocolo HID decodificado
 """
 
-from typing import Literal
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional
+
+# Tamanho do relatório HID e byte de comando
+PACKET_SIZE: int = 64
+COMMAND: int = 16
 
 # Modos do byte[1]
 MODE_CELSIUS: int = 19
@@ -29,6 +34,48 @@ MODE_INIT: int = 170
 # Type alias para modos válidos
 DisplayMode = Literal["temp_c", "temp_f", "util", "start"]
 
+# Faixa de valores exibíveis (3 dígitos)
+MAX_VALUE: int = 999
+
+# Modos com valor, na ordem usada pela tabela de quadros
+_VALUE_MODES: tuple = ("temp_c", "temp_f", "util")
+_MODE_BYTES: Dict[str, int] = {
+    "temp_c": MODE_CELSIUS,
+    "temp_f": MODE_FAHRENHEIT,
+    "util": MODE_PERCENT,
+    "start": MODE_INIT,
+}
+_MODE_NAMES: Dict[int, DisplayMode] = {
+    MODE_CELSIUS: "temp_c",
+    MODE_FAHRENHEIT: "temp_f",
+    MODE_PERCENT: "util",
+    MODE_INIT: "start",
+}
+_MODE_INDEX: Dict[str, int] = {mode: i for i, mode in enumerate(_VALUE_MODES)}
+
+# Tabela de quadros (modo × alarme × valor), preenchida sob demanda
+_FRAME_COUNT: int = len(_VALUE_MODES) * 2 * (MAX_VALUE + 1)
+_frames: List[Optional[bytes]] = [None] * _FRAME_COUNT
+
+
+@dataclass(frozen=True)
+class DecodedPacket:
+    """
+    Conteúdo de um pacote HID decodificado.
+
+    Attributes:
+        mode: Modo de exibição
+        value: Valor numérico exibido (0-999)
+        bar: Nível da barra do topo (0-10)
+        digits: Dígitos (centena, dezena, unidade)
+        alarm: True se o display está piscando
+    """
+    mode: DisplayMode
+    value: int
+    bar: int
+    digits: tuple
+    alarm: bool
+
 
 def get_bar_value(input_value: int) -> int:
     """
@@ -53,17 +100,51 @@ def get_bar_value(input_value: int) -> int:
     return min((input_value - 1) // 10 + 1, 10)
 
 
-def build_packet(value: int = 0, mode: DisplayMode = "util", alarm: bool = False) -> list[int]:
+def _encode(value: int, mode_byte: int, alarm: bool) -> bytes:
+    """
+    Monta um quadro de 64 bytes (sem cache).
+
+    Args:
+        value: Valor já limitado a 0-999
+        mode_byte: Byte de modo
+        alarm: True para piscar o display
+
+    Returns:
+        Quadro imutável
+    """
+    data: bytearray = bytearray(PACKET_SIZE)
+    data[0] = COMMAND
+    data[1] = mode_byte
+    if mode_byte == MODE_INIT:
+        return bytes(data)
+
+    data[2] = get_bar_value(value)
+    # Zeros à esquerda ficam 0 (= dígito vazio no display)
+    data[3] = value // 100
+    data[4] = value // 10 % 10
+    data[5] = value % 10
+    data[6] = 1 if alarm else 0
+    return bytes(data)
+
+
+_INIT_FRAME: bytes = _encode(0, MODE_INIT, False)
+
+
+def build_packet(value: int = 0, mode: DisplayMode = "util", alarm: bool = False) -> bytes:
     """
     Constrói pacote HID de 64 bytes.
 
+    Os quadros são imutáveis e ficam em uma tabela preenchida sob demanda,
+    então chamadas repetidas não alocam memória e o resultado pode ser
+    passado direto para ``device.write()``.
+
     Args:
         value: Valor numérico para exibir (0-999)
         mode: Modo de exibição ("temp_c", "temp_f", "util" ou "start")
         alarm: True para piscar o display
     
     Returns:
-        Pacote de 64 bytes como lista de inteiros
+        Pacote de 64 bytes
         
     Example:
         >>> packet = build_packet(25, "temp_c", False)
@@ -72,41 +153,78 @@ def build_packet(value: int = 0, mode: DisplayMode = "util", alarm: bool = False
         >>> packet[0]
         16
     """
-    data: list[int] = [16] + [0] * 63
-
-    # Modo
-    mode_map: dict[DisplayMode, int] = {
-        "temp_c": MODE_CELSIUS,
-        "temp_f": MODE_FAHRENHEIT,
-        "util": MODE_PERCENT,
-        "start": MODE_INIT,
-    }
-    data[1] = mode_map.get(mode, MODE_CELSIUS)
-
-    # Init não precisa de mais nada
     if mode == "start":
-        return data
+        return _INIT_FRAME
+
+    # Modo desconhecido cai em Celsius, como no mapa original
+    mode_index: int = _MODE_INDEX.get(mode, 0)
 
     # Limitar valor entre 0 e 999
-    clamped_value: int = max(0, min(999, value))
-
-    # Barra
-    data[2] = get_bar_value(clamped_value)
-
-    # Dígitos
-    numbers: list[int] = [int(c) for c in str(clamped_value)]
-    if len(numbers) == 1:
-        data[5] = numbers[0]
-    elif len(numbers) == 2:
-        data[4] = numbers[0]
-        data[5] = numbers[1]
-    elif len(numbers) == 3:
-        data[3] = numbers[0]
-        data[4] = numbers[1]
-        data[5] = numbers[2]
-
-    # Alarme
-    if alarm:
-        data[6] = 1
-
-    return data
+    clamped_value: int = max(0, min(MAX_VALUE, value))
+
+    key: int = ((mode_index << 1) | (1 if alarm else 0)) * (MAX_VALUE + 1) + clamped_value
+    frame: Optional[bytes] = _frames[key]
+    if frame is None:
+        frame = _encode(clamped_value, _MODE_BYTES[_VALUE_MODES[mode_index]], alarm)
+        _frames[key] = frame
+    return frame
+
+
+def precompute_frames() -> int:
+    """
+    Preenche toda a tabela de quadros de uma vez (~600 KB).
+
+    Returns:
+        Número de quadros na tabela
+    """
+    for mode in _VALUE_MODES:
+        for alarm in (False, True):
+            for value in range(MAX_VALUE + 1):
+                build_packet(value, mode, alarm)  # type: ignore[arg-type]
+    return _FRAME_COUNT
+
+
+def decode_packet(data: bytes) -> DecodedPacket:
+    """
+    Decodifica e valida um pacote HID (inverso de ``build_packet``).
+
+    Args:
+        data: Pacote de 64 bytes
+
+    Returns:
+        Conteúdo decodificado
+
+    Raises:
+        ValueError: Se o pacote não seguir o protocolo
+
+    Example:
+        >>> decode_packet(build_packet(45, "temp_c")).value
+        45
+    """
+    if len(data) != PACKET_SIZE:
+        raise ValueError(f"Tamanho inválido: {len(data)} (esperado {PACKET_SIZE})")
+    if data[0] != COMMAND:
+        raise ValueError(f"Comando inválido: {data[0]}")
+
+    mode: Optional[DisplayMode] = _MODE_NAMES.get(data[1])
+    if mode is None:
+        raise ValueError(f"Modo inválido: {data[1]}")
+
+    if mode == "start":
+        if any(data[2:]):
+            raise ValueError("Pacote de inicialização com bytes extras")
+        return DecodedPacket(mode, 0, 0, (0, 0, 0), False)
+
+    bar: int = data[2]
+    digits: tuple = (data[3], data[4], data[5])
+    if bar > 10:
+        raise ValueError(f"Barra inválida: {bar}")
+    if any(d > 9 for d in digits):
+        raise ValueError(f"Dígitos inválidos: {digits}")
+    if data[6] not in (0, 1):
+        raise ValueError(f"Alarme inválido: {data[6]}")
+    if any(data[7:]):
+        raise ValueError("Bytes 7-63 devem ser zero")
+
+    value: int = digits[0] * 100 + digits[1] * 10 + digits[2]
+    return DecodedPacket(mode, value, bar, digits, bool(data[6]))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Sinais Qt do driver - usados apenas pela interface system tray."""
+
+from concurrent.futures import Future
+from typing import Any, Callable, Tuple
+
+from PyQt5.QtCore import pyqtSignal, QObject
+
+
+class QtDriverSignals(QObject):
+    """Sinais Qt para comunicação entre driver (thread) e GUI."""
+    status_updated = pyqtSignal(str, object)        # mode, TelemetrySnapshot
+    connection_changed = pyqtSignal(bool)           # connected
+    error_occurred = pyqtSignal(str)                # error_message
+
+
+class QtLedSignals(QObject):
+    """Sinais Qt do worker de LEDs (resultado entregue na thread da GUI)."""
+    applied = pyqtSignal(str, bool)                 # color, success
+
+
+class QtCallBridge(QObject):
+    """Executa funções de outras threads na thread da GUI (socket de controle)."""
+    call_requested = pyqtSignal(object)             # (função, Future)
+
+    def __init__(self):
+        """Cria a ponte (deve ser chamado na thread da GUI)."""
+        super().__init__()
+        self.call_requested.connect(self._run)
+
+    def _run(self, item: Tuple[Callable[[], Any], Future]) -> None:
+        """Executa a função (já na thread da GUI) e entrega o resultado."""
+        func, future = item
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except Exception as e:
+            future.set_exception(e)
+
+    def call(self, func: Callable[[], Any], timeout: float = 5.0) -> Any:
+        """
+        Executa ``func`` na thread da GUI e espera o resultado.
+
+        Args:
+            func: Função sem argumentos
+            timeout: Tempo máximo de espera (segundos)
+
+        Returns:
+            Retorno de ``func`` (exceções são repassadas)
+        """
+        future: Future = Future()
+        self.call_requested.emit((func, future))
+        return future.result(timeout)
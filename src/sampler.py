@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Amostragem de telemetria - um snapshot imutável por ciclo do driver."""
+
+import time
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .config import TEMP_SMOOTHING
+from .filters import Smoother, create_smoother
+from .hardware import get_temperature, sample_cpu_usage
+from .metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """
+    Leitura única de todas as fontes de hardware em um ciclo.
+
+    Attributes:
+        timestamp: Horário da amostra (epoch, segundos)
+        monotonic: Relógio monotônico no momento da amostra
+        temperature: Temperatura da CPU em Celsius (suavizada)
+        raw_temperature: Leitura do sensor antes da suavização
+        cpu_usage: Uso da CPU em percentual (0-100)
+        cpu_per_core: Uso de cada núcleo em percentual
+        temp_latency: Tempo gasto lendo a temperatura (segundos)
+        cpu_latency: Tempo gasto lendo o uso da CPU (segundos)
+    """
+    timestamp: float
+    monotonic: float
+    temperature: float
+    raw_temperature: float
+    cpu_usage: int
+    cpu_per_core: Tuple[float, ...]
+    temp_latency: float
+    cpu_latency: float
+
+
+class Sampler:
+    """
+    Lê cada fonte de hardware exatamente uma vez por ciclo.
+
+    Uma instância pode ser compartilhada por vários drivers: ``latest()``
+    devolve o snapshot recente em vez de ler os sensores de novo, então
+    adicionar um dispositivo não adiciona leituras de sensores.
+    """
+
+    def __init__(self, sensor: str, smoothing: str = TEMP_SMOOTHING):
+        """
+        Inicializa o amostrador.
+
+        Args:
+            sensor: Nome do sensor de temperatura
+            smoothing: Suavização da temperatura ("none", "ema", "median")
+        """
+        self.sensor: str = sensor
+        self.smoother: Smoother = create_smoother(smoothing)
+        self._last: Optional[TelemetrySnapshot] = None
+        self._lock: threading.Lock = threading.Lock()
+        # Latências de leitura acumuladas (exportadas em metrics.py)
+        self.temp_latency: Histogram = Histogram()
+        self.cpu_latency: Histogram = Histogram()
+
+    @property
+    def smoothing(self) -> str:
+        """Nome da suavização em uso."""
+        return self.smoother.name
+
+    def set_smoothing(self, name: str) -> None:
+        """
+        Troca a suavização da temperatura (o estado é descartado).
+
+        Args:
+            name: "none", "ema" ou "median"
+        """
+        if name != self.smoother.name:
+            with self._lock:
+                self.smoother = create_smoother(name)
+
+    @property
+    def last(self) -> Optional[TelemetrySnapshot]:
+        """Último snapshot, sem amostrar (None antes da primeira leitura)."""
+        return self._last
+
+    def latest(self, max_age: float) -> TelemetrySnapshot:
+        """
+        Retorna o último snapshot se for recente, senão amostra de novo.
+
+        Args:
+            max_age: Idade máxima aceitável em segundos
+
+        Returns:
+            Snapshot com no máximo ``max_age`` segundos
+
+        Raises:
+            RuntimeError: Se alguma fonte não puder ser lida
+        """
+        with self._lock:
+            last = self._last
+            if last is not None and time.monotonic() - last.monotonic <= max_age:
+                return last
+            return self.sample()
+
+    def sample(self) -> TelemetrySnapshot:
+        """
+        Lê temperatura e uso da CPU e monta um snapshot.
+
+        Returns:
+            Snapshot imutável com as leituras do ciclo
+
+        Raises:
+            RuntimeError: Se alguma fonte não puder ser lida
+        """
+        start: float = time.perf_counter()
+        temp_c: float = get_temperature(self.sensor)
+        after_temp: float = time.perf_counter()
+        total, per_core = sample_cpu_usage()
+        after_cpu: float = time.perf_counter()
+
+        snapshot = TelemetrySnapshot(
+            timestamp=time.time(),
+            monotonic=time.monotonic(),
+            temperature=self.smoother.update(temp_c),
+            raw_temperature=temp_c,
+            cpu_usage=round(total),
+            cpu_per_core=tuple(per_core),
+            temp_latency=after_temp - start,
+            cpu_latency=after_cpu - after_temp,
+        )
+        self.temp_latency.observe(snapshot.temp_latency)
+        self.cpu_latency.observe(snapshot.cpu_latency)
+        logger.debug(f"Snapshot: {snapshot}")
+        self._last = snapshot
+        return snapshot
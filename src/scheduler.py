@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""Agendador de ciclos do driver baseado em deadlines monotônicos."""
+
+import time
+import threading
+import logging
+from typing import Dict, Optional
+
+from .config import (
+    INTERVAL, ADAPTIVE_FAST, ADAPTIVE_SLOW, ADAPTIVE_DECAY,
+    ADAPTIVE_TEMP_RATE, ADAPTIVE_CPU_RATE,
+)
+from .sampler import TelemetrySnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    Agenda ciclos em deadlines absolutos do relógio monotônico.
+
+    O próximo deadline é calculado a partir do anterior (não do fim do
+    trabalho), então o tempo gasto lendo sensores e escrevendo no HID não
+    acumula deriva. A espera é feita em um ``threading.Event``, permitindo
+    acordar o driver imediatamente quando uma configuração muda.
+    """
+
+    def __init__(self, wake_event: Optional[threading.Event] = None):
+        """
+        Inicializa o agendador.
+
+        Args:
+            wake_event: Evento que interrompe a espera (criado se None)
+        """
+        self.wake_event: threading.Event = wake_event or threading.Event()
+        self.deadline: float = time.monotonic()
+
+        # Estatísticas
+        self.ticks: int = 0
+        self.wakeups: int = 0
+        self.overruns: int = 0
+        self.max_jitter: float = 0.0
+        self.mean_jitter: float = 0.0
+
+    def reset(self) -> None:
+        """Ancora o próximo deadline no instante atual."""
+        self.deadline = time.monotonic()
+
+    def schedule(self, period: float) -> None:
+        """
+        Define o próximo deadline ``period`` segundos após o anterior.
+
+        Se o deadline já passou (o ciclo demorou mais que o período), conta
+        um overrun e reancora no instante atual em vez de tentar recuperar
+        os ciclos perdidos.
+
+        Args:
+            period: Duração do ciclo em segundos
+        """
+        self.deadline += period
+        now: float = time.monotonic()
+        if self.deadline <= now:
+            self.overruns += 1
+            logger.debug(
+                f"Overrun do ciclo: {now - self.deadline + period:.3f}s "
+                f"(período {period:.3f}s)"
+            )
+            self.deadline = now
+
+    def timeout(self) -> float:
+        """
+        Retorna o tempo restante até o deadline.
+
+        Returns:
+            Segundos até o deadline (0 se já passou)
+        """
+        return max(0.0, self.deadline - time.monotonic())
+
+    def wait(self) -> bool:
+        """
+        Espera até o deadline ou até o evento de despertar.
+
+        Returns:
+            True se acordado pelo evento (o deadline é reancorado),
+            False se o deadline foi atingido
+        """
+        timeout: float = self.timeout()
+        woke: bool = self.wake_event.wait(timeout) if timeout > 0 else self.wake_event.is_set()
+        if woke:
+            self.wake_event.clear()
+        return self.complete_wait(woke)
+
+    def complete_wait(self, woke: bool) -> bool:
+        """
+        Registra o fim de uma espera feita externamente (ex: asyncio).
+
+        Args:
+            woke: True se a espera foi interrompida por um despertar
+
+        Returns:
+            O próprio ``woke``
+        """
+        now: float = time.monotonic()
+
+        if woke:
+            self.wakeups += 1
+            self.deadline = now
+            return True
+
+        jitter: float = max(0.0, now - self.deadline)
+        self.ticks += 1
+        self.max_jitter = max(self.max_jitter, jitter)
+        # Média móvel exponencial do atraso ao acordar
+        self.mean_jitter += (jitter - self.mean_jitter) * 0.1
+        return False
+
+    def wake(self) -> None:
+        """Interrompe a espera atual."""
+        self.wake_event.set()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Retorna estatísticas de pontualidade.
+
+        Returns:
+            Dicionário com ciclos, despertares, overruns e jitter (segundos)
+        """
+        return {
+            'ticks': self.ticks,
+            'wakeups': self.wakeups,
+            'overruns': self.overruns,
+            'max_jitter': self.max_jitter,
+            'mean_jitter': self.mean_jitter,
+        }
+
+
+class AdaptiveRate:
+    """
+    Período de amostragem guiado pela velocidade de variação do sinal.
+
+    Cai para ``fast`` quando a temperatura ou o uso da CPU variam mais que
+    os limites por segundo e, enquanto estáveis, cresce ``decay`` vezes por
+    ciclo até ``slow``. A variação é dividida pelo intervalo entre amostras
+    limitado a 1 s..``INTERVAL``: o ruído de amostras muito próximas não
+    dispara o modo rápido e uma subida durante a amostragem lenta não é
+    diluída.
+    """
+
+    # Regimes contabilizados nas estatísticas
+    REGIMES = ("fast", "decay", "slow")
+
+    def __init__(self, fast: float = ADAPTIVE_FAST, slow: float = ADAPTIVE_SLOW,
+                 decay: float = ADAPTIVE_DECAY, temp_rate: float = ADAPTIVE_TEMP_RATE,
+                 cpu_rate: float = ADAPTIVE_CPU_RATE):
+        """
+        Inicializa no período lento.
+
+        Args:
+            fast: Período rápido (segundos)
+            slow: Período lento (segundos)
+            decay: Fator de crescimento do período por ciclo estável
+            temp_rate: Limite de variação da temperatura (Celsius/s)
+            cpu_rate: Limite de variação do uso da CPU (pontos/s)
+        """
+        self.fast: float = fast
+        self.slow: float = slow
+        self.decay: float = decay
+        self.temp_rate: float = temp_rate
+        self.cpu_rate: float = cpu_rate
+        self.interval: float = slow
+        self._last: Optional[TelemetrySnapshot] = None
+
+        # Despertares e tempo por regime
+        self._wakeups: Dict[str, int] = {regime: 0 for regime in self.REGIMES}
+        self._seconds: Dict[str, float] = {regime: 0.0 for regime in self.REGIMES}
+        self._last_update: Optional[float] = None
+
+    @property
+    def regime(self) -> str:
+        """Regime do período atual ("fast", "decay" ou "slow")."""
+        if self.interval <= self.fast:
+            return "fast"
+        if self.interval >= self.slow:
+            return "slow"
+        return "decay"
+
+    def update(self, snapshot: TelemetrySnapshot) -> float:
+        """
+        Registra um ciclo e calcula o próximo período.
+
+        Args:
+            snapshot: Snapshot usado no ciclo (um snapshot repetido não
+                altera o período)
+
+        Returns:
+            Período até o próximo ciclo (segundos)
+        """
+        now: float = time.monotonic()
+        if self._last_update is not None:
+            self._seconds[self.regime] += now - self._last_update
+        self._last_update = now
+
+        last: Optional[TelemetrySnapshot] = self._last
+        if last is not None and snapshot.monotonic > last.monotonic:
+            elapsed: float = min(max(snapshot.monotonic - last.monotonic, 1.0), INTERVAL)
+            temp_rate: float = abs(snapshot.temperature - last.temperature) / elapsed
+            cpu_rate: float = abs(snapshot.cpu_usage - last.cpu_usage) / elapsed
+            if temp_rate >= self.temp_rate or cpu_rate >= self.cpu_rate:
+                if self.interval > self.fast:
+                    logger.debug(
+                        f"Amostragem rápida: {temp_rate:.2f}°C/s, {cpu_rate:.1f}%/s"
+                    )
+                self.interval = self.fast
+            else:
+                self.interval = min(self.interval * self.decay, self.slow)
+        if snapshot is not last:
+            self._last = snapshot
+
+        self._wakeups[self.regime] += 1
+        return self.interval
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Retorna despertares por hora em cada regime.
+
+        Returns:
+            Dicionário com ``{regime}_wakeups``, ``{regime}_seconds`` e
+            ``{regime}_per_hour``
+        """
+        stats: Dict[str, float] = {}
+        for regime in self.REGIMES:
+            seconds: float = self._seconds[regime]
+            stats[f"{regime}_wakeups"] = self._wakeups[regime]
+            stats[f"{regime}_per_hour"] = (
+                self._wakeups[regime] * 3600 / seconds if seconds else 0.0
+            )
+            stats[f"{regime}_seconds"] = seconds
+        return stats
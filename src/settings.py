@@ -1,18 +1,32 @@
 # -*- coding: utf-8 -*-
 """Gerenciamento de persistência de configurações do usuário."""
 
+import os
 import json
 import logging
+import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from .config import SETTINGS_FILE, CONFIG_DIR
+from .config import (
+    SETTINGS_FILE, CONFIG_DIR, KEEPALIVE_INTERVAL, PAGE_DWELL,
+    TEMP_SMOOTHING, DISPLAY_HYSTERESIS, ALARM_HYSTERESIS, ALARM_HOLD,
+    SAMPLING_FIXED, SAMPLING_ADAPTIVE,
+)
+from .filters import SMOOTHERS
 
 logger = logging.getLogger(__name__)
 
 
 class SettingsManager:
-    """Gerencia a persistência de configurações do usuário."""
+    """
+    Gerencia a persistência de configurações do usuário.
+
+    Thread-safe: leitura, gravação e ``update`` (ler-modificar-gravar)
+    compartilham um lock, e o arquivo é substituído atomicamente, então
+    uma leitura concorrente nunca vê um JSON pela metade.
+    """
 
     # Valores padrão
     DEFAULT_SETTINGS: Dict[str, Any] = {
@@ -20,12 +34,24 @@ class SettingsManager:
         'temp_unit': 'C',
         'alarm_enabled': False,
         'alarm_temp': 80,
+        'keepalive_interval': KEEPALIVE_INTERVAL,
+        'page_dwell': dict(PAGE_DWELL),
+        'temp_smoothing': TEMP_SMOOTHING,
+        'display_hysteresis': dict(DISPLAY_HYSTERESIS),
+        'alarm_hysteresis': ALARM_HYSTERESIS,
+        'alarm_hold': ALARM_HOLD,
+        'sampling': SAMPLING_FIXED,
         'led_color': '#FF0000',
         'openrgb_device_id': None,
         'openrgb_zone_id': None,
         'openrgb_led_count': None,
+        'openrgb_device': None,
+        'devices': {},
     }
 
+    # Chaves que podem ser definidas por dispositivo em 'devices'
+    DEVICE_KEYS: tuple = ('display_mode', 'temp_unit', 'alarm_enabled', 'alarm_temp')
+
     def __init__(self, settings_file: Optional[Path] = None):
         """
         Inicializa o gerenciador de configurações.
@@ -36,6 +62,7 @@ class SettingsManager:
         """
         self.settings_file = settings_file or SETTINGS_FILE
         self._settings: Dict[str, Any] = self.DEFAULT_SETTINGS.copy()
+        self._lock: threading.RLock = threading.RLock()
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -53,6 +80,11 @@ class SettingsManager:
         Returns:
             Dicionário com as configurações carregadas
         """
+        with self._lock:
+            return self._load_locked()
+
+    def _load_locked(self) -> Dict[str, Any]:
+        """Corpo de ``load`` (chamador deve segurar o lock)."""
         if not self.settings_file.exists():
             logger.info("Arquivo de configurações não encontrado, usando padrões")
             return self._settings.copy()
@@ -87,12 +119,47 @@ class SettingsManager:
         Returns:
             True se salvou com sucesso, False caso contrário
         """
+        with self._lock:
+            return self._save_locked(settings)
+
+    def update(self, changes: Dict[str, Any]) -> bool:
+        """
+        Altera só algumas chaves, preservando o resto do arquivo.
+
+        A leitura e a gravação acontecem sob o mesmo lock, então alterações
+        simultâneas de outras threads não se perdem.
+
+        Args:
+            changes: Chaves e valores a alterar
+
+        Returns:
+            True se salvou com sucesso, False caso contrário
+        """
+        with self._lock:
+            current: Dict[str, Any] = self._load_locked()
+            current.update(changes)
+            return self._save_locked(current)
+
+    def _save_locked(self, settings: Dict[str, Any]) -> bool:
+        """Corpo de ``save`` (chamador deve segurar o lock)."""
         try:
             # Validar antes de salvar
             validated_settings = self._validate_and_merge(settings)
 
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(validated_settings, f, indent=2, ensure_ascii=False)
+            # Grava num temporário e troca: o arquivo nunca fica truncado
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.settings_file.parent, prefix=f".{self.settings_file.name}."
+            )
+            try:
+                with open(fd, 'w', encoding='utf-8') as f:
+                    json.dump(validated_settings, f, indent=2, ensure_ascii=False)
+                os.replace(temp_path, self.settings_file)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
 
             self._settings = validated_settings
             logger.info(f"Configurações salvas em {self.settings_file}")
@@ -116,36 +183,92 @@ class SettingsManager:
         """
         validated: Dict[str, Any] = self.DEFAULT_SETTINGS.copy()
 
-        # display_mode
-        if 'display_mode' in settings:
-            mode = settings['display_mode']
-            if mode in ('auto', 'temp', 'util'):
-                validated['display_mode'] = mode
+        self._validate_device_fields(settings, validated)
+
+        # keepalive_interval
+        if 'keepalive_interval' in settings:
+            interval = settings['keepalive_interval']
+            if isinstance(interval, int) and 1 <= interval <= 300:
+                validated['keepalive_interval'] = interval
             else:
-                logger.warning(f"display_mode inválido: {mode}, usando padrão")
+                logger.warning(
+                    f"keepalive_interval inválido: {interval}, usando padrão"
+                )
 
-        # temp_unit
-        if 'temp_unit' in settings:
-            unit = settings['temp_unit']
-            if unit in ('C', 'F'):
-                validated['temp_unit'] = unit
+        # page_dwell
+        if 'page_dwell' in settings:
+            dwell = settings['page_dwell']
+            if isinstance(dwell, dict) and all(
+                page in PAGE_DWELL
+                and isinstance(seconds, (int, float))
+                and 0.5 <= seconds <= 60
+                for page, seconds in dwell.items()
+            ):
+                validated['page_dwell'] = {**PAGE_DWELL, **dwell}
             else:
-                logger.warning(f"temp_unit inválido: {unit}, usando padrão")
+                logger.warning(f"page_dwell inválido: {dwell}, usando padrão")
 
-        # alarm_enabled
-        if 'alarm_enabled' in settings:
-            if isinstance(settings['alarm_enabled'], bool):
-                validated['alarm_enabled'] = settings['alarm_enabled']
+        # temp_smoothing
+        if 'temp_smoothing' in settings:
+            smoothing = settings['temp_smoothing']
+            if smoothing in SMOOTHERS:
+                validated['temp_smoothing'] = smoothing
             else:
-                logger.warning("alarm_enabled inválido, usando padrão")
+                logger.warning(f"temp_smoothing inválido: {smoothing}, usando padrão")
+
+        # display_hysteresis
+        if 'display_hysteresis' in settings:
+            hysteresis = settings['display_hysteresis']
+            if isinstance(hysteresis, dict) and all(
+                page in DISPLAY_HYSTERESIS
+                and isinstance(step, (int, float))
+                and 0 <= step <= 20
+                for page, step in hysteresis.items()
+            ):
+                validated['display_hysteresis'] = {**DISPLAY_HYSTERESIS, **hysteresis}
+            else:
+                logger.warning(
+                    f"display_hysteresis inválido: {hysteresis}, usando padrão"
+                )
 
-        # alarm_temp
-        if 'alarm_temp' in settings:
-            temp = settings['alarm_temp']
-            if isinstance(temp, (int, float)) and 0 <= temp <= 150:
-                validated['alarm_temp'] = int(temp)
+        # alarm_hysteresis
+        if 'alarm_hysteresis' in settings:
+            degrees = settings['alarm_hysteresis']
+            if isinstance(degrees, (int, float)) and 0 <= degrees <= 30:
+                validated['alarm_hysteresis'] = degrees
             else:
-                logger.warning(f"alarm_temp inválido: {temp}, usando padrão")
+                logger.warning(f"alarm_hysteresis inválido: {degrees}, usando padrão")
+
+        # alarm_hold
+        if 'alarm_hold' in settings:
+            hold = settings['alarm_hold']
+            if isinstance(hold, (int, float)) and 0 <= hold <= 300:
+                validated['alarm_hold'] = hold
+            else:
+                logger.warning(f"alarm_hold inválido: {hold}, usando padrão")
+
+        # sampling
+        if 'sampling' in settings:
+            sampling = settings['sampling']
+            if sampling in (SAMPLING_FIXED, SAMPLING_ADAPTIVE):
+                validated['sampling'] = sampling
+            else:
+                logger.warning(f"sampling inválido: {sampling}, usando padrão")
+
+        # devices (configurações por dispositivo)
+        if 'devices' in settings:
+            devices = settings['devices']
+            if isinstance(devices, dict):
+                validated['devices'] = {}
+                for key, entry in devices.items():
+                    if isinstance(key, str) and isinstance(entry, dict):
+                        device_settings: Dict[str, Any] = {}
+                        self._validate_device_fields(entry, device_settings)
+                        validated['devices'][key] = device_settings
+                    else:
+                        logger.warning(f"devices[{key}] inválido, ignorando")
+            else:
+                logger.warning("devices inválido, usando padrão")
 
         # led_color
         if 'led_color' in settings:
@@ -186,8 +309,76 @@ class SettingsManager:
                     f"openrgb_led_count inválido: {led_count}, usando padrão"
                 )
 
+        # openrgb_device (cache de detecção, ver colors.ArgbDeviceCache)
+        if 'openrgb_device' in settings:
+            from .colors import ArgbDevice
+            device = ArgbDevice.from_dict(settings['openrgb_device'])
+            if device is not None:
+                validated['openrgb_device'] = device.to_dict()
+            elif settings['openrgb_device'] is not None:
+                logger.warning("openrgb_device inválido, detectando de novo")
+
         return validated
 
+    @staticmethod
+    def _validate_device_fields(settings: Dict[str, Any],
+                                validated: Dict[str, Any]) -> None:
+        """
+        Valida as configurações de exibição (globais ou de um dispositivo).
+
+        Args:
+            settings: Configurações a serem validadas
+            validated: Dicionário onde os valores válidos são gravados
+        """
+        # display_mode
+        if 'display_mode' in settings:
+            mode = settings['display_mode']
+            if mode in ('auto', 'temp', 'util'):
+                validated['display_mode'] = mode
+            else:
+                logger.warning(f"display_mode inválido: {mode}, usando padrão")
+
+        # temp_unit
+        if 'temp_unit' in settings:
+            unit = settings['temp_unit']
+            if unit in ('C', 'F'):
+                validated['temp_unit'] = unit
+            else:
+                logger.warning(f"temp_unit inválido: {unit}, usando padrão")
+
+        # alarm_enabled
+        if 'alarm_enabled' in settings:
+            if isinstance(settings['alarm_enabled'], bool):
+                validated['alarm_enabled'] = settings['alarm_enabled']
+            else:
+                logger.warning("alarm_enabled inválido, usando padrão")
+
+        # alarm_temp
+        if 'alarm_temp' in settings:
+            temp = settings['alarm_temp']
+            if isinstance(temp, (int, float)) and 0 <= temp <= 150:
+                validated['alarm_temp'] = int(temp)
+            else:
+                logger.warning(f"alarm_temp inválido: {temp}, usando padrão")
+
+    def device_settings(self, settings: Dict[str, Any], key: str) -> Dict[str, Any]:
+        """
+        Retorna as configurações efetivas de um dispositivo.
+
+        As chaves de ``DEVICE_KEYS`` salvas em ``settings['devices'][key]``
+        sobrepõem os valores globais.
+
+        Args:
+            settings: Configurações carregadas
+            key: Identificador do dispositivo (``DeviceInfo.key``)
+
+        Returns:
+            Configurações mescladas
+        """
+        merged: Dict[str, Any] = dict(settings)
+        merged.update(settings.get('devices', {}).get(key, {}))
+        return merged
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Obtém valor de uma configuração.
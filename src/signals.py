@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Sinais com callbacks simples - comunicação driver → consumidores sem Qt.
+
+``Signal`` imita a API usada dos sinais do Qt (``connect``/``emit``), então
+o driver não sabe se está falando com a bandeja (sinais Qt, entregues na
+thread da GUI) ou com o daemon (callbacks chamados na thread do driver).
+"""
+
+import logging
+import threading
+from typing import Any, Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+class Signal:
+    """Lista de callbacks chamados em ``emit()`` na thread de quem emite."""
+
+    def __init__(self):
+        """Inicializa o sinal sem callbacks."""
+        self._callbacks: List[Callable[..., Any]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def connect(self, callback: Callable[..., Any]) -> None:
+        """
+        Registra um callback.
+
+        Args:
+            callback: Função chamada com os argumentos de ``emit()``
+        """
+        with self._lock:
+            self._callbacks = self._callbacks + [callback]
+
+    def disconnect(self, callback: Callable[..., Any]) -> None:
+        """
+        Remove um callback registrado (ignora se não existir).
+
+        Args:
+            callback: Função registrada com ``connect()``
+        """
+        with self._lock:
+            self._callbacks = [c for c in self._callbacks if c is not callback]
+
+    def emit(self, *args: Any) -> None:
+        """
+        Chama todos os callbacks; um callback com erro não afeta os demais.
+
+        Args:
+            *args: Argumentos repassados aos callbacks
+        """
+        for callback in self._callbacks:
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Erro em callback de sinal: {e}", exc_info=True)
+
+
+class DriverSignals:
+    """Sinais do driver sem dependência do Qt (modo daemon)."""
+
+    def __init__(self):
+        """Cria os sinais."""
+        self.status_updated: Signal = Signal()       # mode, TelemetrySnapshot
+        self.connection_changed: Signal = Signal()   # connected
+        self.error_occurred: Signal = Signal()       # error_message
+
+
+class LedSignals:
+    """Sinais do worker de LEDs sem dependência do Qt (modo daemon)."""
+
+    def __init__(self):
+        """Cria os sinais."""
+        self.applied: Signal = Signal()              # color, success
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Perfil de inicialização - tempo por fase até o primeiro quadro HID.
+
+Este módulo é o primeiro importado pelo ``main.py``: o instante da sua
+importação separa o tempo do interpretador do tempo dos imports do app.
+O início do processo vem de ``/proc/self/stat``.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Instante (perf_counter) em que este módulo foi importado
+IMPORTED_AT: float = time.perf_counter()
+
+
+def process_start() -> Optional[float]:
+    """
+    Estima o início do processo no relógio de ``time.perf_counter()``.
+
+    Returns:
+        Instante de início, ou None se ``/proc`` não estiver disponível
+    """
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            stat: bytes = f.read()
+        # O nome do processo pode conter espaços: campos após o último ")"
+        fields: List[bytes] = stat[stat.rindex(b")") + 2:].split()
+        start_ticks: int = int(fields[19])
+        age: float = (
+            time.clock_gettime(time.CLOCK_BOOTTIME)
+            - start_ticks / os.sysconf("SC_CLK_TCK")
+        )
+    except (OSError, ValueError, IndexError):
+        return None
+    return time.perf_counter() - age
+
+
+class StartupProfiler:
+    """
+    Registra marcos da inicialização e imprime a duração de cada fase.
+
+    Desabilitado, ``mark()`` não faz nada, então o perfilador pode ser
+    passado sempre, sem ``if`` nos chamadores.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Inicializa o perfilador.
+
+        Args:
+            enabled: Se False, nenhum marco é registrado
+        """
+        self.enabled: bool = enabled
+        self._marks: List[Tuple[str, float]] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._reported: bool = False
+        if enabled:
+            self.origin: float = process_start() or IMPORTED_AT
+            if self.origin < IMPORTED_AT:
+                self._marks.append(("interpretador", IMPORTED_AT))
+            self.mark("imports")
+
+    def mark(self, phase: str) -> None:
+        """
+        Encerra uma fase (que começou no marco anterior).
+
+        Args:
+            phase: Nome da fase que termina agora
+        """
+        if not self.enabled:
+            return
+        now: float = time.perf_counter()
+        with self._lock:
+            self._marks.append((phase, now))
+
+    def report(self) -> str:
+        """
+        Monta a tabela de fases.
+
+        Returns:
+            Texto com duração e tempo acumulado de cada fase (ms)
+        """
+        with self._lock:
+            marks = list(self._marks)
+        lines: List[str] = [f"{'fase':24s} {'duração':>10s} {'acumulado':>10s}"]
+        previous: float = self.origin
+        for phase, at in marks:
+            lines.append(
+                f"{phase:24s} {(at - previous) * 1000:7.1f} ms "
+                f"{(at - self.origin) * 1000:7.1f} ms"
+            )
+            previous = at
+        return "\n".join(lines)
+
+    def finish(self) -> None:
+        """Imprime e registra o relatório (apenas uma vez)."""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        text: str = self.report()
+        print(f"Perfil de inicialização:\n{text}", flush=True)
+        logger.info(f"Perfil de inicialização:\n{text}")
+
+    def watch_first_frame(self, event: threading.Event, timeout: float = 30) -> None:
+        """
+        Marca o primeiro quadro HID quando ``event`` disparar e imprime o relatório.
+
+        Args:
+            event: Evento sinalizado pelo driver após o primeiro quadro
+            timeout: Tempo máximo de espera (segundos)
+        """
+        if not self.enabled:
+            return
+
+        def _watch() -> None:
+            if event.wait(timeout):
+                self.mark("primeiro quadro HID")
+            else:
+                self.mark(f"sem quadro HID ({timeout:.0f}s)")
+            self.finish()
+
+        threading.Thread(target=_watch, name="deepcool-profiler", daemon=True).start()
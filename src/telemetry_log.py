@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+"""
+Registro de telemetria em disco (arquivo circular mapeado em memória).
+
+O arquivo ``telemetry.bin`` em ``CONFIG_DIR`` é pré-alocado com um
+cabeçalho de 32 bytes e ``TELEMETRY_LOG_CAPACITY`` registros de 16 bytes
+(horário, temperatura, uso da CPU, modo e alarme), um a cada
+``TELEMETRY_LOG_INTERVAL`` segundos. Gravar um registro é
+uma escrita na memória mapeada; o ``msync`` acontece a cada
+``TELEMETRY_LOG_SYNC`` segundos e ao fechar. Quando cheio, o registro mais
+antigo é sobrescrito, então o arquivo nunca cresce.
+
+Exportação (lê o arquivo direto, sem instância em execução):
+
+    python3 -m src.telemetry_log --since 24h --step 5m
+    python3 -m src.telemetry_log --since 30d --step 1h --format json
+"""
+
+import os
+import sys
+import csv
+import mmap
+import time
+import json
+import struct
+import logging
+import argparse
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import (
+    TELEMETRY_LOG_CAPACITY, TELEMETRY_LOG_FILE, TELEMETRY_LOG_INTERVAL, TELEMETRY_LOG_SYNC,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC: bytes = b"DCTLOG\0\0"
+VERSION: int = 1
+# magic, versão, tamanho do registro, capacidade, próxima posição, registros
+HEADER: struct.Struct = struct.Struct("<8sHHIQQ")
+# horário (epoch), temperatura (Celsius), CPU (%), modo, alarme, temp. do alarme
+RECORD: struct.Struct = struct.Struct("<dfBBBB")
+
+MODES: Tuple[str, ...] = ("auto", "temp", "util")
+ALARM_ENABLED: int = 0x01
+ALARM_ACTIVE: int = 0x02
+
+Record = Tuple[float, float, int, int, int, int]
+
+
+class TelemetryLog:
+    """Arquivo circular de registros de tamanho fixo, acessado por mmap."""
+
+    def __init__(self, path: Path = TELEMETRY_LOG_FILE,
+                 capacity: int = TELEMETRY_LOG_CAPACITY,
+                 interval: float = TELEMETRY_LOG_INTERVAL):
+        """
+        Inicializa o registro (sem abrir o arquivo).
+
+        Args:
+            path: Caminho do arquivo
+            capacity: Número máximo de registros
+            interval: Intervalo mínimo entre registros (segundos)
+        """
+        self.path: Path = Path(path)
+        self.capacity: int = capacity
+        self.interval: float = interval
+        self._last_append: float = -interval
+        self._map: Optional[mmap.mmap] = None
+        self._next: int = 0
+        self._count: int = 0
+        self._last_synced: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Tamanho do arquivo (bytes)."""
+        return HEADER.size + RECORD.size * self.capacity
+
+    def open(self) -> bool:
+        """
+        Abre o arquivo, criando-o (pré-alocado) se não existir ou for de
+        outro formato/capacidade.
+
+        Returns:
+            True se aberto (falhas só desativam o registro)
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+            try:
+                if not self._valid_header(fd):
+                    self._create(fd)
+                self._map = mmap.mmap(fd, self.size)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.warning(f"Registro de telemetria indisponível ({self.path}): {e}")
+            return False
+
+        _, _, _, _, self._next, self._count = HEADER.unpack_from(self._map)
+        self._last_synced = time.monotonic()
+        logger.info(f"Registro de telemetria: {self.path} ({self._count} registros)")
+        return True
+
+    def _valid_header(self, fd: int) -> bool:
+        """Confere se o arquivo existente tem o formato e a capacidade atuais."""
+        if os.fstat(fd).st_size != self.size:
+            return False
+        header: bytes = os.pread(fd, HEADER.size, 0)
+        magic, version, record_size, capacity, next_index, count = HEADER.unpack(header)
+        return (magic == MAGIC and version == VERSION and record_size == RECORD.size
+                and capacity == self.capacity and next_index < capacity and count <= capacity)
+
+    def _create(self, fd: int) -> None:
+        """Recria o arquivo vazio, com o espaço reservado em disco."""
+        if os.fstat(fd).st_size:
+            logger.warning(f"Registro de telemetria em formato diferente, recriando: {self.path}")
+        os.ftruncate(fd, 0)
+        os.ftruncate(fd, self.size)
+        try:
+            os.posix_fallocate(fd, 0, self.size)
+        except (AttributeError, OSError):
+            pass  # Sistema de arquivos sem fallocate: fica esparso
+        os.pwrite(fd, HEADER.pack(MAGIC, VERSION, RECORD.size, self.capacity, 0, 0), 0)
+
+    def append(self, timestamp: float, temperature: float, cpu_usage: int,
+               settings: Dict[str, Any], alarm_active: Optional[bool] = None) -> None:
+        """
+        Grava um registro (sobrescreve o mais antigo quando cheio).
+
+        Chamadas antes de ``interval`` segundos do último registro são
+        ignoradas, então pode ser chamado a cada snapshot.
+
+        Args:
+            timestamp: Horário da amostra (epoch)
+            temperature: Temperatura (Celsius)
+            cpu_usage: Uso da CPU (0-100)
+            settings: Configurações do dispositivo (``DeepCoolDriver.get_settings()``)
+            alarm_active: Estado do alarme no dispositivo (None = comparar
+                a temperatura com ``alarm_temp``)
+        """
+        alarm_temp: int = int(settings.get('alarm_temp', 0))
+        alarm: int = 0
+        if settings.get('alarm_enabled'):
+            alarm |= ALARM_ENABLED
+            if alarm_active if alarm_active is not None else temperature >= alarm_temp:
+                alarm |= ALARM_ACTIVE
+        mode: str = settings.get('display_mode', "auto")
+
+        now: float = time.monotonic()
+        with self._lock:
+            if self._map is None or now - self._last_append < self.interval:
+                return
+            self._last_append = now
+            RECORD.pack_into(
+                self._map, HEADER.size + self._next * RECORD.size,
+                timestamp, temperature, min(max(int(cpu_usage), 0), 255),
+                MODES.index(mode) if mode in MODES else 0, alarm, min(max(alarm_temp, 0), 255),
+            )
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            HEADER.pack_into(self._map, 0, MAGIC, VERSION, RECORD.size, self.capacity,
+                             self._next, self._count)
+
+            if now - self._last_synced >= TELEMETRY_LOG_SYNC:
+                self._last_synced = now
+                self._sync()
+
+    def sync(self) -> None:
+        """Grava em disco as páginas alteradas (msync)."""
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        """``sync()`` com o lock já adquirido."""
+        if self._map is None:
+            return
+        try:
+            self._map.flush()
+        except OSError as e:
+            logger.warning(f"Falha ao sincronizar o registro de telemetria: {e}")
+
+    def close(self) -> None:
+        """Sincroniza e fecha o arquivo."""
+        with self._lock:
+            if self._map is None:
+                return
+            self._sync()
+            self._map.close()
+            self._map = None
+
+
+def read_records(path: Path = TELEMETRY_LOG_FILE, since: Optional[float] = None,
+                 until: Optional[float] = None) -> Iterator[Record]:
+    """
+    Lê os registros de um intervalo, do mais antigo ao mais recente.
+
+    O início é localizado por busca binária (o relógio de parede é
+    considerado crescente); o restante é decodificado em bloco.
+
+    Args:
+        path: Caminho do arquivo
+        since: Horário inicial (epoch, inclusive)
+        until: Horário final (epoch, exclusive)
+
+    Yields:
+        Tuplas (horário, temperatura, CPU, modo, alarme, temp. do alarme)
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido
+        ValueError: Se o arquivo não for um registro de telemetria
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, version, record_size, capacity, next_index, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"Formato de registro desconhecido: {path}")
+        oldest: int = (next_index - count) % capacity
+
+        def offset(logical: int) -> int:
+            return HEADER.size + ((oldest + logical) % capacity) * RECORD.size
+
+        first: int = 0
+        if since is not None:
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                if struct.unpack_from("<d", data, offset(middle))[0] < since:
+                    low = middle + 1
+                else:
+                    high = middle
+            first = low
+
+        # Até duas fatias contíguas (antes e depois da volta do anel)
+        start: int = (oldest + first) % capacity
+        remaining: int = count - first
+        chunks: List[Tuple[int, int]] = [(start, min(remaining, capacity - start))]
+        if remaining > capacity - start:
+            chunks.append((0, remaining - (capacity - start)))
+        for position, length in chunks:
+            begin: int = HEADER.size + position * RECORD.size
+            for record in RECORD.iter_unpack(data[begin:begin + length * RECORD.size]):
+                if until is not None and record[0] >= until:
+                    return
+                yield record
+
+
+def _record_row(record: Record) -> Dict[str, Any]:
+    """Linha de exportação de um registro."""
+    timestamp, temperature, cpu, mode, alarm, alarm_temp = record
+    return {
+        "timestamp": round(timestamp, 3),
+        "temperature": round(temperature, 1),
+        "cpu_usage": cpu,
+        "mode": MODES[mode] if mode < len(MODES) else "auto",
+        "alarm_enabled": bool(alarm & ALARM_ENABLED),
+        "alarm_active": bool(alarm & ALARM_ACTIVE),
+        "alarm_temp": alarm_temp,
+    }
+
+
+def downsample(records: Iterator[Record], step: float) -> Iterator[Dict[str, Any]]:
+    """
+    Agrupa registros em intervalos de ``step`` segundos.
+
+    Cada linha traz média e máximo de temperatura e CPU, o último modo e se
+    o alarme esteve ativo em algum momento do intervalo.
+
+    Args:
+        records: Registros em ordem cronológica
+        step: Duração de cada intervalo (segundos, > 0)
+
+    Yields:
+        Uma linha por intervalo com registros
+    """
+    bucket: Optional[float] = None
+    rows: List[Record] = []
+
+    def flush() -> Dict[str, Any]:
+        last: Dict[str, Any] = _record_row(rows[-1])
+        temps = [r[1] for r in rows]
+        cpus = [r[2] for r in rows]
+        return {
+            "timestamp": bucket,
+            "temperature": round(sum(temps) / len(temps), 1),
+            "temperature_max": round(max(temps), 1),
+            "cpu_usage": round(sum(cpus) / len(cpus)),
+            "cpu_usage_max": max(cpus),
+            "mode": last["mode"],
+            "alarm_enabled": last["alarm_enabled"],
+            "alarm_active": any(r[4] & ALARM_ACTIVE for r in rows),
+            "alarm_temp": last["alarm_temp"],
+            "samples": len(rows),
+        }
+
+    for record in records:
+        start: float = record[0] - record[0] % step
+        if start != bucket:
+            if rows:
+                yield flush()
+            bucket, rows = start, []
+        rows.append(record)
+    if rows:
+        yield flush()
+
+
+def parse_duration(text: str) -> float:
+    """
+    Interpreta uma duração ("90", "30s", "5m", "24h", "7d").
+
+    Args:
+        text: Duração com sufixo opcional
+
+    Returns:
+        Duração em segundos
+
+    Raises:
+        argparse.ArgumentTypeError: Se a duração for inválida
+    """
+    units: Dict[str, int] = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    multiplier: int = units.get(text[-1:].lower(), 1)
+    number: str = text[:-1] if text[-1:].lower() in units else text
+    try:
+        value = float(number)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Duração inválida: {text}") from None
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"Duração inválida: {text}")
+    return value * multiplier
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Lê as opções de linha de comando.
+
+    Args:
+        argv: Argumentos sem o nome do programa
+
+    Returns:
+        Opções reconhecidas
+    """
+    parser = argparse.ArgumentParser(
+        prog="python3 -m src.telemetry_log",
+        description="Exporta o registro de telemetria em CSV ou JSON (uma linha por registro)",
+    )
+    parser.add_argument('--file', type=Path, default=TELEMETRY_LOG_FILE,
+                        help="Arquivo do registro")
+    parser.add_argument('--since', type=parse_duration, metavar='DURAÇÃO',
+                        help="Só os últimos N segundos/minutos/horas/dias (ex.: 24h, 7d)")
+    parser.add_argument('--until', type=parse_duration, metavar='DURAÇÃO',
+                        help="Só até N atrás (ex.: 1h)")
+    parser.add_argument('--step', type=parse_duration, metavar='DURAÇÃO',
+                        help="Agrupa em intervalos (média e máximo), ex.: 5m")
+    parser.add_argument('--format', choices=('csv', 'json'), default='csv',
+                        help="Formato de saída (json = uma linha JSON por registro)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Exporta o registro para a saída padrão.
+
+    Args:
+        argv: Argumentos (padrão: ``sys.argv[1:]``)
+
+    Returns:
+        Código de saída
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    now: float = time.time()
+    records = read_records(
+        args.file,
+        since=now - args.since if args.since else None,
+        until=now - args.until if args.until else None,
+    )
+    rows: Iterator[Dict[str, Any]] = (
+        downsample(records, args.step) if args.step else map(_record_row, records)
+    )
+
+    try:
+        writer: Optional[csv.DictWriter] = None
+        for row in rows:
+            row = {"time": datetime.fromtimestamp(row["timestamp"]).isoformat(
+                timespec='seconds'), **row}
+            if args.format == 'json':
+                sys.stdout.write(json.dumps(row) + "\n")
+                continue
+            if writer is None:
+                writer = csv.DictWriter(sys.stdout, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"Não foi possível ler {args.file}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
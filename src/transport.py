@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+Camada de transporte HID - como os quadros chegam ao dispositivo.
+
+Backends disponíveis:
+  - ``hidraw``: abre ``/dev/hidrawN`` uma vez e escreve o relatório com
+    um único ``os.write`` (sem depender do pacote ``hid``)
+  - ``hidapi``: usa ``hid.device()`` da biblioteca hidapi
+  - ``virtual``: dispositivo emulado em memória (ver ``emulator.py``)
+
+O backend ``auto`` usa o nó hidraw quando ele é conhecido e recorre ao
+hidapi caso contrário, então o app continua funcionando mesmo quando o
+conflito de pacotes ``hid``/``hidapi`` impede a importação.
+"""
+
+import os
+import abc
+import errno
+import select
+import logging
+from typing import Callable, Dict, List, Optional
+
+from .config import VENDOR_ID
+from .hardware import DeviceInfo, discover_devices
+
+logger = logging.getLogger(__name__)
+
+# Nomes aceitos em --transport
+TRANSPORT_AUTO: str = "auto"
+TRANSPORT_HIDRAW: str = "hidraw"
+TRANSPORT_HIDAPI: str = "hidapi"
+TRANSPORT_VIRTUAL: str = "virtual"
+
+
+class TransportError(OSError):
+    """Falha de comunicação com o dispositivo (qualquer backend)."""
+
+
+class HidTransport(abc.ABC):
+    """Interface comum dos backends de transporte."""
+
+    name: str = ""
+
+    def enumerate(self) -> List[DeviceInfo]:
+        """
+        Lista os dispositivos DeepCool alcançáveis por este transporte.
+
+        Returns:
+            Dispositivos presentes (usado na detecção de reconexão)
+        """
+        return discover_devices()
+
+    @abc.abstractmethod
+    def open(self, info: Optional[DeviceInfo], product_id: int) -> None:
+        """
+        Abre o dispositivo.
+
+        Args:
+            info: Dispositivo específico (hidraw/serial); se None, abre o
+                primeiro com o Product ID
+            product_id: Product ID do dispositivo USB
+
+        Raises:
+            TransportError: Se o dispositivo não puder ser aberto
+            OSError: Erro de permissão ou de I/O
+        """
+
+    @abc.abstractmethod
+    def write(self, data: bytes) -> int:
+        """
+        Escreve um relatório HID.
+
+        Args:
+            data: Relatório completo (o byte 0 é o report ID)
+
+        Returns:
+            Número de bytes escritos
+
+        Raises:
+            TransportError: Erro de comunicação
+        """
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Fecha o dispositivo (idempotente)."""
+
+
+class HidrawTransport(HidTransport):
+    """Escrita direta em ``/dev/hidrawN``."""
+
+    name: str = TRANSPORT_HIDRAW
+
+    def __init__(self, write_timeout: Optional[float] = None):
+        """
+        Inicializa o backend.
+
+        Args:
+            write_timeout: Tempo máximo (segundos) esperando o nó aceitar
+                a escrita; se None, a escrita é direta, sem ``poll``
+        """
+        self.write_timeout: Optional[float] = write_timeout
+        self.path: Optional[str] = None
+        self._fd: int = -1
+        self._poll: Optional[select.poll] = None
+
+    @staticmethod
+    def _resolve_path(info: Optional[DeviceInfo], product_id: int) -> str:
+        """
+        Determina o nó hidraw a abrir.
+
+        Args:
+            info: Dispositivo específico (ou None)
+            product_id: Product ID do dispositivo USB
+
+        Returns:
+            Caminho do nó hidraw
+
+        Raises:
+            TransportError: Se nenhum nó hidraw for encontrado
+        """
+        if info is not None and info.hidraw_path:
+            return info.hidraw_path
+        for candidate in discover_devices(VENDOR_ID):
+            if candidate.product_id == product_id and candidate.hidraw_path:
+                return candidate.hidraw_path
+        raise TransportError(
+            errno.ENODEV, f"Nenhum nó hidraw para 0x{VENDOR_ID:04x}:0x{product_id:04x}"
+        )
+
+    def open(self, info: Optional[DeviceInfo], product_id: int) -> None:
+        """
+        Abre o nó hidraw só para escrita.
+
+        Args:
+            info: Dispositivo específico; se None, o primeiro nó com o
+                Product ID
+            product_id: Product ID do dispositivo USB
+
+        Raises:
+            TransportError: Se nenhum nó hidraw for encontrado
+            OSError: Erro de permissão ou de I/O ao abrir o nó
+        """
+        self.close()
+        path: str = self._resolve_path(info, product_id)
+        flags: int = os.O_WRONLY | os.O_CLOEXEC
+        if self.write_timeout is not None:
+            flags |= os.O_NONBLOCK
+        self._fd = os.open(path, flags)
+        self.path = path
+        if self.write_timeout is not None:
+            self._poll = select.poll()
+            self._poll.register(self._fd, select.POLLOUT)
+
+    def write(self, data: bytes) -> int:
+        """
+        Escreve o relatório com um único ``os.write``.
+
+        Args:
+            data: Relatório completo (o byte 0 é o report ID)
+
+        Returns:
+            Número de bytes escritos
+
+        Raises:
+            TransportError: Nó fechado, tempo de escrita esgotado,
+                dispositivo removido ou ocupado
+            OSError: Outro erro de I/O do nó
+        """
+        if self._fd < 0:
+            raise TransportError(errno.EBADF, "Dispositivo hidraw não aberto")
+        if self._poll is not None:
+            events = self._poll.poll(self.write_timeout * 1000)
+            if not events:
+                raise TransportError(
+                    errno.ETIMEDOUT,
+                    f"Tempo de escrita esgotado em {self.path} "
+                    f"({self.write_timeout:.2f}s)",
+                )
+            if events[0][1] & (select.POLLERR | select.POLLHUP):
+                raise TransportError(errno.ENODEV, f"Dispositivo removido: {self.path}")
+        try:
+            return os.write(self._fd, data)
+        except BlockingIOError as e:
+            raise TransportError(errno.EAGAIN, f"Dispositivo ocupado: {self.path}") from e
+
+    def close(self) -> None:
+        """
+        Fecha o nó hidraw (idempotente).
+
+        Raises:
+            OSError: Se ``os.close`` falhar (o descritor é descartado)
+        """
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            finally:
+                self._fd = -1
+                self._poll = None
+
+
+class HidapiTransport(HidTransport):
+    """Escrita via ``hid.device()`` (hidapi)."""
+
+    name: str = TRANSPORT_HIDAPI
+
+    def __init__(self):
+        """Inicializa o backend (o módulo ``hid`` só é importado em ``open``)."""
+        self._hid = None
+        self._device = None
+
+    def open(self, info: Optional[DeviceInfo], product_id: int) -> None:
+        """
+        Abre o dispositivo pelo hidapi (caminho, serial ou VID/PID).
+
+        Args:
+            info: Dispositivo específico; se None, o primeiro com o
+                Product ID
+            product_id: Product ID do dispositivo USB
+
+        Raises:
+            TransportError: Se o hidapi não estiver disponível ou o
+                dispositivo não puder ser aberto
+        """
+        self.close()
+        try:
+            import hid
+        except ImportError as e:
+            raise TransportError(errno.ENOSYS, f"hidapi indisponível: {e}") from e
+
+        self._hid = hid
+        device = hid.device()
+        try:
+            if info is not None and info.hidraw_path:
+                device.open_path(info.hidraw_path.encode())
+            elif info is not None and info.serial:
+                device.open(VENDOR_ID, product_id, info.serial)
+            else:
+                device.open(VENDOR_ID, product_id)
+            # Não bloqueante uma única vez, e não antes de cada escrita
+            device.set_nonblocking(1)
+        except hid.HIDException as e:
+            raise TransportError(errno.EIO, f"Erro HID: {e}") from e
+        self._device = device
+
+    def write(self, data: bytes) -> int:
+        """
+        Escreve um relatório HID pelo hidapi.
+
+        Args:
+            data: Relatório completo (o byte 0 é o report ID)
+
+        Returns:
+            Número de bytes escritos (-1 em falha, como no hidapi)
+
+        Raises:
+            TransportError: Dispositivo não aberto ou erro HID
+        """
+        if self._device is None:
+            raise TransportError(errno.EBADF, "Dispositivo hidapi não aberto")
+        try:
+            return self._device.write(data)
+        except self._hid.HIDException as e:
+            raise TransportError(errno.EIO, f"Erro HID: {e}") from e
+
+    def close(self) -> None:
+        """Fecha o dispositivo hidapi (idempotente)."""
+        if self._device is not None:
+            try:
+                self._device.close()
+            finally:
+                self._device = None
+
+
+class AutoTransport(HidTransport):
+    """Usa hidraw quando o nó é conhecido, hidapi caso contrário."""
+
+    name: str = TRANSPORT_AUTO
+
+    def __init__(self, write_timeout: Optional[float] = None):
+        """
+        Inicializa o backend.
+
+        Args:
+            write_timeout: Repassado ao backend hidraw
+        """
+        self.write_timeout: Optional[float] = write_timeout
+        self.backend: Optional[HidTransport] = None
+
+    def open(self, info: Optional[DeviceInfo], product_id: int) -> None:
+        """
+        Escolhe o backend e abre o dispositivo.
+
+        Args:
+            info: Dispositivo específico; se None, o primeiro com o
+                Product ID
+            product_id: Product ID do dispositivo USB
+
+        Raises:
+            TransportError: Se o backend escolhido não abrir o dispositivo
+            OSError: Erro de permissão ou de I/O (hidraw)
+        """
+        self.close()
+        try:
+            HidrawTransport._resolve_path(info, product_id)
+            backend: HidTransport = HidrawTransport(self.write_timeout)
+        except TransportError:
+            backend = HidapiTransport()
+        backend.open(info, product_id)
+        self.backend = backend
+        logger.debug(f"Transporte automático: {backend.name}")
+
+    def write(self, data: bytes) -> int:
+        """
+        Escreve um relatório HID pelo backend escolhido.
+
+        Args:
+            data: Relatório completo (o byte 0 é o report ID)
+
+        Returns:
+            Número de bytes escritos
+
+        Raises:
+            TransportError: Dispositivo não aberto ou erro do backend
+        """
+        if self.backend is None:
+            raise TransportError(errno.EBADF, "Dispositivo não aberto")
+        return self.backend.write(data)
+
+    def close(self) -> None:
+        """Fecha o backend escolhido (idempotente)."""
+        if self.backend is not None:
+            try:
+                self.backend.close()
+            finally:
+                self.backend = None
+
+
+def _create_virtual(write_timeout: Optional[float] = None) -> HidTransport:
+    """Transporte ligado ao dispositivo virtual padrão (import tardio)."""
+    from .emulator import VirtualTransport, default_device
+    return VirtualTransport(default_device())
+
+
+# Fábricas registradas por nome
+TRANSPORTS: Dict[str, Callable[..., HidTransport]] = {
+    TRANSPORT_AUTO: AutoTransport,
+    TRANSPORT_HIDRAW: HidrawTransport,
+    TRANSPORT_HIDAPI: lambda write_timeout=None: HidapiTransport(),
+    TRANSPORT_VIRTUAL: _create_virtual,
+}
+
+
+def available_transports() -> List[str]:
+    """
+    Lista os nomes de backend registrados.
+
+    Returns:
+        Nomes aceitos por ``create_transport``
+    """
+    return list(TRANSPORTS)
+
+
+def create_transport(backend: str = TRANSPORT_AUTO,
+                     write_timeout: Optional[float] = None) -> HidTransport:
+    """
+    Cria um backend de transporte pelo nome.
+
+    Args:
+        backend: Nome do backend (ver ``available_transports``)
+        write_timeout: Tempo máximo de escrita (apenas hidraw)
+
+    Returns:
+        Transporte ainda não aberto
+
+    Raises:
+        ValueError: Se o nome não for conhecido
+    """
+    try:
+        factory = TRANSPORTS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Transporte desconhecido: {backend} "
+            f"(disponíveis: {', '.join(TRANSPORTS)})"
+        ) from None
+    return factory(write_timeout=write_timeout)
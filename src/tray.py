@@ -1,11 +1,8 @@
 # -*- coding: utf-8 -*-
 """Interface System Tray - menu de contexto e interação com o usuário."""
 
-import time
-import threading
-import subprocess
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from PyQt5.QtWidgets import (
     QSystemTrayIcon, QMenu, QAction, QActionGroup,
@@ -16,17 +13,34 @@ from PyQt5.QtGui import (
 )
 from PyQt5.QtCore import Qt
 
-from .config import VERSION, VENDOR_ID, ALARM_TEMPS, GITHUB_URL
+from .config import (
+    VERSION, VENDOR_ID, ALARM_TEMPS, GITHUB_URL, ENGINE_ASYNCIO, ENGINE_THREAD,
+    HISTORY_WINDOWS,
+)
 from .i18n import tr
 from .icons import create_deepcool_icon, create_status_icon
-from .driver import DeepCoolDriver, DriverSignals
+from .driver import DeepCoolDriver
+from .qt_signals import QtCallBridge, QtDriverSignals, QtLedSignals
+from .metrics import render_metrics
+from .control import (
+    ControlServer, device_changes, parse_color, select_devices, status_payload,
+)
+from .transport import TRANSPORT_AUTO
+from .sampler import Sampler, TelemetrySnapshot
+from .history import SampleHistory, WindowStats
+from .hardware import DeviceInfo, detect_model
 from .settings import SettingsManager
 from .utils import format_temperature
-from .colors import (
-    is_openrgb_available, apply_color_setting,
-    PRESET_COLORS, COLOR_RAINBOW, COLOR_OFF, COLOR_DEFAULT,
-)
-from . import autostart
+from .startup import StartupProfiler
+from .telemetry_log import TelemetryLog
+
+# Importados sob demanda (não são necessários para o primeiro quadro):
+# colors (OpenRGB: subprocess/re), autostart e async_engine (asyncio)
+if TYPE_CHECKING:
+    from .async_engine import AsyncDriverEngine
+    from .colors import ArgbDeviceCache
+    from .led_worker import LedWorker
+    from .metrics_server import MetricsServer
 
 logger = logging.getLogger(__name__)
 
@@ -94,43 +108,77 @@ def _make_color_icon(
 class DeepCoolTray:
     """Gerencia o ícone na bandeja e o menu de contexto."""
 
-    def __init__(self, app: QApplication, product_id: int, model: str, sensor: str):
+    def __init__(self, app: QApplication, devices: List[DeviceInfo], sensor: str,
+                 engine: str = ENGINE_THREAD, transport: str = TRANSPORT_AUTO,
+                 write_timeout: Optional[float] = None,
+                 profiler: Optional[StartupProfiler] = None,
+                 metrics: Optional[str] = None):
         """
         Inicializa a interface system tray.
 
         Args:
             app: Aplicação Qt
-            product_id: Product ID do dispositivo
-            model: Nome do modelo do cooler
+            devices: Dispositivos DeepCool detectados (um driver para cada)
             sensor: Nome do sensor de temperatura
+            engine: Motor do driver ("thread" ou "asyncio")
+            transport: Backend de transporte HID ("auto", "hidraw", "hidapi")
+            write_timeout: Tempo máximo de escrita em segundos (hidraw)
+            profiler: Perfil de inicialização (``--profile-startup``)
+            metrics: Endereço do endpoint de métricas (``--metrics``)
         """
         self.app: QApplication = app
-        self.product_id: int = product_id
-        self.model: str = model
+        self.profiler: StartupProfiler = profiler or StartupProfiler()
+        self.devices: List[DeviceInfo] = list(devices)
+        self.models: List[str] = [detect_model(d.product_id) for d in self.devices]
         self.sensor: str = sensor
+        self.engine_name: str = engine
+        self._engine: Optional["AsyncDriverEngine"] = None
+        self.transport: str = transport
+        self.write_timeout: Optional[float] = write_timeout
 
-        # Estado
-        self.connected: bool = False
+        # Estado (None = ainda conectando)
+        self.connected: List[Optional[bool]] = [None] * len(self.devices)
         self.current_temp: float = 0.0
         self.current_cpu: int = 0
+        self._last_snapshot: Optional[TelemetrySnapshot] = None
+        # Último ícone/dica desenhados: só redesenha quando o texto muda
+        self._icon_key: Optional[Tuple[int, bool]] = None
+        self._tooltip: str = ""
+        # Histórico de leituras (memória fixa) para as janelas de 1/5/15 min
+        self.history: SampleHistory = SampleHistory()
+        self.telemetry_log: TelemetryLog = TelemetryLog()
 
         # Gerenciador de configurações
         self.settings_manager: SettingsManager = SettingsManager()
 
-        # Sinais
-        self.signals: DriverSignals = DriverSignals()
-        self.signals.status_updated.connect(self._on_status_updated)
-        self.signals.connection_changed.connect(self._on_connection_changed)
+        # Amostrador compartilhado: os sensores são lidos uma vez por ciclo,
+        # independentemente do número de dispositivos
+        self.sampler: Sampler = Sampler(sensor)
 
-        # Driver
-        self.driver: DeepCoolDriver = DeepCoolDriver(self.signals, product_id, sensor)
+        # Sinais e drivers (um par por dispositivo)
+        self.signals: List[QtDriverSignals] = []
+        for index in range(len(self.devices)):
+            signals: QtDriverSignals = QtDriverSignals()
+            signals.status_updated.connect(
+                lambda mode, snapshot, i=index: self._on_status_updated(i, mode, snapshot)
+            )
+            signals.connection_changed.connect(
+                lambda connected, i=index: self._on_connection_changed(i, connected)
+            )
+            self.signals.append(signals)
+        self.drivers: List[DeepCoolDriver] = [
+            self._create_driver(index) for index in range(len(self.devices))
+        ]
 
         # Carregar e aplicar configurações salvas
         self._load_settings()
+        self.profiler.mark("configurações")
 
         # Estado da cor LED (carregado do settings)
         saved = self.settings_manager.load()
-        self._led_color: str = saved.get('led_color', COLOR_DEFAULT)
+        self._led_color: str = saved.get(
+            'led_color', SettingsManager.DEFAULT_SETTINGS['led_color']
+        )
         self._openrgb_device_id: Optional[int] = saved.get(
             'openrgb_device_id', None
         )
@@ -141,63 +189,150 @@ class DeepCoolTray:
             'openrgb_led_count', None
         )
 
-        # Aplicar cor salva ao iniciar (sem bloquear startup)
-        self._apply_led_color_async()
-
         # System Tray Icon
         self.tray: QSystemTrayIcon = QSystemTrayIcon()
         self.tray.setIcon(create_deepcool_icon(False))
         self.tray.setToolTip(f"DeepCool Digital - {tr('connecting')}")
 
-        # Menu
+        # Menu (construído em start(), depois que os drivers já estão rodando)
         self.menu: QMenu = QMenu()
-        self._build_menu()
-        self.tray.setContextMenu(self.menu)
 
-        logger.info("Interface system tray inicializada")
+        # Cache de detecção do dispositivo ARGB e worker de LEDs (criados em start())
+        self.argb_cache: Optional["ArgbDeviceCache"] = None
+        self.led_signals: QtLedSignals = QtLedSignals()
+        self.led_worker: Optional["LedWorker"] = None
+
+        # Socket de controle (aberto em start())
+        self.control: Optional[ControlServer] = None
+        self._control_bridge: QtCallBridge = QtCallBridge()
+
+        # Endpoint de métricas (opcional, aberto em start())
+        self.metrics_address: Optional[str] = metrics
+        self.metrics_server: Optional["MetricsServer"] = None
+
+        logger.info(
+            f"Interface system tray inicializada ({len(self.devices)} dispositivo(s))"
+        )
+
+    def _create_driver(self, index: int) -> DeepCoolDriver:
+        """
+        Cria o driver de um dispositivo.
+
+        Args:
+            index: Índice do dispositivo em ``self.devices``
+
+        Returns:
+            Driver (não iniciado)
+        """
+        info: DeviceInfo = self.devices[index]
+        return DeepCoolDriver(
+            self.signals[index], info.product_id, self.sensor,
+            device_info=info, sampler=self.sampler,
+            transport=self.transport, write_timeout=self.write_timeout,
+        )
 
     def _load_settings(self) -> None:
-        """Carrega configurações salvas e aplica ao driver."""
+        """Carrega configurações salvas e aplica a cada driver."""
         saved_settings = self.settings_manager.load()
-        self.driver.apply_settings(saved_settings)
+        self.sampler.set_smoothing(saved_settings['temp_smoothing'])
+        for driver, info in zip(self.drivers, self.devices):
+            driver.apply_settings(
+                self.settings_manager.device_settings(saved_settings, info.key)
+            )
         logger.info(f"Configurações carregadas: {saved_settings}")
 
     def _save_settings(self) -> None:
-        """Salva configurações atuais do driver + cor LED."""
-        current_settings = self.driver.get_settings()
+        """Salva configurações atuais dos drivers + cor LED."""
+        # Valores globais vêm do primeiro dispositivo (compatível com v1.4)
+        current_settings = self.drivers[0].get_settings()
+        current_settings['devices'] = {}
+        for driver, info in zip(self.drivers, self.devices):
+            driver_settings = driver.get_settings()
+            current_settings['devices'][info.key] = {
+                key: driver_settings[key] for key in SettingsManager.DEVICE_KEYS
+            }
+        current_settings['temp_smoothing'] = self.sampler.smoothing
         current_settings['led_color'] = self._led_color
         current_settings['openrgb_device_id'] = self._openrgb_device_id
         current_settings['openrgb_zone_id'] = self._openrgb_zone_id
         current_settings['openrgb_led_count'] = self._openrgb_led_count
-        if self.settings_manager.save(current_settings):
+        # update() preserva o openrgb_device gravado pela thread dos LEDs
+        if self.settings_manager.update(current_settings):
             logger.info("Configurações salvas com sucesso")
         else:
             logger.error("Falha ao salvar configurações")
 
-    def _apply_led_color_async(self) -> None:
-        """Aplica a cor LED salva em background (não bloqueia startup)."""
-        def _apply():
-            if is_openrgb_available():
-                success = apply_color_setting(
-                    self._led_color, self._openrgb_device_id
-                )
-                if success:
-                    logger.info(
-                        f"Cor LED aplicada ao iniciar: {self._led_color}"
-                    )
-                else:
-                    logger.warning(
-                        f"Falha ao aplicar cor LED ao iniciar: "
-                        f"{self._led_color}"
-                    )
-
-        thread = threading.Thread(target=_apply, daemon=True)
-        thread.start()
+    def _start_drivers(self) -> None:
+        """Inicia os drivers no motor configurado."""
+        if self.engine_name == ENGINE_ASYNCIO:
+            from .async_engine import AsyncDriverEngine
+            self._engine = AsyncDriverEngine(self.drivers)
+            self._engine.start()
+        else:
+            for driver in self.drivers:
+                driver.start()
+
+    def _stop_drivers(self) -> None:
+        """Para os drivers (e o motor asyncio, se houver)."""
+        if self._engine is not None:
+            self._engine.stop()
+            self._engine = None
+            return
+        for driver in self.drivers:
+            driver.stop()
+        for driver in self.drivers:
+            if driver.is_alive():
+                driver.join(timeout=1)
+
+    def _apply_led(self, color: str) -> Optional[bool]:
+        """
+        Aplica uma cor LED (chamado na thread do worker de LEDs).
+
+        Returns:
+            True/False, ou None se o OpenRGB não está disponível
+        """
+        from .colors import apply_color_setting, is_openrgb_available
+        if not is_openrgb_available():
+            return None
+        return apply_color_setting(
+            color, self._openrgb_device_id,
+            self._openrgb_zone_id, self._openrgb_led_count,
+            cache=self.argb_cache,
+        )
+
+    def _on_led_applied(self, color: str, success: bool) -> None:
+        """Resultado do worker de LEDs (thread da GUI)."""
+        if success:
+            logger.info(f"Cor da borda aplicada: {color}")
+        else:
+            logger.warning(f"Falha ao aplicar cor: {color}")
 
     def start(self) -> None:
-        """Mostra o ícone e inicia o driver."""
+        """Inicia os drivers, monta o menu e mostra o ícone."""
+        # Drivers primeiro: o primeiro quadro HID não espera pelo menu
+        self._start_drivers()
+        self.profiler.mark("drivers")
+        self._build_menu()
+        self.tray.setContextMenu(self.menu)
         self.tray.show()
-        self.driver.start()
+        self.profiler.mark("menu")
+        self.telemetry_log.open()
+        self.control = ControlServer(
+            self._handle_control, dispatch=self._control_bridge.call
+        )
+        self.control.start()
+        if self.metrics_address:
+            from .metrics_server import MetricsServer
+            self.metrics_server = MetricsServer(self.metrics_address, self._render_metrics)
+            self.metrics_server.start()
+        # Aplicar cor salva ao iniciar (sem bloquear startup)
+        from .colors import ArgbDeviceCache
+        from .led_worker import LedWorker
+        self.argb_cache = ArgbDeviceCache(self.settings_manager)
+        self.led_signals.applied.connect(self._on_led_applied)
+        self.led_worker = LedWorker(self._apply_led, self.led_signals)
+        self.led_worker.start()
+        self.led_worker.submit(self._led_color)
         logger.info("System tray iniciado")
 
     def _build_menu(self) -> None:
@@ -228,87 +363,44 @@ class DeepCoolTray:
             }
         """)
 
-        # ── Dispositivo ──
-        device_menu: QMenu = self.menu.addMenu(f"  {self.model}")
-        self._add_disabled(device_menu, f"Vendor: 0x{VENDOR_ID:04X}")
-        self._add_disabled(device_menu, f"Product: 0x{self.product_id:04X}")
-        self._add_disabled(device_menu, f"Sensor: {self.sensor}")
-
-        self.menu.addSeparator()
-
-        # ── Status (atualiza em tempo real) ──
-        self.status_action: QAction = self._add_disabled(
-            self.menu, "  🌡️ --°C │ 📊 --%"
-        )
-        self.connection_action: QAction = self._add_disabled(
-            self.menu, f"  ⏳ {tr('connecting')}"
-        )
+        if len(self.drivers) == 1:
+            # ── Dispositivo ──
+            device_menu: QMenu = self.menu.addMenu(f"  {self.models[0]}")
+            self._add_device_info(device_menu, 0)
 
-        self.menu.addSeparator()
-
-        # ── Display Switch ──
-        display_menu: QMenu = self.menu.addMenu(f"  {tr('display_switch')}")
-        self.display_group: QActionGroup = QActionGroup(self.menu)
-        self.display_group.setExclusive(True)
+            self.menu.addSeparator()
 
-        for mode, key in [("temp", "temperature"), ("util", "utilization"),
-                          ("auto", "automatic")]:
-            action: QAction = QAction(tr(key), self.menu, checkable=True)
-            action.setData(mode)
-            action.setChecked(mode == self.driver.display_mode)
-            action.triggered.connect(
-                lambda _, m=mode: self._set_display_mode(m)
+            # ── Status (atualiza em tempo real) ──
+            self.status_action: QAction = self._add_disabled(
+                self.menu, self._status_text()
             )
-            self.display_group.addAction(action)
-            display_menu.addAction(action)
+            self._build_history_menu()
+            self.connection_actions: List[QAction] = [
+                self._add_disabled(self.menu, self._connection_text(0))
+            ]
 
-        # ── Temperature Display ──
-        temp_menu: QMenu = self.menu.addMenu(f"  {tr('temp_display')}")
-        self.temp_group: QActionGroup = QActionGroup(self.menu)
-        self.temp_group.setExclusive(True)
+            self.menu.addSeparator()
 
-        for unit, label in [("C", "Celsius (°C)"), ("F", "Fahrenheit (°F)")]:
-            action = QAction(label, self.menu, checkable=True)
-            action.setChecked(unit == self.driver.temp_unit)
-            action.triggered.connect(
-                lambda _, u=unit: self._set_temp_unit(u)
+            self._build_device_controls(self.menu, 0)
+        else:
+            # ── Status (atualiza em tempo real) ──
+            self.status_action = self._add_disabled(
+                self.menu, self._status_text()
             )
-            self.temp_group.addAction(action)
-            temp_menu.addAction(action)
-
-        # ── Alarm Control ──
-        alarm_menu: QMenu = self.menu.addMenu(f"  {tr('alarm_control')}")
-        self.alarm_group: QActionGroup = QActionGroup(self.menu)
-        self.alarm_group.setExclusive(True)
-
-        alarm_off: QAction = QAction(
-            tr("alarm_off"), self.menu, checkable=True
-        )
-        alarm_off.setChecked(not self.driver.alarm_enabled)
-        alarm_off.triggered.connect(lambda: self._set_alarm(False, 0))
-        self.alarm_group.addAction(alarm_off)
-        alarm_menu.addAction(alarm_off)
+            self._build_history_menu()
 
-        alarm_menu.addSeparator()
+            self.menu.addSeparator()
 
-        for temp_val in ALARM_TEMPS:
-            temp_display, unit = format_temperature(
-                float(temp_val), self.driver.temp_unit
-            )
-            label: str = f"{temp_display}{unit}"
-            if self.driver.temp_unit == 'F':
-                label += f" ({temp_val}°C)"
-
-            action = QAction(label, self.menu, checkable=True)
-            action.setChecked(
-                self.driver.alarm_enabled
-                and self.driver.alarm_temp == temp_val
-            )
-            action.triggered.connect(
-                lambda _, t=temp_val: self._set_alarm(True, t)
-            )
-            self.alarm_group.addAction(action)
-            alarm_menu.addAction(action)
+            # ── Um submenu por dispositivo ──
+            self.connection_actions = []
+            for index, model in enumerate(self.models):
+                device_menu = self.menu.addMenu(f"  {model}")
+                self._add_device_info(device_menu, index)
+                self.connection_actions.append(
+                    self._add_disabled(device_menu, self._connection_text(index))
+                )
+                device_menu.addSeparator()
+                self._build_device_controls(device_menu, index)
 
         self.menu.addSeparator()
 
@@ -321,6 +413,7 @@ class DeepCoolTray:
         self.autostart_action: QAction = QAction(
             f"  {tr('launch_startup')}", self.menu, checkable=True
         )
+        from . import autostart
         self.autostart_action.setChecked(autostart.is_enabled())
         self.autostart_action.triggered.connect(self._toggle_autostart)
         self.menu.addAction(self.autostart_action)
@@ -346,6 +439,97 @@ class DeepCoolTray:
         quit_action.triggered.connect(self._quit)
         self.menu.addAction(quit_action)
 
+    def _add_device_info(self, menu: QMenu, index: int) -> None:
+        """
+        Adiciona as linhas de informação de um dispositivo.
+
+        Args:
+            menu: Menu onde adicionar
+            index: Índice do dispositivo
+        """
+        info: DeviceInfo = self.devices[index]
+        self._add_disabled(menu, f"Vendor: 0x{VENDOR_ID:04X}")
+        self._add_disabled(menu, f"Product: 0x{info.product_id:04X}")
+        if info.hidraw_path:
+            self._add_disabled(menu, f"Device: {info.hidraw_path}")
+        if info.serial:
+            self._add_disabled(menu, f"Serial: {info.serial}")
+        self._add_disabled(menu, f"Sensor: {self.sensor}")
+
+    def _build_device_controls(self, menu: QMenu, index: int) -> None:
+        """
+        Constrói os submenus de exibição, unidade e alarme de um dispositivo.
+
+        Args:
+            menu: Menu onde adicionar os submenus
+            index: Índice do dispositivo
+        """
+        driver: DeepCoolDriver = self.drivers[index]
+
+        # ── Display Switch ──
+        display_menu: QMenu = menu.addMenu(f"  {tr('display_switch')}")
+        display_group: QActionGroup = QActionGroup(menu)
+        display_group.setExclusive(True)
+
+        for mode, key in [("temp", "temperature"), ("util", "utilization"),
+                          ("auto", "automatic")]:
+            action: QAction = QAction(tr(key), menu, checkable=True)
+            action.setData(mode)
+            action.setChecked(mode == driver.display_mode)
+            action.triggered.connect(
+                lambda _, m=mode: self._set_display_mode(index, m)
+            )
+            display_group.addAction(action)
+            display_menu.addAction(action)
+
+        # ── Temperature Display ──
+        temp_menu: QMenu = menu.addMenu(f"  {tr('temp_display')}")
+        temp_group: QActionGroup = QActionGroup(menu)
+        temp_group.setExclusive(True)
+
+        for unit, label in [("C", "Celsius (°C)"), ("F", "Fahrenheit (°F)")]:
+            action = QAction(label, menu, checkable=True)
+            action.setChecked(unit == driver.temp_unit)
+            action.triggered.connect(
+                lambda _, u=unit: self._set_temp_unit(index, u)
+            )
+            temp_group.addAction(action)
+            temp_menu.addAction(action)
+
+        # ── Alarm Control ──
+        alarm_menu: QMenu = menu.addMenu(f"  {tr('alarm_control')}")
+        alarm_group: QActionGroup = QActionGroup(menu)
+        alarm_group.setExclusive(True)
+
+        alarm_off: QAction = QAction(
+            tr("alarm_off"), menu, checkable=True
+        )
+        alarm_off.setChecked(not driver.alarm_enabled)
+        alarm_off.triggered.connect(lambda: self._set_alarm(index, False, 0))
+        alarm_group.addAction(alarm_off)
+        alarm_menu.addAction(alarm_off)
+
+        alarm_menu.addSeparator()
+
+        for temp_val in ALARM_TEMPS:
+            temp_display, unit = format_temperature(
+                float(temp_val), driver.temp_unit
+            )
+            label: str = f"{temp_display}{unit}"
+            if driver.temp_unit == 'F':
+                label += f" ({temp_val}°C)"
+
+            action = QAction(label, menu, checkable=True)
+            action.setChecked(
+                driver.alarm_enabled
+                and driver.alarm_temp == temp_val
+            )
+            action.triggered.connect(
+                lambda _, t=temp_val: self._set_alarm(index, True, t)
+            )
+            alarm_group.addAction(action)
+            alarm_menu.addAction(action)
+
     # ── Submenu de cores da borda LED ──
 
     def _build_color_menu(self) -> None:
@@ -353,6 +537,9 @@ class DeepCoolTray:
         Constrói o submenu 'Cor da borda' com cores predefinidas,
         arco-íris, desligado e personalizar.
         """
+        from .colors import (
+            is_openrgb_available, PRESET_COLORS, COLOR_RAINBOW, COLOR_OFF,
+        )
         openrgb_ok = is_openrgb_available()
         is_rainbow = self._led_color == COLOR_RAINBOW
         is_off = self._led_color == COLOR_OFF
@@ -425,24 +612,14 @@ class DeepCoolTray:
     def _on_color_selected(self, color_value: str) -> None:
         """Callback quando uma cor é selecionada no submenu."""
         self._led_color = color_value
-
-        def _apply():
-            success = apply_color_setting(
-                color_value, self._openrgb_device_id
-            )
-            if success:
-                logger.info(f"Cor da borda alterada: {color_value}")
-            else:
-                logger.warning(f"Falha ao aplicar cor: {color_value}")
-
-        thread = threading.Thread(target=_apply, daemon=True)
-        thread.start()
-
+        if self.led_worker is not None:
+            self.led_worker.submit(color_value)
         self._save_settings()
         self._build_menu()
 
     def _on_custom_color(self) -> None:
         """Abre o QColorDialog para escolher uma cor personalizada."""
+        from .colors import COLOR_RAINBOW, COLOR_OFF, COLOR_DEFAULT
         if self._led_color in (COLOR_RAINBOW, COLOR_OFF):
             initial = QColor(COLOR_DEFAULT)
         else:
@@ -458,6 +635,47 @@ class DeepCoolTray:
 
     # ── Helpers ──
 
+    def _build_history_menu(self) -> None:
+        """Submenu com as estatísticas das janelas de 1, 5 e 15 minutos."""
+        history_menu: QMenu = self.menu.addMenu(f"  📈 {tr('history')}")
+        self.history_actions: List[QAction] = [
+            self._add_disabled(history_menu, text)
+            for text in self._history_texts(self._history_windows())
+        ]
+
+    def _history_windows(self) -> List[Optional[WindowStats]]:
+        """Estatísticas de cada janela de ``HISTORY_WINDOWS`` (None = sem dados)."""
+        return [self.history.window(seconds) for seconds in HISTORY_WINDOWS]
+
+    def _history_texts(self, windows: List[Optional[WindowStats]]) -> List[str]:
+        """Uma linha por janela (mín–máx e p95 da temperatura, p95 da CPU)."""
+        unit: str = self.drivers[0].temp_unit
+        texts: List[str] = []
+        for seconds, stats in zip(HISTORY_WINDOWS, windows):
+            label: str = f"{seconds // 60} min"
+            if stats is None:
+                texts.append(f"  {label}: --")
+                continue
+            low, symbol = format_temperature(stats.temp_min, unit)
+            high, _ = format_temperature(stats.temp_max, unit)
+            p95, _ = format_temperature(stats.temp_p95, unit)
+            texts.append(
+                f"  {label}: 🌡️ {low}–{high}{symbol} "
+                f"(p95 {p95}) │ 📊 p95 {stats.cpu_p95}%"
+            )
+        return texts
+
+    def _peak_text(self, windows: List[Optional[WindowStats]]) -> str:
+        """Linha do tooltip com o pico de temperatura de cada janela."""
+        unit: str = self.drivers[0].temp_unit
+        labels: str = "/".join(str(seconds // 60) for seconds in HISTORY_WINDOWS)
+        symbol: str = format_temperature(0.0, unit)[1]
+        peaks: List[str] = [
+            "--" if stats is None else str(format_temperature(stats.temp_max, unit)[0])
+            for stats in windows
+        ]
+        return f"{tr('peak')} {labels} min: {'/'.join(peaks)}{symbol}"
+
     @staticmethod
     def _add_disabled(menu: QMenu, text: str) -> QAction:
         """
@@ -477,28 +695,30 @@ class DeepCoolTray:
 
     # ── Ações do menu ──
 
-    def _set_display_mode(self, mode: str) -> None:
-        """Define o modo de exibição."""
-        self.driver.display_mode = mode
+    def _set_display_mode(self, index: int, mode: str) -> None:
+        """Define o modo de exibição de um dispositivo."""
+        self.drivers[index].update_settings(display_mode=mode)
         self._save_settings()
-        logger.info(f"Modo de exibição alterado para: {mode}")
+        logger.info(f"Modo de exibição alterado para: {mode} (dispositivo {index})")
 
-    def _set_temp_unit(self, unit: str) -> None:
-        """Define a unidade de temperatura."""
-        self.driver.temp_unit = unit
+    def _set_temp_unit(self, index: int, unit: str) -> None:
+        """Define a unidade de temperatura de um dispositivo."""
+        self.drivers[index].update_settings(temp_unit=unit)
         self._save_settings()
         self._build_menu()  # Rebuild para atualizar labels do alarme
-        logger.info(f"Unidade de temperatura alterada para: {unit}")
+        logger.info(f"Unidade de temperatura alterada para: {unit} (dispositivo {index})")
 
-    def _set_alarm(self, enabled: bool, temp: int) -> None:
-        """Configura o alarme de temperatura."""
-        self.driver.alarm_enabled = enabled
-        self.driver.alarm_temp = temp
+    def _set_alarm(self, index: int, enabled: bool, temp: int) -> None:
+        """Configura o alarme de temperatura de um dispositivo."""
+        self.drivers[index].update_settings(alarm_enabled=enabled, alarm_temp=temp)
         self._save_settings()
-        logger.info(f"Alarme configurado: enabled={enabled}, temp={temp}°C")
+        logger.info(
+            f"Alarme configurado: enabled={enabled}, temp={temp}°C (dispositivo {index})"
+        )
 
     def _toggle_autostart(self) -> None:
         """Alterna o autostart do aplicativo."""
+        from . import autostart
         if self.autostart_action.isChecked():
             autostart.enable()
             logger.info("Autostart habilitado")
@@ -508,6 +728,7 @@ class DeepCoolTray:
 
     def _open_website(self) -> None:
         """Abre o repositório GitHub no navegador."""
+        import subprocess
         try:
             subprocess.Popen(['xdg-open', GITHUB_URL])
             logger.info(f"Abrindo website: {GITHUB_URL}")
@@ -515,50 +736,151 @@ class DeepCoolTray:
             logger.error(f"Erro ao abrir website: {e}")
 
     def _restart_driver(self) -> None:
-        """Reinicia o driver mantendo as configurações."""
+        """Reinicia os drivers mantendo as configurações."""
         logger.info("Reiniciando driver...")
-        settings = self.driver.get_settings()
-        self.driver.stop()
-        time.sleep(1)
-        self.driver = DeepCoolDriver(
-            self.signals, self.product_id, self.sensor
-        )
-        self.driver.apply_settings(settings)
-        self.driver.start()
+        settings = [driver.get_settings() for driver in self.drivers]
+        self._stop_drivers()
+        self.drivers = [
+            self._create_driver(index) for index in range(len(self.devices))
+        ]
+        for driver, driver_settings in zip(self.drivers, settings):
+            driver.apply_settings(driver_settings)
+        self._start_drivers()
         logger.info("Driver reiniciado")
 
     def _quit(self) -> None:
         """Encerra o aplicativo."""
         logger.info("Encerrando aplicativo...")
         self._save_settings()
-        self.driver.stop()
+        if self.control is not None:
+            self.control.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if self.led_worker is not None:
+            self.led_worker.stop()
+        self._stop_drivers()
+        self.telemetry_log.close()
         self.tray.hide()
         self.app.quit()
 
     # ── Callbacks dos sinais ──
 
-    def _on_status_updated(self, mode: str, temp_c: float, cpu: int) -> None:
+    def _status_text(self) -> str:
+        """Texto da linha de status (temperatura na unidade do 1º dispositivo)."""
+        if self._last_snapshot is None:
+            return "  🌡️ --°C │ 📊 --%"
+        temp_display, unit = format_temperature(
+            self.current_temp, self.drivers[0].temp_unit
+        )
+        return f"  🌡️ {temp_display}{unit} │ 📊 {self.current_cpu}%"
+
+    def _connection_text(self, index: int) -> str:
+        """Texto da linha de conexão de um dispositivo."""
+        connected: Optional[bool] = self.connected[index]
+        if connected is None:
+            return f"  ⏳ {tr('connecting')}"
+        if connected:
+            return f"  ✅ {tr('connected')}"
+        return f"  ❌ {tr('disconnected')}"
+
+    def _on_status_updated(self, index: int, mode: str,
+                           snapshot: TelemetrySnapshot) -> None:
         """Callback quando o status é atualizado."""
+        # Drivers compartilham o snapshot: atualizar a GUI uma vez por
+        # leitura, ignorando também um snapshot mais antigo que chega atrasado
+        last: Optional[TelemetrySnapshot] = self._last_snapshot
+        if last is not None and snapshot.monotonic <= last.monotonic:
+            return
+        self._last_snapshot = snapshot
+        temp_c: float = snapshot.temperature
+        cpu: int = snapshot.cpu_usage
         self.current_temp = temp_c
         self.current_cpu = cpu
+        self.history.append(snapshot)
+        driver = self.drivers[0]
+        self.telemetry_log.append(
+            snapshot.timestamp, temp_c, cpu, driver.get_settings(), driver.alarm_active
+        )
 
-        temp_display, unit = format_temperature(temp_c, self.driver.temp_unit)
+        temp_display, unit = format_temperature(temp_c, self.drivers[0].temp_unit)
 
-        self.status_action.setText(
-            f"  🌡️ {temp_display}{unit} │ 📊 {cpu}%"
-        )
-        self.tray.setToolTip(
-            f"DeepCool {self.model}\n{temp_display}{unit} │ CPU: {cpu}%"
+        self._set_text(self.status_action, self._status_text())
+        windows: List[Optional[WindowStats]] = self._history_windows()
+        for action, text in zip(self.history_actions, self._history_texts(windows)):
+            self._set_text(action, text)
+        tooltip: str = (
+            f"DeepCool {', '.join(self.models)}\n{temp_display}{unit} │ CPU: {cpu}%\n"
+            f"{self._peak_text(windows)}"
         )
-        self.tray.setIcon(create_status_icon(temp_c, self.connected))
+        if tooltip != self._tooltip:
+            self._tooltip = tooltip
+            self.tray.setToolTip(tooltip)
+        icon_key: Tuple[int, bool] = (round(temp_c), any(self.connected))
+        if icon_key != self._icon_key:
+            self._icon_key = icon_key
+            self.tray.setIcon(create_status_icon(temp_c, icon_key[1]))
+        self._publish_status()
 
-    def _on_connection_changed(self, connected: bool) -> None:
-        """Callback quando o status de conexão muda."""
-        self.connected = connected
+    @staticmethod
+    def _set_text(action: QAction, text: str) -> None:
+        """Troca o texto de uma ação só quando muda (evita repinturas)."""
+        if action.text() != text:
+            action.setText(text)
+
+    def _on_connection_changed(self, index: int, connected: bool) -> None:
+        """Callback quando o status de conexão de um dispositivo muda."""
+        self.connected[index] = connected
+        self.connection_actions[index].setText(self._connection_text(index))
         if connected:
-            self.connection_action.setText(f"  ✅ {tr('connected')}")
-            logger.info("Dispositivo conectado")
+            logger.info(f"Dispositivo conectado: {self.models[index]}")
         else:
-            self.connection_action.setText(f"  ❌ {tr('disconnected')}")
-            self.tray.setIcon(create_deepcool_icon(False))
-            logger.warning("Dispositivo desconectado")
+            if not any(self.connected):
+                self._icon_key = None
+                self.tray.setIcon(create_deepcool_icon(False))
+            logger.warning(f"Dispositivo desconectado: {self.models[index]}")
+        self._publish_status()
+
+    # ── Socket de controle (executado na thread da GUI) ──
+
+    def _control_status(self) -> Dict[str, Any]:
+        """Resultado do comando status."""
+        return status_payload(
+            self.devices, self.models, self.connected, self.drivers,
+            self._last_snapshot, self._led_color, self.history,
+        )
+
+    def _render_metrics(self) -> str:
+        """Texto OpenMetrics (chamado na thread do endpoint)."""
+        return render_metrics(
+            self.devices, self.models, self.connected, self.drivers, self.sampler
+        )
+
+    def _publish_status(self) -> None:
+        """Envia o status atual aos assinantes do socket de controle."""
+        if self.control is not None and self.control.has_subscribers:
+            self.control.publish("status", self._control_status())
+
+    def _handle_control(self, command: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa um comando do socket de controle.
+
+        Args:
+            command: Nome do comando
+            request: Requisição recebida
+
+        Returns:
+            Status após o comando
+
+        Raises:
+            ControlError: Se a requisição for inválida
+        """
+        if command == "set-color":
+            self._on_color_selected(parse_color(request))
+        elif command != "status":
+            changes: Dict[str, Any] = device_changes(command, request)
+            for index in select_devices(request, [d.key for d in self.devices]):
+                self.drivers[index].update_settings(**changes)
+            self._save_settings()
+            self._build_menu()  # Manter as marcações do menu em sincronia
+            logger.info(f"Controle: {command} {changes}")
+        return self._control_status()
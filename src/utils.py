@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 """Funções utilitárias comuns."""
 
-from typing import Union
+import os
+import stat
+import errno
+from contextlib import contextmanager
+from typing import Iterator, Union
 
 
 def celsius_to_fahrenheit(temp_celsius: float) -> int:
@@ -93,3 +97,38 @@ def clamp(value: Union[int, float], min_value: Union[int, float],
         50
     """
     return max(min_value, min(value, max_value))
+
+
+def remove_stale_socket(path: str) -> None:
+    """
+    Remove um socket Unix deixado por uma execução anterior.
+
+    Args:
+        path: Caminho do socket
+
+    Raises:
+        OSError: Se o caminho existe e não é um socket (nada é apagado)
+    """
+    try:
+        mode: int = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(errno.EEXIST, f"{path} já existe e não é um socket")
+    os.unlink(path)
+
+
+@contextmanager
+def private_umask() -> Iterator[None]:
+    """
+    Usa umask 0177 no bloco: sockets e arquivos criados nascem com 0600.
+
+    Evita a janela entre ``bind()`` e ``chmod()`` em que o socket fica
+    acessível com a umask do usuário. A umask é do processo inteiro, então
+    o bloco deve ser curto.
+    """
+    previous: int = os.umask(0o177)
+    try:
+        yield
+    finally:
+        os.umask(previous)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Testes de reconexão do driver contra o dispositivo virtual."""
+
+import shutil
+import time
+import unittest
+
+from benchmarks.fakesys import make_hwmon_tree, make_proc_stat, make_root
+from src import hardware
+from src.driver import DeepCoolDriver, DriverSignals
+from src.emulator import VirtualDeepCoolDevice, VirtualTransport
+
+SENSOR: str = "k10temp"
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    """Espera ``condition()`` ficar verdadeira (ou o tempo acabar)."""
+    deadline: float = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class VirtualReconnectTest(unittest.TestCase):
+    """Plug/unplug do dispositivo virtual com o driver em sua thread."""
+
+    def setUp(self) -> None:
+        self.root: str = make_root()
+        hardware._readers[SENSOR] = hardware.SensorReader(
+            SENSOR, make_hwmon_tree(self.root, SENSOR)
+        )
+        hardware._cpu_sampler = hardware.CpuUsageSampler(make_proc_stat(self.root))
+        self.device = VirtualDeepCoolDevice(product_id=0x0004)
+        self.driver = DeepCoolDriver(
+            DriverSignals(), self.device.product_id, SENSOR,
+            device_info=self.device.info, transport=VirtualTransport(self.device),
+        )
+        self.driver._ensure_hotplug = lambda: None  # Sem monitor de hotplug real
+        self.driver.start()
+
+    def tearDown(self) -> None:
+        self.driver.stop()
+        self.driver.join(2)
+        hardware._readers.pop(SENSOR, None)
+        hardware._cpu_sampler = None
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_reconnects_on_plug(self) -> None:
+        self.assertTrue(wait_until(lambda: self.driver.device is not None))
+        self.assertTrue(wait_until(lambda: self.device.stats.reports > 0))
+
+        self.device.unplug()
+        # Desconectado e já esperando o dispositivo voltar
+        self.assertTrue(wait_until(lambda: self.driver.device is None and self.driver._absent))
+        time.sleep(0.05)
+
+        frames: int = self.device.stats.reports
+        self.device.plug()
+        # Acordado pelo ouvinte do dispositivo, bem antes do polling
+        self.assertTrue(wait_until(lambda: self.driver.device is not None, timeout=1.0))
+        self.assertTrue(wait_until(lambda: self.device.stats.reports > frames))
+        self.assertEqual(self.device.stats.opens, 2)
+
+    def test_stop_removes_listener(self) -> None:
+        self.assertTrue(wait_until(lambda: self.driver.device is not None))
+        self.driver.stop()
+        self.driver.join(2)
+        self.assertEqual(self.device._listeners, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
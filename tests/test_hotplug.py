@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Testes do monitor de hotplug (backend inotify em um /dev falso)."""
+
+import os
+import shutil
+import threading
+import unittest
+
+from benchmarks.fakesys import make_dev_dir, make_root
+from src.hotplug import HotplugMonitor
+
+
+class InotifyHotplugTest(unittest.TestCase):
+    """Plug/unplug simulados criando e removendo nós ``hidrawN``."""
+
+    def setUp(self) -> None:
+        self.root: str = make_root()
+        self.dev_dir: str = make_dev_dir(self.root, ("hidraw0",))
+        self.monitor: HotplugMonitor = HotplugMonitor(self.dev_dir)
+
+    def tearDown(self) -> None:
+        self.monitor.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_backend(self) -> None:
+        self.assertEqual(self.monitor.backend, "inotify")
+
+    def test_wait_returns_on_plug(self) -> None:
+        timer = threading.Timer(
+            0.05, lambda: open(os.path.join(self.dev_dir, "hidraw3"), "w").close()
+        )
+        timer.start()
+        try:
+            self.assertTrue(self.monitor.wait(timeout=5))
+        finally:
+            timer.join()
+
+    def test_drain_detects_unplug(self) -> None:
+        os.unlink(os.path.join(self.dev_dir, "hidraw0"))
+        self.assertTrue(self.monitor.drain())
+        self.assertFalse(self.monitor.drain())
+
+    def test_other_nodes_are_ignored(self) -> None:
+        open(os.path.join(self.dev_dir, "ttyUSB0"), "w").close()
+        self.assertFalse(self.monitor.drain())
+        self.assertFalse(self.monitor.wait(timeout=0.05))
+
+    def test_interrupt_wakes_wait(self) -> None:
+        self.monitor.interrupt()
+        self.assertFalse(self.monitor.wait(timeout=5))
+
+    def test_interrupt_after_close_does_nothing(self) -> None:
+        self.monitor.close()
+        self.assertEqual((self.monitor._pipe_r, self.monitor._pipe_w), (-1, -1))
+        # Um descritor novo pode reutilizar o número do pipe fechado
+        reused_r, reused_w = os.pipe()
+        try:
+            self.monitor.interrupt()
+            os.set_blocking(reused_r, False)
+            with self.assertRaises(BlockingIOError):
+                os.read(reused_r, 1)
+        finally:
+            os.close(reused_r)
+            os.close(reused_w)
+        self.monitor.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,7 @@ rm -f "$AUTOSTART_DIR/$APP_NAME.desktop"
 echo -e "  ${C}▶${N} Removendo regras udev..."
 sudo rm -f /etc/udev/rules.d/99-deepcool.rules
 sudo udevadm control --reload-rules 2>/dev/null || true
+sudo groupdel deepcool 2>/dev/null || true
 
 echo -e "  ${C}▶${N} Removendo arquivos instalados..."
 rm -rf "$INSTALL_DIR"